@@ -0,0 +1,469 @@
+"""
+Container module for the gaslines ArrayGrid class, an alternative to the Grid class
+that holds all data of a Gas Lines puzzle in flat arrays of small integers rather than
+in Point objects, along with the ArrayPoint class of views into such a grid.
+"""
+
+
+import array
+
+from gaslines.grid import Grid, get_adjacency
+from gaslines.point import DIRECTION_INDEXES, DIRECTIONS, Point
+
+
+# Array value representing the absence of a direction or of remaining segments
+NONE = -1
+
+
+# The arrays of an array grid are kept in separate slots so that each has the most
+# compact type for its values, and its views share the full interface of Point
+class ArrayGrid(Grid):  # pylint: disable=R0902
+    """
+    Represents the grid of lattice points on which a Gas Lines puzzle takes place,
+    storing the type, child direction, incoming direction and remaining segments of
+    each point in flat, row-major arrays, for a total of six bytes per point
+
+    Neighbors are computed arithmetically from row-major indexes, so no adjacency
+    table is stored. The table is only built, and then shared by all grids of the
+    same shape, if a strategy explicitly asks for it by way of `adjacency`.
+
+    No Point objects are stored. Instead, lightweight ArrayPoint views are created
+    whenever a point is accessed. These views support the same operations as Point
+    objects, so this grid may be used anywhere a Grid may, including with the `solve`
+    function and every strategy of the logic module. Note that two views of the same
+    point compare equal but are not necessarily identical.
+    """
+
+    __slots__ = (
+        "_types",
+        "_child_directions",
+        "_incoming_directions",
+        "_remaining_segments",
+    )
+
+    def __getitem__(self, row_index):
+        """
+        Returns (views of) the row at the specified index of the grid
+        """
+        start = range(self._height)[row_index] * self._length
+        return tuple(
+            ArrayPoint(self, index) for index in range(start, start + self._length)
+        )
+
+    def _create_grid(self, grid):
+        """
+        Helper method for `__init__` that creates and stores the arrays representing
+        the grid based on the external description provided.
+
+        This helper method must be called prior to any of the others.
+        """
+        types = [type_ for row in grid for type_ in row]
+        self._types = array.array("h", types)
+        self._child_directions = array.array("b", (NONE,)) * len(types)
+        self._incoming_directions = array.array("b", (NONE,)) * len(types)
+        self._remaining_segments = array.array(
+            "h",
+            (type_ if type_ > 0 else NONE for type_ in types),
+        )
+        # Temporarily hold on to the description so that its dimensions can be read
+        self._grid = grid
+
+    def _link_points(self):
+        """
+        Helper method for `__init__` that discards the description of the grid, as
+        neither the description nor any Point objects are needed from here on.
+        """
+        self._grid = self._points = self._adjacency = None
+
+    # Like `__init__`, this constructor sets every attribute of the grid, each of
+    # which it needs in order to reproduce the state of another grid
+    @classmethod
+    def _from_arrays(  # pylint: disable=R0913,W0201
+        cls,
+        height,
+        length,
+        arrays,
+        heads,
+        zobrist_hash,
+    ):
+        """
+        Creates a grid directly from the arrays representing it, as used by `copy`.
+
+        Args:
+            height (int): The number of rows of the grid.
+            length (int): The number of columns of the grid.
+            arrays (tuple): The types, child directions, incoming directions and
+                remaining segments of the points of the grid, in that order.
+            heads (list): The row-major indexes of all heads, in ascending order.
+            zobrist_hash (int): The Zobrist hash of the grid, or None if untracked.
+        """
+        grid = cls.__new__(cls)
+        grid._grid = grid._points = grid._adjacency = None
+        grid._height, grid._length = height, length
+        (
+            grid._types,
+            grid._child_directions,
+            grid._incoming_directions,
+            grid._remaining_segments,
+        ) = arrays
+        grid._heads = heads
+        grid._batch_depth = 0
+        grid._has_pending_notification = False
+        grid._subscribers = None
+        grid._sequence = 0
+        grid._zobrist_hash = zobrist_hash
+        return grid
+
+    @property
+    def adjacency(self):
+        """
+        Returns the adjacency table of the grid, as described by `get_adjacency`,
+        which is built on demand rather than stored.
+        """
+        return get_adjacency(self._height, self._length)
+
+    @property
+    def points(self):
+        """Returns (views of) all points of the grid, in row-major order."""
+        return tuple(ArrayPoint(self, index) for index in range(len(self._types)))
+
+    def get_point(self, index):
+        """Returns (a view of) the point at the given row-major index of the grid."""
+        return ArrayPoint(self, index)
+
+    def copy(self):
+        """
+        Returns a copy of the grid in its current state, which may be mutated
+        independently of this grid.
+
+        Observers and subscribers of this grid are not copied.
+        """
+        return ArrayGrid._from_arrays(
+            self._height,
+            self._length,
+            (
+                self._types,
+                self._child_directions[:],
+                self._incoming_directions[:],
+                self._remaining_segments[:],
+            ),
+            self._heads[:],
+            self._zobrist_hash,
+        )
+
+    def get_type(self, index):
+        """Returns the type of the point at the given index."""
+        return self._types[index]
+
+    def get_adjacent_index(self, index, direction_index):
+        """
+        Returns the row-major index of the point adjacent to the point at the given
+        index in the direction at the given index, in the order specified by the
+        Direction enum, or None if no such point exists.
+        """
+        row_index, column_index = divmod(index, self._length)
+        row_offset, column_offset = DIRECTIONS[direction_index].value
+        row_index += row_offset
+        column_index += column_offset
+        if 0 <= row_index < self._height and 0 <= column_index < self._length:
+            return row_index * self._length + column_index
+        return None
+
+    def get_direction_index(self, index, neighbor_index):
+        """
+        Returns the index of the direction, in the order specified by the Direction
+        enum, in which the point at the neighbor index neighbors the point at the
+        given index, or None if it does not
+        """
+        offset = neighbor_index - index
+        # Vertical neighbors are checked first, as they coincide with horizontal
+        # offsets in grids with a single column
+        if offset in (-self._length, self._length):
+            return 0 if offset < 0 else 2
+        is_same_row = index // self._length == neighbor_index // self._length
+        if offset in (-1, 1) and is_same_row:
+            return 3 if offset < 0 else 1
+        return None
+
+    def get_child_index(self, index):
+        """
+        Returns the index of the child of the point at the given index, or None if it
+        has no child.
+        """
+        direction_index = self._child_directions[index]
+        if direction_index == NONE:
+            return None
+        return self.get_adjacent_index(index, direction_index)
+
+    def get_incoming_direction_index(self, index):
+        """
+        Returns the index of the direction from the parent of the point at the given
+        index to that point, or None if it has no parent (which is always the case for
+        sources and sinks).
+        """
+        direction_index = self._incoming_directions[index]
+        return None if direction_index == NONE else direction_index
+
+    def get_parent_index(self, index):
+        """
+        Returns the index of the parent of the point at the given index, or None if it
+        has no parent (which is always the case for sources and sinks).
+        """
+        direction_index = self._incoming_directions[index]
+        if direction_index == NONE:
+            return None
+        # The parent lies in the direction opposite to the incoming direction
+        return self.get_adjacent_index(index, (direction_index + 2) % len(DIRECTIONS))
+
+    def get_remaining_segments(self, index):
+        """
+        Returns the remaining segments of the point at the given index, or None if it
+        is not on a path from a source.
+        """
+        remaining_segments = self._remaining_segments[index]
+        return None if remaining_segments == NONE else remaining_segments
+
+    def set_child(self, index, child_index):
+        """
+        Sets the child of the point at the given index to the (adjacent) point at the
+        child index, or resets it if the child index is None, and then updates the
+        grid accordingly.
+        """
+        previous_index = self.get_child_index(index)
+        if child_index is None:
+            self._child_directions[index] = NONE
+        else:
+            self._child_directions[index] = self.get_direction_index(index, child_index)
+        # Detach the previous child, unless it has since been given another parent
+        if (
+            previous_index is not None
+            and self._types[previous_index] == Point.PIPE
+            and self.get_parent_index(previous_index) == index
+        ):
+            self._incoming_directions[previous_index] = NONE
+            self._refresh_path(previous_index)
+        if child_index is not None and self._types[child_index] == Point.PIPE:
+            self._incoming_directions[child_index] = self.get_direction_index(
+                index,
+                child_index,
+            )
+            self._refresh_path(child_index)
+        self.update(
+            ArrayPoint(self, index),
+            None if previous_index is None else ArrayPoint(self, previous_index),
+        )
+
+    def _refresh_path(self, index):
+        """
+        Recomputes the remaining segments of the pipe at the given index from those of
+        its parent, and then likewise for its descendants, for as long as the
+        recomputed values differ from the stored ones.
+        """
+        while index is not None and self._types[index] == Point.PIPE:
+            parent_index = self.get_parent_index(index)
+            remaining_segments = (
+                NONE if parent_index is None else self._remaining_segments[parent_index]
+            )
+            if remaining_segments != NONE:
+                parent_direction = self._incoming_directions[parent_index]
+                remaining_segments -= parent_direction not in (
+                    NONE,
+                    self._incoming_directions[index],
+                )
+            if remaining_segments == self._remaining_segments[index]:
+                break
+            self._remaining_segments[index] = remaining_segments
+            index = self.get_child_index(index)
+
+
+class ArrayPoint:  # pylint: disable=R0904
+    """
+    Represents a view of a single lattice point in an ArrayGrid
+
+    Supports the same operations as the Point class, reading from and writing to the
+    arrays of the underlying grid
+    """
+
+    __slots__ = ("_grid", "_index")
+
+    def __init__(self, grid, index):
+        self._grid = grid
+        self._index = index
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ArrayPoint)
+            and self._grid is other.grid
+            and self._index == other.index
+        )
+
+    def __hash__(self):
+        return hash((id(self._grid), self._index))
+
+    def _view(self, index):
+        """Returns a view of the point at the given index, or None if index is None."""
+        return None if index is None else ArrayPoint(self._grid, index)
+
+    @property
+    def grid(self):
+        """Returns the ArrayGrid object of which this point is a component."""
+        return self._grid
+
+    @property
+    def location(self):
+        """
+        Returns an ordered pair comprising of the row- and column-index, respectively,
+        that determines this point's location in the grid.
+        """
+        return divmod(self._index, self._grid.length)
+
+    @property
+    def row_index(self):
+        """Returns the row index of the point in the grid."""
+        return self.location[0]
+
+    @property
+    def column_index(self):
+        """Returns the column index of the point in the grid."""
+        return self.location[1]
+
+    @property
+    def index(self):
+        """Returns the row-major index of the point in the grid."""
+        return self._index
+
+    @property
+    def type(self):
+        """
+        Returns the type of the point, i.e., its number of segments if it is a source,
+        otherwise either Point.SINK or Point.PIPE.
+        """
+        return self._grid.get_type(self._index)
+
+    def is_source(self):
+        """Returns whether the point is a 'source' point."""
+        return self._grid.get_type(self._index) > 0
+
+    def is_sink(self):
+        """Returns whether the point is a 'sink' point."""
+        return self._grid.get_type(self._index) == Point.SINK
+
+    @property
+    def child(self):
+        """
+        Returns the child of this point, or None of this point currently has no child.
+        """
+        return self._view(self._grid.get_child_index(self._index))
+
+    @child.setter
+    def child(self, point):
+        """Sets this point's child to the given point."""
+        self._grid.set_child(self._index, None if point is None else point.index)
+
+    def has_child(self):
+        """Returns whether this point has a child."""
+        return self._grid.get_child_index(self._index) is not None
+
+    def get_neighbor(self, direction):
+        """
+        Returns the point adjacent to this one in the direction specified if one
+        exists, otherwise None
+        """
+        return self._view(
+            self._grid.get_adjacent_index(self._index, DIRECTION_INDEXES[direction]),
+        )
+
+    def has_neighbor(self, direction):
+        """Returns whether this point has a neighbor in the given direction."""
+        return self.get_neighbor(direction) is not None
+
+    def get_neighbors(self):
+        """
+        Returns all points that exist and are adjacent to this one, in the order
+        specified by the Direction enum, skipping directions for which no such
+        neighbor exists
+        """
+        grid = self._grid
+        adjacent_indexes = (
+            grid.get_adjacent_index(self._index, direction_index)
+            for direction_index in range(len(DIRECTIONS))
+        )
+        return tuple(
+            ArrayPoint(grid, index) for index in adjacent_indexes if index is not None
+        )
+
+    def has_relationship(self, direction):
+        """
+        Returns whether this is related to the adjacent point in the direction
+        specified
+        """
+        neighbor = self.get_neighbor(direction)
+        if neighbor is None:
+            return False
+        return self.child == neighbor or neighbor.child == self
+
+    @property
+    def parent(self):
+        """
+        Returns the (necessarily adjacent) point with this as its child if such a
+        point exists and if this is not a sink, otherwise None
+        """
+        return self._view(self._grid.get_parent_index(self._index))
+
+    @property
+    def parents(self):
+        """Returns the set of all points with this as their child"""
+        return frozenset(
+            neighbor for neighbor in self.get_neighbors() if neighbor.child == self
+        )
+
+    def has_parent(self):
+        """Returns whether this point has a parent."""
+        return self._grid.get_parent_index(self._index) is not None
+
+    def is_open(self):
+        """
+        Returns whether or not this is open to be set as a child of another point
+        """
+        return not self.is_source() and not self.has_parent()
+
+    def is_head(self):
+        """
+        Returns whether this is the current "head" of a path from source to sink
+        """
+        return not self.is_open() and not self.has_child()
+
+    def is_on_different_segment(self, neighbor):
+        """
+        Determines whether this is on a different straight line segment from the given
+        neighbor, along the directed path from source to sink
+        """
+        grid = self._grid
+        incoming_direction = grid.get_incoming_direction_index(neighbor.index)
+        if incoming_direction is None:
+            return False
+        return grid.get_direction_index(neighbor.index, self._index) != (
+            incoming_direction
+        )
+
+    @property
+    def incoming_direction(self):
+        """
+        Returns the direction from this point's parent to this point, or None if this
+        point has no parent
+        """
+        direction_index = self._grid.get_incoming_direction_index(self._index)
+        return None if direction_index is None else DIRECTIONS[direction_index]
+
+    @property
+    def remaining_segments(self):
+        """
+        Returns the exact number of remaining straight line segments required to
+        connect this point to a sink
+        """
+        if self.is_open():
+            return None
+        return self._grid.get_remaining_segments(self._index)
+
+    # Points of either kind are represented in the same way
+    __str__ = Point.__str__
@@ -0,0 +1,198 @@
+"""
+Module that holds the "backjumping" algorithm for solving Gas Lines puzzles, which
+backtracks directly to the most recent decision responsible for each dead end, as well
+as the NogoodCache class of learned combinations of decisions that lead to dead ends.
+"""
+
+
+import collections
+
+from gaslines.logic import is_option
+
+
+def backjumping(grid, nogoods=None):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles using
+    conflict-directed backjumping.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    Each move is a decision, made at the depth of the search at the time. The
+    decisions responsible for a head running out of options are recorded in its
+    "conflict set": the decision that made it a head in the first place and, for each
+    neighbor that is not an option, the decision that closed the neighbor if it is
+    closed, otherwise the decisions along the path of the head, which determine its
+    remaining segments. Once a head runs out of options, the search jumps straight
+    back to the most recent decision in its conflict set, skipping every later
+    decision, none of which could have helped, and passes on the rest of the set.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        nogoods (NogoodCache): An optional cache to which each dead end is added as a
+            "nogood", i.e., as the set of links responsible for it, and which is
+            consulted after every move, so that a dead end is never explored twice.
+            Defaults to None.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    # The depth of the decision that set the child of each point, by its index
+    depths = {}
+    # Each frame holds a head whose child is a decision, the index of its next
+    # untested neighbor and its conflict set
+    stack = []
+    current = None
+    while True:
+        if current is None:
+            # A grid with no remaining heads is already in a solved state
+            if not grid.has_head():
+                return True
+            current, start = grid.get_head(), 0
+            # A head stays a head, which must be extended, for as long as its parent
+            # remains linked to it
+            conflicts = get_link_conflicts(depths, current)
+        depth = len(stack)
+        neighbors = current.get_neighbors()
+        for index in range(start, len(neighbors)):
+            neighbor = neighbors[index]
+            if not is_option(current, neighbor):
+                conflicts |= get_option_conflicts(depths, current, neighbor)
+                continue
+            current.child = neighbor
+            depths[current.index] = depth
+            nogood = None if nogoods is None else nogoods.find(grid, current)
+            if nogood is not None:
+                conflicts |= {depths[index] for index, _ in nogood} - {depth}
+                current.child = None
+                del depths[current.index]
+                continue
+            stack.append((current, index + 1, conflicts))
+            current = None
+            break
+        else:
+            if nogoods is not None:
+                nogoods.add(
+                    (stack[level][0].index, stack[level][0].child.index)
+                    for level in conflicts
+                )
+            # Jump back to the most recent decision responsible, if any, undoing it
+            # along with every later decision
+            target = max(conflicts, default=-1)
+            while len(stack) > target + 1:
+                undo_decision(depths, stack.pop()[0])
+            if target < 0:
+                return False
+            current, start, target_conflicts = stack.pop()
+            undo_decision(depths, current)
+            conflicts = target_conflicts | (conflicts - {target})
+
+
+def undo_decision(depths, point):
+    """Resets the child of the given point, which was set by a decision."""
+    point.child = None
+    del depths[point.index]
+
+
+def get_option_conflicts(depths, current, neighbor):
+    """
+    Returns the depths of the decisions responsible for the given neighbor of the
+    given head not being an option, as part of the "backjumping" algorithm.
+
+    Args:
+        depths (dict): The depth of the decision that set the child of each point, by
+            the index of the point.
+        current (Point): A head of the grid.
+        neighbor (Point): A neighbor of "current" that is not an option.
+
+    Returns:
+        set: The depths of the responsible decisions, which excludes links that were
+            not set by decisions, such as those of the initial grid.
+    """
+    if not neighbor.is_open():
+        return get_link_conflicts(depths, neighbor)
+    # Otherwise, the path to the head left it with the wrong number of segments
+    conflicts = set()
+    point = current.parent
+    while point is not None:
+        if point.index in depths:
+            conflicts.add(depths[point.index])
+        point = point.parent
+    return conflicts
+
+
+def get_link_conflicts(depths, point):
+    """
+    Returns the depth of the decision that linked the given point to its parent, if
+    any, as a set, which is empty if the point has no parent or if the link was not
+    set by a decision (e.g., if it is part of the initial grid).
+    """
+    parent = point.parent
+    if parent is None or parent.index not in depths:
+        return set()
+    return {depths[parent.index]}
+
+
+class NogoodCache:
+    """
+    Represents a bounded collection of "nogoods", i.e., sets of links from points to
+    their children that cannot all be part of any solution
+
+    Once the cache is full, the oldest nogood is evicted. Each nogood is indexed by
+    each of its links, so that only nogoods involving the most recent move need to be
+    checked after it. Since nogoods refer to points by index, a cache must only be
+    used with a single puzzle.
+    """
+
+    def __init__(self, capacity=1 << 12):
+        if capacity < 1:
+            raise ValueError(f"Capacity must be positive, not {capacity}")
+        self._capacity = capacity
+        # Nogoods in the order in which they were added, and by each of their links
+        self._nogoods = collections.OrderedDict()
+        self._nogoods_by_link = collections.defaultdict(set)
+
+    @property
+    def capacity(self):
+        """Returns the maximum number of nogoods in the cache."""
+        return self._capacity
+
+    def __len__(self):
+        """Returns the number of nogoods currently in the cache."""
+        return len(self._nogoods)
+
+    def __contains__(self, nogood):
+        """Returns whether the given set of links is a nogood in the cache."""
+        return frozenset(nogood) in self._nogoods
+
+    def add(self, links):
+        """
+        Adds the given links, as ordered pairs of the row-major indexes of a point
+        and of its child, as a nogood, evicting the oldest nogood if necessary.
+
+        Empty nogoods, which make every state unsolvable, are not added.
+        """
+        nogood = frozenset(links)
+        if not nogood or nogood in self._nogoods:
+            return
+        self._nogoods[nogood] = None
+        for link in nogood:
+            self._nogoods_by_link[link].add(nogood)
+        if len(self._nogoods) > self._capacity:
+            evicted, _ = self._nogoods.popitem(last=False)
+            for link in evicted:
+                self._nogoods_by_link[link].discard(evicted)
+
+    def find(self, grid, point):
+        """
+        Returns a nogood, involving the link from the given point to its child, all of
+        whose links are part of the grid in its current state, or None if none is.
+        """
+        for nogood in self._nogoods_by_link.get((point.index, point.child.index), ()):
+            if all(
+                grid.get_point(index).child is not None
+                and grid.get_point(index).child.index == child_index
+                for index, child_index in nogood
+            ):
+                return nogood
+        return None
@@ -0,0 +1,199 @@
+"""
+Module that holds the "bitboard" algorithm for solving Gas Lines puzzles, which
+searches using integers as bit masks over the row-major indexes of a grid rather than
+by mutating the points of the grid, as well as helper functions for that algorithm.
+"""
+
+
+import functools
+
+from gaslines.bounds import get_segment_bounds
+from gaslines.grid import get_adjacency
+from gaslines.point import DIRECTION_INDEXES
+
+
+def bitboard(grid, bounded=False):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles using bitboards.
+
+    Mutates the grid object provided to record a solution and returns True once a
+    solution has been found or False if no solution exists.
+
+    Explores the same candidates in the same order as the "full_recursive" strategy,
+    but without mutating the grid along the way. Instead, the points that are closed
+    (i.e., not open) and the heads are each represented as a single integer, with one
+    bit per point, so that checking whether a point is open is a single bitwise
+    operation and backtracking amounts to restoring two integers. The grid itself is
+    only mutated once a solution has been found.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        bounded (bool): Whether to also prune every move after which a path could no
+            longer reach any sink in its remaining segments, as determined by the
+            segment bounds of the grid. Defaults to False.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    neighbor_bits = get_neighbor_bits(grid.height, grid.length)
+    bitboards = read_bitboards(grid)
+    bounds = get_segment_bounds(grid) if bounded else None
+    moves = search_bitboards(neighbor_bits, bounds, bitboards)
+    if moves is None:
+        return False
+    grid.apply_moves(moves)
+    return True
+
+
+def search_bitboards(neighbor_bits, bounds, bitboards):
+    """
+    Helper function for `bitboard` that searches from the given bitboards.
+
+    Args:
+        neighbor_bits (tuple): The neighbor table of the grid, as returned by
+            `get_neighbor_bits`.
+        bounds (tuple): The segment bounds of the grid, as returned by
+            `get_segment_bounds`, by which to also prune candidates, or None.
+        bitboards (tuple): The state of the grid, as returned by `read_bitboards`.
+
+    Returns:
+        list: The moves of a solution, as ordered pairs of the row-major indexes of
+            a point and of its new child, or None if no solution exists.
+    """
+    closed, sinks, heads, head_states = bitboards
+    # Each frame holds a move, the search state prior to it, and where to resume
+    stack = []
+    current, head_state, start = None, None, 0
+    while True:
+        if current is None:
+            # A grid with no remaining heads is already in a solved state
+            if not heads:
+                return [(frame[0], frame[1]) for frame in stack]
+            # Select the first head in row-major order, i.e., the lowest set bit
+            current = (heads & -heads).bit_length() - 1
+            head_state, start = head_states[current], 0
+        position, neighbor_state = find_option(
+            neighbor_bits[current],
+            start,
+            head_state,
+            closed,
+            (sinks, bounds),
+        )
+        if position is None:
+            # Backtrack to the most recent move with untested alternatives, if any
+            if not stack:
+                return None
+            current, _, closed, heads, head_state, start = stack.pop()
+            continue
+        _, neighbor, bit = neighbor_bits[current][position]
+        stack.append((current, neighbor, closed, heads, head_state, position + 1))
+        heads &= ~(1 << current)
+        if sinks & bit:
+            current = None
+        else:
+            closed |= bit
+            heads |= bit
+            current, head_state, start = neighbor, neighbor_state, 0
+
+
+def find_option(candidates, start, head_state, closed, constraints):
+    """
+    Helper function for `search_bitboards` that finds the first candidate child of a
+    head, at or after the given position, that is worth considering.
+
+    Args:
+        candidates (tuple): The neighbors of the head, as described by
+            `get_neighbor_bits`.
+        start (int): The position of the first candidate to consider.
+        head_state (tuple): An ordered pair of the incoming direction index (or
+            None) and the remaining segments of the head.
+        closed (int): The bitboard of closed points.
+        constraints (tuple): An ordered pair of the bitboard of sinks and of the
+            segment bounds of the grid, as returned by `get_segment_bounds`, by
+            which to also prune candidates, or None.
+
+    Returns:
+        tuple: The position of the candidate and the state that it would have as
+            the child of the head, in the same form as that of the head, or a pair
+            of Nones if no candidate is worth considering.
+    """
+    direction, remaining_segments = head_state
+    sinks, bounds = constraints
+    for position in range(start, len(candidates)):
+        neighbor_direction, neighbor, bit = candidates[position]
+        if closed & bit:
+            continue
+        # Remaining segments that the neighbor would have as the child of the head
+        neighbor_remaining_segments = remaining_segments - (
+            direction is not None and neighbor_direction != direction
+        )
+        if neighbor_remaining_segments <= 0 or (
+            sinks & bit and neighbor_remaining_segments != 1
+        ):
+            continue
+        if (
+            bounds is not None
+            and neighbor_remaining_segments < bounds[neighbor][neighbor_direction]
+        ):
+            continue
+        return position, (neighbor_direction, neighbor_remaining_segments)
+    return None, None
+
+
+def read_bitboards(grid):
+    """
+    Reads the current state of the given grid into bitboards.
+
+    Args:
+        grid (Grid): A Gas Lines grid.
+
+    Returns:
+        tuple: The bitboard of closed points (i.e., points that are not open), the
+            bitboard of sinks, the bitboard of heads, and a dictionary mapping the
+            index of each head to an ordered pair of its incoming direction index (or
+            None) and its remaining segments.
+    """
+    closed = sinks = heads = 0
+    head_states = {}
+    for point in grid.points:
+        bit = 1 << point.index
+        if point.is_sink():
+            sinks |= bit
+        elif not point.is_open():
+            closed |= bit
+        if point.is_head():
+            heads |= bit
+            direction = point.incoming_direction
+            head_states[point.index] = (
+                None if direction is None else DIRECTION_INDEXES[direction],
+                point.remaining_segments,
+            )
+    return closed, sinks, heads, head_states
+
+
+@functools.lru_cache(maxsize=128)
+def get_neighbor_bits(height, length):
+    """
+    Returns, for each point of a grid with the given dimensions, a tuple describing
+    each of its neighbors in the order specified by the Direction enum.
+
+    Since this table depends only on the shape of a grid, it is computed once and then
+    shared by all grids of the same shape.
+
+    Args:
+        height (int): The number of rows of the grid.
+        length (int): The number of columns of the grid.
+
+    Returns:
+        tuple: For each point of the grid, in row-major order, a tuple of triples,
+            each comprising of the index of the direction of a neighbor, the
+            row-major index of that neighbor, and the bit of that neighbor.
+    """
+    return tuple(
+        tuple(
+            (direction_index, neighbor, 1 << neighbor)
+            for direction_index, neighbor in enumerate(adjacent_indexes)
+            if neighbor is not None
+        )
+        for adjacent_indexes in get_adjacency(height, length)
+    )
@@ -0,0 +1,327 @@
+"""
+Module that holds lower bounds on, and exact feasibility of, the number of straight
+line segments needed to connect the points of a Gas Lines grid to a sink, as well as
+the "bounded" and "feasible" algorithms, which use these to prune their search.
+"""
+
+
+import collections
+import functools
+import math
+
+from gaslines.grid import get_adjacency
+from gaslines.logic import is_option, iterative
+
+
+def bounded(grid):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles that prunes every
+    move after which a path could no longer reach any sink in its remaining segments.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    Explores the grid in the same order as the "iterative" strategy, skipping only
+    subtrees that contain no solution, so both strategies find the same solution.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    option = functools.partial(is_within_bounds, get_segment_bounds(grid))
+    return iterative(grid, option=option)
+
+
+def feasible(grid):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles that prunes every
+    move after which a path could no longer reach any sink in exactly its remaining
+    segments.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    Prunes at least as much as the "bounded" strategy, again only skipping subtrees
+    that contain no solution, so both strategies find the same solution.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    option = functools.partial(is_feasible, get_segment_feasibility(grid))
+    return iterative(grid, option=option)
+
+
+def is_within_bounds(bounds, current, neighbor):
+    """
+    Returns whether the neighbor is a valid option to be set as the child of current
+    and, if so, whether it could still reach a sink in its remaining segments.
+
+    Args:
+        bounds (tuple): The segment bounds of the grid, as returned by
+            `get_segment_bounds`.
+        current (Point): The point whose child is to be set.
+        neighbor (Point): The candidate child of "current".
+    """
+    if not is_option(current, neighbor):
+        return False
+    # Remaining segments that the neighbor would have as the child of current
+    neighbor_remaining_segments = (
+        current.remaining_segments - neighbor.is_on_different_segment(current)
+    )
+    direction = current.grid.adjacency[current.index].index(neighbor.index)
+    return neighbor_remaining_segments >= bounds[neighbor.index][direction]
+
+
+def is_feasible(feasibility, current, neighbor):
+    """
+    Returns whether the neighbor is a valid option to be set as the child of current
+    and, if so, whether it could still reach a sink in exactly its remaining segments.
+
+    Args:
+        feasibility (tuple): The segment feasibility of the grid, as returned by
+            `get_segment_feasibility`.
+        current (Point): The point whose child is to be set.
+        neighbor (Point): The candidate child of "current".
+    """
+    if not is_option(current, neighbor):
+        return False
+    # Remaining segments that the neighbor would have as the child of current
+    neighbor_remaining_segments = (
+        current.remaining_segments - neighbor.is_on_different_segment(current)
+    )
+    direction = current.grid.adjacency[current.index].index(neighbor.index)
+    mask = feasibility[neighbor.index][direction]
+    return bool(mask >> neighbor_remaining_segments & 1)
+
+
+def get_segment_bounds(grid):
+    """
+    Returns lower bounds on the number of straight line segments needed to connect
+    each point of the given grid to a sink.
+
+    The bounds ignore all paths drawn on the grid, and so depend only on its shape and
+    the locations of its sources and sinks. They are therefore computed once and then
+    shared by all grids with the same layout.
+
+    Args:
+        grid (Grid): A Gas Lines grid.
+
+    Returns:
+        tuple: For each point of the grid, in row-major order, a tuple of the fewest
+            segments (counting the current segment) that a path arriving at that
+            point in each direction, in the order specified by the Direction enum,
+            needs to reach a sink, or infinity if no sink can be reached at all.
+    """
+    sinks = frozenset(point.index for point in grid.points if point.is_sink())
+    sources = frozenset(point.index for point in grid.points if point.is_source())
+    return compute_segment_bounds(grid.height, grid.length, sinks, sources)
+
+
+@functools.lru_cache(maxsize=32)
+def compute_segment_bounds(height, length, sinks, sources):
+    """
+    Computes the segment bounds of a grid with the given layout, as described by
+    `get_segment_bounds`.
+
+    The bounds are computed by a breadth-first search backwards from the sinks, in
+    which continuing straight is free and turning costs one segment.
+
+    Args:
+        height (int): The number of rows of the grid.
+        length (int): The number of columns of the grid.
+        sinks (frozenset): The row-major indexes of the sinks of the grid.
+        sources (frozenset): The row-major indexes of the sources of the grid, which
+            no path may pass through.
+
+    Returns:
+        tuple: The segment bounds of the grid.
+    """
+    adjacency = get_adjacency(height, length)
+    number_of_directions = len(adjacency[0])
+    bounds = [[math.inf] * number_of_directions for _ in adjacency]
+    # Arriving at a sink in any direction completes a path on its last segment
+    queue = collections.deque()
+    impassable_points = sinks | sources
+    for sink in sinks:
+        for direction in range(number_of_directions):
+            bounds[sink][direction] = 1
+            queue.append((1, sink, direction))
+    while queue:
+        bound, point, direction = queue.popleft()
+        if bound > bounds[point][direction]:
+            continue
+        for entry in relax_segment_bounds(
+            adjacency,
+            impassable_points,
+            bounds,
+            (bound, point, direction),
+        ):
+            # Free moves are explored before costly ones, as in Dijkstra's
+            if entry[0] == bound:
+                queue.appendleft(entry)
+            else:
+                queue.append(entry)
+    return tuple(map(tuple, bounds))
+
+
+def relax_segment_bounds(adjacency, impassable_points, bounds, entry):
+    """
+    Helper function for `compute_segment_bounds` that lowers the bounds of the point
+    from which moving in the given direction arrives at the given point, in each
+    direction in which that point may itself be arrived at.
+
+    Args:
+        adjacency (tuple): The adjacency table of the grid.
+        impassable_points (frozenset): The row-major indexes of the sources and
+            sinks of the grid, which no path may pass through.
+        bounds (list): The segment bounds computed so far, which are updated.
+        entry (tuple): The bound, the point and the direction to relax from.
+
+    Yields:
+        tuple: The bound, point and direction of each lowered bound.
+    """
+    bound, point, direction = entry
+    number_of_directions = len(adjacency[point])
+    # The point from which moving in this direction arrives at this point
+    opposite_direction = (direction + 2) % number_of_directions
+    previous_point = adjacency[point][opposite_direction]
+    if previous_point is None or previous_point in impassable_points:
+        return
+    for previous_direction in range(number_of_directions):
+        # A path cannot turn back on itself
+        if previous_direction == opposite_direction:
+            continue
+        turns = previous_direction != direction
+        if bound + turns < bounds[previous_point][previous_direction]:
+            bounds[previous_point][previous_direction] = bound + turns
+            yield bound + turns, previous_point, previous_direction
+
+
+def get_segment_feasibility(grid):
+    """
+    Returns, for each point of the given grid and each number of straight line
+    segments, whether a sink can be reached from that point in exactly that number of
+    segments.
+
+    Like the segment bounds, the feasibility ignores all paths drawn on the grid, and
+    so is computed once and then shared by all grids with the same layout.
+
+    Args:
+        grid (Grid): A Gas Lines grid.
+
+    Returns:
+        tuple: For each point of the grid, in row-major order, a tuple of bit masks,
+            one for a path arriving at that point in each direction, in the order
+            specified by the Direction enum. Bit k of a mask is set if and only if
+            such a path can reach a sink in exactly k segments (counting the current
+            segment), for each k up to the largest number of segments of any source.
+    """
+    sinks = frozenset(point.index for point in grid.points if point.is_sink())
+    sources = frozenset(point.index for point in grid.points if point.is_source())
+    maximum_segments = max(
+        (point.remaining_segments for point in grid.points if point.is_source()),
+        default=0,
+    )
+    return compute_segment_feasibility(
+        grid.height,
+        grid.length,
+        sinks,
+        sources,
+        maximum_segments,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def compute_segment_feasibility(height, length, sinks, sources, maximum_segments):
+    """
+    Computes the segment feasibility of a grid with the given layout, as described by
+    `get_segment_feasibility`.
+
+    The feasibility is computed by dynamic programming backwards from the sinks, over
+    bit masks of segment counts, so that every count up to the maximum is handled at
+    once by a single shift. Paths are treated as walks, which may revisit points, so a
+    set bit is necessary, but not sufficient, for a path to exist.
+
+    Args:
+        height (int): The number of rows of the grid.
+        length (int): The number of columns of the grid.
+        sinks (frozenset): The row-major indexes of the sinks of the grid.
+        sources (frozenset): The row-major indexes of the sources of the grid, which
+            no path may pass through.
+        maximum_segments (int): The largest number of segments of interest.
+
+    Returns:
+        tuple: The segment feasibility of the grid.
+    """
+    adjacency = get_adjacency(height, length)
+    number_of_directions = len(adjacency[0])
+    # Bit mask of all segment counts of interest, i.e., one through the maximum
+    counts = (1 << (maximum_segments + 1)) - 2
+    feasibility = [[0] * number_of_directions for _ in adjacency]
+    # Arriving at a sink in any direction completes a path on its last segment
+    queue = collections.deque()
+    impassable_points = sinks | sources
+    for sink in sinks:
+        for direction in range(number_of_directions):
+            feasibility[sink][direction] = 0b10 & counts
+            queue.append((sink, direction))
+    # Each mask can only gain bits, so each point and direction is revisited at most
+    # once per segment count
+    while queue:
+        entry = queue.popleft()
+        queue.extend(
+            relax_segment_feasibility(
+                adjacency,
+                impassable_points,
+                counts,
+                feasibility,
+                entry,
+            ),
+        )
+    return tuple(map(tuple, feasibility))
+
+
+def relax_segment_feasibility(adjacency, impassable_points, counts, feasibility, entry):
+    """
+    Extends the segment feasibility of every point from which moving in the given
+    direction arrives at the given point, as one step of
+    `compute_segment_feasibility`.
+
+    Args:
+        adjacency (tuple): The adjacency table of the grid.
+        impassable_points (frozenset): The row-major indexes of the sources and
+            sinks of the grid, which no path may pass through.
+        counts (int): The bit mask of all segment counts of interest.
+        feasibility (list): The segment feasibility computed so far, which is
+            updated.
+        entry (tuple): The point and the direction to extend from.
+
+    Yields:
+        tuple: The point and direction of each extended mask.
+    """
+    point, direction = entry
+    mask = feasibility[point][direction]
+    number_of_directions = len(adjacency[point])
+    # The point from which moving in this direction arrives at this point
+    opposite_direction = (direction + 2) % number_of_directions
+    previous_point = adjacency[point][opposite_direction]
+    if previous_point is None or previous_point in impassable_points:
+        return
+    for previous_direction in range(number_of_directions):
+        # A path cannot turn back on itself
+        if previous_direction == opposite_direction:
+            continue
+        # Turning onto this segment requires one more segment beforehand
+        previous_mask = feasibility[previous_point][previous_direction]
+        if previous_direction != direction:
+            updated_mask = previous_mask | (mask << 1) & counts
+        else:
+            updated_mask = previous_mask | mask
+        if updated_mask != previous_mask:
+            feasibility[previous_point][previous_direction] = updated_mask
+            yield previous_point, previous_direction
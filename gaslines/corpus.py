@@ -0,0 +1,145 @@
+"""
+Container module for the gaslines SharedCorpus class, which holds a batch of Gas
+Lines puzzles, along with their results, in a single block of shared memory that any
+number of processes may read from and write to without copying.
+"""
+
+
+import struct
+from multiprocessing import shared_memory
+
+from gaslines.grid import Grid
+
+
+# Layout of the header of a corpus: the number of puzzles it holds
+HEADER = struct.Struct("<Q")
+
+# Status of a puzzle whose result has not yet been recorded
+PENDING = 0
+
+# Status of a puzzle for each possible outcome of its search, as recorded by
+# `set_result`, where None stands for a search that was abandoned
+STATUSES = {True: 1, False: 2, None: 3}
+OUTCOMES = {status: outcome for outcome, status in STATUSES.items()}
+
+
+class SharedCorpus:
+    """
+    Represents a batch of Gas Lines puzzles, and their results, held in a block of
+    shared memory
+
+    Each puzzle is stored in the compact representation of `Grid.to_bytes`. The block
+    is laid out as a header holding the number of puzzles, an index of the offset of
+    each puzzle (and of the end of the last one), a status byte per puzzle, the flat
+    array of all puzzles and, finally, a result array of the same layout, in which
+    the solution of each puzzle is stored at the offset of the puzzle itself.
+
+    A corpus is created once, by `create`, and then attached to by name, with
+    `attach`, in every other process that needs it. Every process must `close` the
+    corpus once done with it, and the creator must also `unlink` it.
+    """
+
+    __slots__ = ("_memory", "_offsets", "_statuses", "_puzzles", "_results")
+
+    def __init__(self, memory):
+        self._memory = memory
+        (count,) = HEADER.unpack_from(memory.buf)
+        start = HEADER.size
+        self._offsets = memory.buf[start : start + 8 * (count + 1)].cast("Q")
+        start += 8 * (count + 1)
+        self._statuses = memory.buf[start : start + count]
+        start += count
+        size = self._offsets[-1]
+        self._puzzles = memory.buf[start : start + size]
+        self._results = memory.buf[start + size : start + 2 * size]
+
+    @classmethod
+    def create(cls, puzzles):
+        """
+        Creates a corpus in a new block of shared memory.
+
+        Args:
+            puzzles (Iterable): The descriptions of the puzzles, as accepted by the
+                Grid class, or grids, whose current states are stored instead.
+
+        Returns:
+            SharedCorpus: The corpus, with every result pending.
+        """
+        data = [
+            (puzzle if isinstance(puzzle, Grid) else Grid(puzzle)).to_bytes()
+            for puzzle in puzzles
+        ]
+        offsets = [0]
+        for puzzle in data:
+            offsets.append(offsets[-1] + len(puzzle))
+        size = HEADER.size + 8 * len(offsets) + len(data) + 2 * offsets[-1]
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        HEADER.pack_into(memory.buf, 0, len(data))
+        struct.pack_into(f"<{len(offsets)}Q", memory.buf, HEADER.size, *offsets)
+        corpus = cls(memory)
+        corpus._statuses[:] = bytes(len(data))
+        corpus._puzzles[:] = b"".join(data)
+        return corpus
+
+    @classmethod
+    def attach(cls, name):
+        """Attaches to the existing corpus of the given name."""
+        return cls(shared_memory.SharedMemory(name=name))
+
+    @property
+    def name(self):
+        """Returns the name of the block of shared memory holding the corpus."""
+        return self._memory.name
+
+    def __len__(self):
+        """Returns the number of puzzles in the corpus."""
+        return len(self._statuses)
+
+    def _get_slice(self, index):
+        """Returns the slice at which the puzzle at the given index is stored."""
+        return slice(self._offsets[index], self._offsets[index + 1])
+
+    def get_puzzle(self, index):
+        """Returns a new grid of the puzzle at the given index."""
+        return Grid.from_bytes(self._puzzles[self._get_slice(index)])
+
+    def set_result(self, index, solved, grid):
+        """
+        Records the result of the puzzle at the given index.
+
+        Args:
+            index (int): The index of the puzzle.
+            solved (bool): Whether the puzzle has a solution, or None if its search
+                was abandoned.
+            grid (Grid): The grid of the puzzle, whose state is recorded if solved.
+        """
+        if solved:
+            self._results[self._get_slice(index)] = grid.to_bytes()
+        self._statuses[index] = STATUSES[solved]
+
+    def get_result(self, index):
+        """
+        Returns the recorded result of the puzzle at the given index.
+
+        Returns:
+            tuple: An ordered pair of whether the puzzle has a solution, or None if
+                its search was abandoned, and the grid of its solution, if any,
+                otherwise None. Returns None instead if no result has been recorded.
+        """
+        status = self._statuses[index]
+        if status == PENDING:
+            return None
+        solved = OUTCOMES[status]
+        if not solved:
+            return solved, None
+        return solved, Grid.from_bytes(self._results[self._get_slice(index)])
+
+    def close(self):
+        """Closes this process's access to the corpus."""
+        for view in (self._offsets, self._statuses, self._puzzles, self._results):
+            view.release()
+        self._memory.close()
+
+    def unlink(self):
+        """Destroys the block of shared memory once every process has closed it."""
+        self._memory.unlink()
@@ -0,0 +1,278 @@
+"""
+Module that holds the "exact_cover" algorithm for solving Gas Lines puzzles, which
+enumerates the candidate paths of each head and then selects one path per head with
+Knuth's Algorithm X, as well as the DancingLinks class on which Algorithm X operates.
+"""
+
+
+from gaslines.bounds import get_segment_bounds
+from gaslines.point import DIRECTION_INDEXES
+
+
+def exact_cover(grid):
+    """
+    A two-phase approach to solving Gas Lines puzzles as an exact cover problem.
+
+    Mutates the grid object provided to record a solution and returns True once a
+    solution has been found or False if no solution exists.
+
+    First, every path by which each head could reach a sink in exactly its remaining
+    segments, through points that are currently open, is enumerated. Then, a
+    selection of one path per head, no two of which share a pipe point, is found with
+    Algorithm X. Heads are the primary columns of the problem, which must be covered
+    exactly once, and open pipes are secondary columns, which may be covered at most
+    once, while sinks may be shared by any number of paths. The grid itself is only
+    mutated once a solution has been found.
+
+    This approach suits puzzles with few sources and few segments, as the number of
+    candidate paths grows quickly with both.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    heads = grid.heads
+    pipes = tuple(
+        point.index for point in grid.points if point.is_open() and not point.is_sink()
+    )
+    # Secondary columns follow the primary columns, one per head
+    columns = {index: len(heads) + column for column, index in enumerate(pipes)}
+    rows, paths = [], []
+    for column, head in enumerate(heads):
+        for path in enumerate_paths(grid, head):
+            rows.append((column, *(columns[index] for index in path[:-1])))
+            paths.append((head.index, *path))
+    selection = find_exact_cover(len(heads), rows)
+    if selection is None:
+        return False
+    grid.apply_moves(
+        (move for row in selection for move in zip(paths[row], paths[row][1:])),
+    )
+    return True
+
+
+def enumerate_paths(grid, head):
+    """
+    Generates every path by which the given head could reach a sink in exactly its
+    remaining segments, through points of the grid that are currently open.
+
+    Paths follow the same rules as the "is_option" predicate, i.e., a path loses a
+    segment whenever it turns, and a sink can only be reached on a path's last
+    segment. Paths that could not reach any sink in time, according to the segment
+    bounds of the grid, are abandoned early.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        head (Point): A head of the grid.
+
+    Yields:
+        tuple: The row-major indexes of the points along a path, excluding the head
+            and ending with a sink, in the order specified by the Direction enum.
+    """
+    adjacency = grid.adjacency
+    bounds = get_segment_bounds(grid)
+    points = grid.points
+    direction = head.incoming_direction
+    # Each frame holds a point of the path, the index of the direction in which the
+    # path arrived at it (if any), its remaining segments and its next direction index
+    frames = [
+        [
+            head.index,
+            None if direction is None else DIRECTION_INDEXES[direction],
+            head.remaining_segments,
+            0,
+        ],
+    ]
+    visited = set()
+    while frames:
+        frame = frames[-1]
+        index, direction, remaining_segments, position = frame
+        if position == len(adjacency[index]):
+            frames.pop()
+            visited.discard(index)
+            continue
+        frame[3] += 1
+        neighbor = adjacency[index][position]
+        if neighbor is None or neighbor in visited:
+            continue
+        # Remaining segments that the neighbor would have as the next point
+        neighbor_remaining_segments = remaining_segments - (
+            direction is not None and position != direction
+        )
+        if neighbor_remaining_segments <= 0 or not points[neighbor].is_open():
+            continue
+        if points[neighbor].is_sink():
+            if neighbor_remaining_segments == 1:
+                yield (*(entry[0] for entry in frames[1:]), neighbor)
+            continue
+        if neighbor_remaining_segments < bounds[neighbor][position]:
+            continue
+        visited.add(neighbor)
+        frames.append([neighbor, position, neighbor_remaining_segments, 0])
+
+
+def find_exact_cover(primary_count, rows):
+    """
+    Finds a selection of rows that covers every primary column exactly once and every
+    secondary column at most once, using Knuth's Algorithm X with dancing links.
+
+    The column with the fewest remaining rows is always covered next, with ties
+    broken in favor of the first such column, and rows are tried in the order given,
+    so the selection found is deterministic.
+
+    Args:
+        primary_count (int): The number of primary columns, which are the columns
+            numbered from zero up to, but excluding, this number. All higher column
+            numbers are secondary.
+        rows (Sequence): The rows, each an iterable of the numbers of the columns
+            that it covers.
+
+    Returns:
+        list: The indexes of the selected rows, in the order in which they were
+            selected, or None if no such selection exists.
+    """
+    return DancingLinks(primary_count, rows).search()
+
+
+# The matrix is only ever searched once, so `search` is its only public method
+class DancingLinks:  # pylint: disable=R0903
+    """
+    Represents the sparse matrix of an exact cover problem as circular, doubly linked
+    lists of its nonzero cells, in both directions, so that columns can be removed
+    and then restored in constant time per cell
+
+    Nodes are numbered, with the links of each node held in flat lists rather than in
+    node objects. Node 0 is the root, nodes 1 through the number of columns are the
+    column headers and every subsequent node is a cell of a row. Secondary columns are
+    left out of the list of headers, so that they need not be covered.
+    """
+
+    __slots__ = ("_left", "_right", "_up", "_down", "_columns", "_rows", "_sizes")
+
+    def __init__(self, primary_count, rows):
+        column_count = max(
+            (column + 1 for row in rows for column in row),
+            default=primary_count,
+        )
+        column_count = max(column_count, primary_count)
+        headers = range(column_count + 1)
+        self._left = [header - 1 for header in headers]
+        self._right = [header + 1 for header in headers]
+        self._left[0], self._right[primary_count] = primary_count, 0
+        for header in range(primary_count + 1, column_count + 1):
+            self._left[header] = self._right[header] = header
+        self._up, self._down = list(headers), list(headers)
+        self._columns = list(headers)
+        self._rows = [None] * len(headers)
+        self._sizes = [0] * len(headers)
+        for row_index, row in enumerate(rows):
+            self._append_row(row_index, row)
+
+    def _append_row(self, row_index, row):
+        """Appends a row, covering the given column numbers, to the matrix."""
+        first = None
+        for column in row:
+            header = column + 1
+            node = len(self._columns)
+            self._columns.append(header)
+            self._rows.append(row_index)
+            # Insert the node at the bottom of its column
+            self._up.append(self._up[header])
+            self._down.append(header)
+            self._down[self._up[header]] = node
+            self._up[header] = node
+            self._sizes[header] += 1
+            # Insert the node at the end of its row
+            if first is None:
+                first = node
+                self._left.append(node)
+                self._right.append(node)
+            else:
+                self._left.append(self._left[first])
+                self._right.append(first)
+                self._right[self._left[first]] = node
+                self._left[first] = node
+
+    def _cover(self, header):
+        """Removes the given column, and every row that covers it, from the matrix."""
+        left, right, above, below = self._left, self._right, self._up, self._down
+        right[left[header]], left[right[header]] = right[header], left[header]
+        node = below[header]
+        while node != header:
+            other = right[node]
+            while other != node:
+                above[below[other]], below[above[other]] = above[other], below[other]
+                self._sizes[self._columns[other]] -= 1
+                other = right[other]
+            node = below[node]
+
+    def _uncover(self, header):
+        """Restores the given column, which was the last one covered, to the matrix."""
+        left, right, above, below = self._left, self._right, self._up, self._down
+        node = above[header]
+        while node != header:
+            other = left[node]
+            while other != node:
+                self._sizes[self._columns[other]] += 1
+                above[below[other]] = below[above[other]] = other
+                other = left[other]
+            node = above[node]
+        right[left[header]] = left[right[header]] = header
+
+    def _choose(self):
+        """Returns the first primary column with the fewest remaining rows."""
+        best, header = None, self._right[0]
+        while header != 0:
+            if best is None or self._sizes[header] < self._sizes[best]:
+                best = header
+            header = self._right[header]
+        return best
+
+    def _select(self, node):
+        """Covers every other column of the row of the given node."""
+        other = self._right[node]
+        while other != node:
+            self._cover(self._columns[other])
+            other = self._right[other]
+
+    def _deselect(self, node):
+        """Uncovers every other column of the row of the given node, in reverse."""
+        other = self._left[node]
+        while other != node:
+            self._uncover(self._columns[other])
+            other = self._left[other]
+
+    def search(self):
+        """
+        Searches for an exact cover, as described by `find_exact_cover`, leaving the
+        matrix in a reduced state if one is found.
+
+        Returns:
+            list: The indexes of the selected rows, or None if there is no selection.
+        """
+        if self._right[0] == 0:
+            return []
+        selection = []
+        header = self._choose()
+        self._cover(header)
+        node = self._down[header]
+        while True:
+            if node == header:
+                # Every row of this column has been tried, so backtrack
+                self._uncover(header)
+                if not selection:
+                    return None
+                node = selection.pop()
+                header = self._columns[node]
+                self._deselect(node)
+                node = self._down[node]
+                continue
+            selection.append(node)
+            self._select(node)
+            if self._right[0] == 0:
+                return [self._rows[node] for node in selection]
+            header = self._choose()
+            self._cover(header)
+            node = self._down[header]
@@ -4,21 +4,61 @@ Lines puzzle.
 """
 
 
+import array
+import bisect
+import collections
+import contextlib
+import functools
+import random
+import struct
+
 from gaslines.point import Point
 from gaslines.utility import Direction, Observable
 
 
-class Grid(Observable):
+# Layout of the header of the wire format of a grid: a magic number, a format
+# version, the height and the length of the grid
+HEADER = struct.Struct("<2sBHH")
+MAGIC = b"GL"
+VERSION = 1
+
+
+# The grid indexes its heads and tracks its Zobrist hash and its subscribers alongside
+# its points, all of which must be kept in step as it is mutated, and its public
+# interface is shared with ArrayGrid, so neither can be trimmed to pylint's limits
+class Grid(Observable):  # pylint: disable=R0902,R0904
     """
     Represents the grid of lattice points on which a Gas Lines puzzle takes place
     """
 
+    __slots__ = (
+        "_grid",
+        "_height",
+        "_length",
+        "_points",
+        "_adjacency",
+        "_heads",
+        "_batch_depth",
+        "_has_pending_notification",
+        "_subscribers",
+        "_sequence",
+        "_zobrist_hash",
+    )
+
     def __init__(self, grid):
         # Initialize the grid using the following `__init__` helper methods
         self._create_grid(grid)
         self._set_height()
         self._set_length()
-        self._observe_points()
+        self._link_points()
+        self._index_heads()
+        self._batch_depth = 0
+        self._has_pending_notification = False
+        # Subscribers to change events, allocated lazily by `subscribe`
+        self._subscribers = None
+        self._sequence = 0
+        # Zobrist hash, indexed lazily by `zobrist_hash` so untracked grids pay nothing
+        self._zobrist_hash = None
 
     def __getitem__(self, row_index):
         """
@@ -33,9 +73,9 @@ class Grid(Observable):
 
         This helper method must be called prior to any of the others.
         """
+        # The locations of the points are set from their indexes once linked
         self._grid = tuple(
-            tuple(Point(self, (i, j), type_) for j, type_ in enumerate(row))
-            for i, row in enumerate(grid)
+            tuple(Point(self, None, type_) for type_ in row) for row in grid
         )
 
     def _set_height(self):
@@ -50,15 +90,349 @@ class Grid(Observable):
         """
         self._length = len(self._grid[0])
 
-    def _observe_points(self):
+    def _link_points(self):
         """
-        Helper method for `__init__` that registers this grid as an observer of its
-        own points. This allows the grid to notify its own observers when any of its
-        points are mutated.
+        Helper method for `__init__` that provides each point with its neighbors, as
+        determined by the (shared) adjacency table for grids of this shape.
         """
-        for row in self:
-            for point in row:
-                point.register(self.notify)
+        self._points = points = tuple(point for row in self for point in row)
+        self._adjacency = get_adjacency(self._height, self._length)
+        for index, (point, adjacent_indexes) in enumerate(
+            zip(points, self._adjacency),
+        ):
+            point.link(
+                index,
+                tuple(points[k] for k in adjacent_indexes if k is not None),
+            )
+
+    def _index_heads(self):
+        """
+        Helper method for `__init__` that determines and stores the row-major indexes
+        of all heads of the grid, in ascending order.
+
+        This index is kept up to date by `update` as the grid is mutated.
+        """
+        self._heads = [point.index for point in self.points if point.is_head()]
+
+    def _index_zobrist_hash(self):
+        """
+        Helper method for `zobrist_hash` that determines and stores the Zobrist hash
+        of the grid, as described by `zobrist_hash`.
+
+        From then on, this hash is kept up to date by `update` as the grid is mutated.
+        """
+        self._zobrist_hash = get_layout_key(self._get_types().tobytes())
+        for point in self.points:
+            if point.has_child():
+                self._toggle_zobrist_key(point.index, point.child.index)
+
+    def _toggle_zobrist_key(self, index, child_index):
+        """
+        Toggles the Zobrist key of the link from the point at the given index to its
+        (adjacent) child at the child index into or out of the Zobrist hash.
+        """
+        direction_index = self.get_direction_index(index, child_index)
+        keys = get_zobrist_keys(self._height, self._length)
+        self._zobrist_hash ^= keys[index][direction_index]
+
+    @property
+    def points(self):
+        """Returns all points of the grid, in row-major order."""
+        return self._points
+
+    def get_point(self, index):
+        """Returns the point at the given row-major index of the grid."""
+        return self._points[index]
+
+    @property
+    def adjacency(self):
+        """
+        Returns the adjacency table of the grid, as described by `get_adjacency`.
+        """
+        return self._adjacency
+
+    def get_adjacent_index(self, index, direction_index):
+        """
+        Returns the row-major index of the point adjacent to the point at the given
+        index in the direction at the given index, in the order specified by the
+        Direction enum, or None if no such point exists.
+        """
+        return self._adjacency[index][direction_index]
+
+    def get_direction_index(self, index, neighbor_index):
+        """
+        Returns the index of the direction, in the order specified by the Direction
+        enum, in which the point at the neighbor index neighbors the point at the
+        given index, or None if it does not.
+        """
+        for direction_index, adjacent_index in enumerate(self._adjacency[index]):
+            if adjacent_index is not None and adjacent_index == neighbor_index:
+                return direction_index
+        return None
+
+    def update(self, point, previous_child):
+        """
+        Updates the index of heads and the Zobrist hash after the child of the given
+        point has changed and then publishes the change to the subscribers of the grid
+        and notifies the observers of the grid, if there are any.
+
+        Only the point itself, its previous child, and its current child can have
+        changed whether or not they are heads, so only they are reexamined.
+
+        This method is intended to be called only by the points of this grid.
+
+        Args:
+            point (Point): The point whose child has changed.
+            previous_child (Point): The child of the point prior to the change, if
+                any, otherwise None.
+        """
+        for affected_point in (point, previous_child, point.child):
+            if affected_point is not None:
+                self._index_head(affected_point)
+        # Toggle the key of the link that was removed, then that of the one added
+        if self._zobrist_hash is not None:
+            if previous_child is not None:
+                self._toggle_zobrist_key(point.index, previous_child.index)
+            if point.child is not None:
+                self._toggle_zobrist_key(point.index, point.child.index)
+        # Skip publication and notification entirely when nobody is listening
+        if self._subscribers:
+            self._sequence += 1
+            change = ChildChange(point, previous_child, point.child, self._sequence)
+            for subscriber in self._subscribers:
+                subscriber(change)
+        if self._observers:  # pylint: disable=E1101
+            self.notify()
+
+    def _index_head(self, point):
+        """
+        Adds the given point to, or removes it from, the index of heads, according to
+        whether or not it is currently a head.
+        """
+        index = point.index
+        position = bisect.bisect_left(self._heads, index)
+        is_indexed = position < len(self._heads) and self._heads[position] == index
+        if point.is_head():
+            if not is_indexed:
+                self._heads.insert(position, index)
+        elif is_indexed:
+            del self._heads[position]
+
+    def subscribe(self, subscriber):
+        """
+        Registers a callable as a 'subscriber' to changes of the points of the grid.
+
+        Unlike observers, which are called with no arguments, subscribers are called
+        with a ChildChange describing each individual change, so that they may react
+        to it without reexamining the whole grid. Subscribers are called once per
+        change, even while notifications of observers are being batched.
+
+        Args:
+            subscriber (callable): A callable to invoke with a ChildChange each time
+                the child of a point of the grid is set.
+        """
+        if self._subscribers is None:
+            self._subscribers = []
+        self._subscribers.append(subscriber)
+
+    def notify(self):
+        """
+        'Notifies' all previously registered observers, unless notifications are
+        currently being batched, in which case a single notification is deferred
+        until the end of the batch.
+        """
+        if self._batch_depth:
+            self._has_pending_notification = True
+        else:
+            super().notify()
+
+    @contextlib.contextmanager
+    def batch_updates(self):
+        """
+        Returns a context manager within which notifications of the observers of the
+        grid are suspended. Upon exit, observers are notified exactly once if any
+        notifications were suspended, so that any number of mutations made within
+        the context appear to observers as a single mutation.
+
+        Batches may be nested, in which case observers are notified upon exit of the
+        outermost batch.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._has_pending_notification:
+                self._has_pending_notification = False
+                self.notify()
+
+    def apply_moves(self, moves):
+        """
+        Applies the given moves to the grid, notifying its observers only once.
+
+        Args:
+            moves (Iterable): Ordered pairs of the row-major indexes of a point and of
+                its new child, respectively.
+        """
+        with self.batch_updates():
+            for index, child_index in moves:
+                self.get_point(index).child = self.get_point(child_index)
+
+    @property
+    def heads(self):
+        """Returns all current heads of the grid, in row-major order."""
+        return tuple(self.get_point(index) for index in self._heads)
+
+    def get_head(self):
+        """
+        Returns the first current head of the grid, in row-major order, if at least
+        one exists, otherwise None.
+        """
+        return self.get_point(self._heads[0]) if self._heads else None
+
+    def has_head(self):
+        """Returns whether the grid currently has a head."""
+        return bool(self._heads)
+
+    @property
+    def zobrist_hash(self):
+        """
+        Returns the Zobrist hash of the current state of the grid, i.e., the
+        exclusive or of a random 64-bit key for the layout of the grid (its sources
+        and sinks) and one for each link from a point to its child.
+
+        The hash is only tracked once first requested, from which point it is updated
+        incrementally as children are set. It is the same for equal states however
+        they were reached, and is the same across processes, while states of puzzles
+        with different layouts are all but certain to differ.
+        """
+        if self._zobrist_hash is None:
+            self._index_zobrist_hash()
+        return self._zobrist_hash
+
+    def _get_types(self):
+        """
+        Returns the type of each point of the grid, in row-major order, as an array
+        of signed bytes.
+        """
+        return array.array("b", (point.type for point in self.points))
+
+    def to_bytes(self):
+        """
+        Returns a compact representation of the grid in its current state, from which
+        an equal grid can be recreated by `from_bytes`.
+
+        The representation consists of a header, holding the dimensions of the grid,
+        followed by the type of each point as a signed byte and then the direction of
+        the child of each point, if any, as a nibble (i.e., half a byte), both in
+        row-major order. Observers and subscribers of the grid are not represented.
+
+        Returns:
+            bytes: The representation of the grid.
+        """
+        types = self._get_types()
+        # Each nibble holds one more than the index of the direction of the child
+        codes = [
+            self.get_direction_index(point.index, point.child.index) + 1
+            if point.has_child()
+            else 0
+            for point in self.points
+        ]
+        codes.append(0)
+        children = bytes(
+            codes[index] | codes[index + 1] << 4
+            for index in range(0, len(codes) - 1, 2)
+        )
+        header = HEADER.pack(MAGIC, VERSION, self._height, self._length)
+        return header + types.tobytes() + children
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Creates a grid from a representation returned by `to_bytes`.
+
+        Args:
+            data (bytes): The representation of the grid, or any bytes-like object,
+                such as a view of shared memory, holding it.
+
+        Returns:
+            Grid: A grid of this class, equal to the one represented.
+        """
+        magic, version, height, length = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Data does not represent a grid of a supported version")
+        if not height or not length:
+            raise ValueError("Data does not represent a grid with any points")
+        size = height * length
+        if len(data) != HEADER.size + size + (size + 1) // 2:
+            raise ValueError("Data does not match the dimensions of its grid")
+        types = array.array("b")
+        types.frombytes(data[HEADER.size : HEADER.size + size])
+        if min(types) < Point.PIPE:
+            raise ValueError("Data holds a point of an unknown type")
+        children = data[HEADER.size + size :]
+        codes = [children[index // 2] >> index % 2 * 4 & 0xF for index in range(size)]
+        adjacency = get_adjacency(height, length)
+        # Check every link before building any points, so that no grid is left half
+        # linked by invalid data
+        for index, code in enumerate(codes):
+            if code > len(Direction):
+                raise ValueError("Data holds a link in an unknown direction")
+            if code and adjacency[index][code - 1] is None:
+                raise ValueError("Data holds a link that leads off the grid")
+        grid = cls(
+            tuple(types[start : start + length] for start in range(0, size, length)),
+        )
+        for index, code in enumerate(codes):
+            if code:
+                child_index = adjacency[index][code - 1]
+                grid.get_point(index).child = grid.get_point(child_index)
+        return grid
+
+    def describe(self):
+        """
+        Returns the description of the grid, as accepted by the Grid class, which
+        disregards any paths drawn on it.
+        """
+        return tuple(tuple(point.type for point in row) for row in self)
+
+    def get_links(self):
+        """
+        Returns the links of the grid, as ordered pairs of the row-major indexes of
+        each point with a child and of its child.
+        """
+        return tuple(
+            (point.index, point.child.index)
+            for point in self.points
+            if point.has_child()
+        )
+
+    @classmethod
+    def rebuild(cls, description, moves):
+        """
+        Creates a grid with the given description, to which the given moves, as
+        ordered pairs of the row-major indexes of a point and of its new child, have
+        been applied in order.
+
+        Args:
+            description (tuple): The description of the grid, as returned by
+                `describe`.
+            moves (Iterable): The moves to apply, such as the links returned by
+                `get_links`.
+
+        Returns:
+            Grid: A grid of this class, in the state reached by the moves.
+        """
+        grid = cls(description)
+        grid.apply_moves(moves)
+        return grid
+
+    def __reduce__(self):
+        """
+        Supports pickling of the grid by way of its compact representation, so that
+        observers and subscribers, which may not be picklable, are not pickled.
+        """
+        return type(self).from_bytes, (self.to_bytes(),)
 
     @property
     def height(self):
@@ -105,3 +479,96 @@ class Grid(Observable):
         relationship
         """
         return "|" if point.has_relationship(Direction.SOUTH) else " "
+
+
+class ChildChange(
+    collections.namedtuple(
+        "ChildChange",
+        ("point", "previous_child", "child", "sequence"),
+    ),
+):
+    """
+    Describes a single change of the child of a point of a grid.
+
+    Attributes:
+        point (Point): The point whose child was set.
+        previous_child (Point): The child of the point prior to the change, if any,
+            otherwise None.
+        child (Point): The child of the point following the change, if any,
+            otherwise None.
+        sequence (int): The position of the change among all changes published by
+            the grid, starting from one.
+    """
+
+    __slots__ = ()
+
+
+@functools.lru_cache(maxsize=128)
+def get_zobrist_keys(height, length):
+    """
+    Returns the Zobrist keys of a grid with the given dimensions.
+
+    The keys are drawn from a random number generator seeded by the shape of the grid,
+    so they are the same for all grids of the same shape, even across processes.
+
+    Args:
+        height (int): The number of rows of the grid.
+        length (int): The number of columns of the grid.
+
+    Returns:
+        tuple: For each point of the grid, in row-major order, a tuple of random
+            64-bit keys, one for a link to a child in each direction, in the order
+            specified by the Direction enum.
+    """
+    generator = random.Random(f"{height}x{length}")
+    return tuple(
+        tuple(generator.getrandbits(64) for _ in Direction)
+        for _ in range(height * length)
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def get_layout_key(layout):
+    """
+    Returns the Zobrist key of a grid with the given layout.
+
+    The key is drawn from a random number generator seeded by the layout itself, so it
+    is the same for all grids of the same puzzle, even across processes.
+
+    Args:
+        layout (bytes): The type of each point of the grid, in row-major order, as
+            signed bytes.
+
+    Returns:
+        int: A random 64-bit key.
+    """
+    return random.Random(layout).getrandbits(64)
+
+
+@functools.lru_cache(maxsize=128)
+def get_adjacency(height, length):
+    """
+    Returns the adjacency table of a grid with the given dimensions.
+
+    Since this table depends only on the shape of a grid, it is computed once and then
+    shared by all grids of the same shape.
+
+    Args:
+        height (int): The number of rows of the grid.
+        length (int): The number of columns of the grid.
+
+    Returns:
+        tuple: For each point of the grid, in row-major order, a tuple of the
+            row-major indexes of its neighbors in the order specified by the
+            Direction enum, with None in place of each neighbor that does not exist.
+    """
+    return tuple(
+        tuple(
+            (i + di) * length + (j + dj)
+            if 0 <= i + di < height and 0 <= j + dj < length
+            else None
+            for di, dj in (direction.value for direction in Direction)
+        )
+        for i in range(height)
+        for j in range(length)
+    )
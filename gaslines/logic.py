@@ -68,6 +68,87 @@ def partial_recursive(grid):
     return False
 
 
+def iterative(grid, current=None, option=None, prune=None, order=None):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    Explores the grid in exactly the same order as the "full_recursive" strategy, but
+    keeps its own stack of frames rather than recursing, so the depth of the search is
+    not limited by Python's recursion limit. Each frame pairs a point with the index
+    of its next untested neighbor, so resuming a point never has to search for its
+    current child among its neighbors.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        current (Point): A head of the grid from which to begin the search. If set,
+            only extensions of the grid beyond its current state are searched, in the
+            same manner as a recursive call of "full_recursive". Defaults to None.
+        option (function): A predicate, with the same signature as "is_option", that
+            determines which neighbors of a head are worth considering as its child.
+            Stricter predicates may be provided to prune the search. Defaults to
+            "is_option" itself.
+        prune (callable): An optional pruning stage, called with the grid and the
+            point whose child was just set after every move, that returns whether the
+            grid can be recognized as unsolvable in its new state, in which case the
+            move is immediately retracted. Defaults to None.
+        order (function): An optional ordering policy, called with a head and its
+            neighbors, that returns those neighbors in the order in which they should
+            be tried as its child. Since the search resumes each head by position, the
+            order must depend only on the state of the head itself, which does not
+            change while it is a head. Defaults to the order specified by the
+            Direction enum.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    option = is_option if option is None else option
+    stack = []
+    start = 0
+    while True:
+        if current is None or current.is_sink():
+            # A grid with no remaining heads is already in a solved state
+            if not has_head(grid):
+                return True
+            current, start = get_head(grid), 0
+        # Reset the child of "current" with the next candidate
+        neighbors = current.get_neighbors()
+        if order is not None:
+            neighbors = order(current, neighbors)
+        index = get_next_index(current, neighbors, start, option)
+        if index is None:
+            current.child = None
+            # Backtrack to the most recent point with untested neighbors, if any
+            if not stack:
+                return False
+            current, start = stack.pop()
+            continue
+        next_ = neighbors[index]
+        current.child = next_
+        # Move on to the next candidate if the grid is now recognizably unsolvable
+        if prune is not None and prune(grid, current):
+            start = index + 1
+            continue
+        # Continue the search from "next_", remembering where to resume "current"
+        stack.append((current, index + 1))
+        current, start = next_, 0
+
+
+def get_next_index(current, neighbors, start, option=None):
+    """
+    Returns the index of the first neighbor of "current", at or after the given
+    index, that is worth considering as its child (according to the given predicate,
+    which defaults to "is_option"), or None if no such neighbor exists.
+    """
+    option = is_option if option is None else option
+    for index in range(start, len(neighbors)):
+        if option(current, neighbors[index]):
+            return index
+    return None
+
+
 def get_next(current):
     """
     Returns a valid neighbor of "current", in the current recursive state, that has
@@ -78,12 +159,9 @@ def get_next(current):
     # Get the index of the previously tested neighbor, the current child of "current"
     child_index = -1 if not current.has_child() else neighbors.index(current.child)
     # All untested neighbors occur strictly after the previously tested neighbor
-    untested_neighbors = neighbors[child_index + 1 :]
     # Return the first of the untested neighbors that is worth considering
-    for neighbor in untested_neighbors:
-        if is_option(current, neighbor):
-            return neighbor
-    return None
+    index = get_next_index(current, neighbors, child_index + 1)
+    return None if index is None else neighbors[index]
 
 
 def is_option(current, neighbor):
@@ -106,16 +184,12 @@ def get_head(grid):
     """
     Returns any head point on the grid if at least one exists, otherwise None.
 
-    Implementation-wise, this method searches for heads from right to left and top to
-    bottom.
+    Implementation-wise, this method returns the first head from left to right and top
+    to bottom, as kept track of by the grid itself.
     """
-    for row in grid:
-        for point in row:
-            if point.is_head():
-                return point
-    return None
+    return grid.get_head()
 
 
 def has_head(grid):
     """Returns whether the given grid currently has a head."""
-    return get_head(grid) is not None
+    return grid.has_head()
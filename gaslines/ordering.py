@@ -0,0 +1,61 @@
+"""
+Module that holds neighbor-ordering policies for the search algorithms, as well as the
+"ordered" algorithm, which uses them.
+"""
+
+
+import functools
+
+from gaslines.bounds import get_segment_bounds
+from gaslines.logic import iterative
+
+
+def ordered(grid):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles that tries the
+    neighbors of each head in order of how closely their segment bounds match the
+    segments they would have remaining.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    order = functools.partial(order_by_slack, get_segment_bounds(grid))
+    return iterative(grid, order=order)
+
+
+def order_by_slack(bounds, current, neighbors):
+    """
+    Returns the given neighbors of current ordered by their "slack", i.e., by how far
+    the segments they would have remaining as the child of current are from the fewest
+    segments they need to reach a sink, and then with straight moves before turns.
+
+    A path must use up exactly its remaining segments, so neighbors from which a sink
+    is (at best) reachable in that many segments are the most promising. Ties are kept
+    in the order specified by the Direction enum. Since the order depends only on the
+    state of current and on the (fixed) segment bounds, it is stable across retries.
+
+    Args:
+        bounds (tuple): The segment bounds of the grid, as returned by
+            `get_segment_bounds`.
+        current (Point): A head of the grid.
+        neighbors (tuple): The neighbors of "current", as returned by `get_neighbors`.
+
+    Returns:
+        tuple: The neighbors, in the order in which they should be tried.
+    """
+    adjacent_indexes = current.grid.adjacency[current.index]
+    remaining_segments = current.remaining_segments
+
+    def get_key(neighbor):
+        direction = adjacent_indexes.index(neighbor.index)
+        is_turn = neighbor.is_on_different_segment(current)
+        slack = abs(remaining_segments - is_turn - bounds[neighbor.index][direction])
+        return slack, is_turn
+
+    return tuple(sorted(neighbors, key=get_key))
@@ -0,0 +1,212 @@
+"""
+Module that holds the "parallel" algorithm for solving Gas Lines puzzles, which splits
+the search tree of a single puzzle among a pool of worker processes, as well as helper
+functions for that algorithm, some of which run within the workers.
+"""
+
+
+import concurrent.futures
+import multiprocessing
+
+from gaslines.grid import Grid
+from gaslines.logic import get_head, is_option, iterative
+from gaslines.utility import get_periodic_check
+
+
+# Number of mutations between checks of whether a worker's search has been cancelled
+CANCELLATION_INTERVAL = 256
+
+# Event shared by all workers of a pool, set once their searches are to be cancelled,
+# which is set per worker by `initialize_worker` and so is not a constant
+_cancellation = None  # pylint: disable=C0103
+
+
+class Cancelled(Exception):
+    """Raised within a worker to abandon a search that is no longer needed."""
+
+
+def parallel(grid, jobs=None, depth=3, deterministic=True):
+    """
+    A parallel approach to solving Gas Lines puzzles, which splits the search tree of
+    the "iterative" strategy among a pool of worker processes.
+
+    Mutates the grid object provided to record a solution and returns True once a
+    solution has been found or False if no solution exists.
+
+    The first few levels of the search tree are expanded in the same order as the
+    "iterative" strategy would explore them, yielding a subproblem per node at the
+    given depth. Each subproblem is sent to a worker as a description of the grid and
+    the moves leading to the node, from which the worker rebuilds the grid and then
+    searches only extensions of it. Once the outcome is known, every remaining search
+    is cancelled. The grid itself is only mutated once a solution has been found.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        jobs (int): The number of worker processes. Defaults to the number of CPUs.
+        depth (int): The number of levels of the search tree to expand before
+            handing subproblems to the workers. Defaults to three.
+        deterministic (bool): Whether to return the same solution as the "iterative"
+            strategy, by accepting a solution only once all subproblems that precede
+            it have been exhausted. If False, the first solution found by any worker
+            is accepted, which may be sooner but may differ from run to run for
+            puzzles with several solutions. Defaults to True.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    description, links = grid.describe(), grid.get_links()
+    # Expand the search tree on a copy of the grid, unbeknownst to its observers
+    subproblems = split(Grid.rebuild(description, links), depth)
+    if not subproblems:
+        return False
+    cancellation = multiprocessing.Event()
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=initialize_worker,
+        initargs=(cancellation,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                solve_subproblem,
+                description,
+                links + moves,
+                current_index,
+            )
+            for moves, current_index in subproblems
+        ]
+        try:
+            solution = get_first_solution(futures, deterministic)
+        finally:
+            # Stop every search that is still pending or running
+            cancellation.set()
+            for future in futures:
+                future.cancel()
+    if solution is None:
+        return False
+    grid.apply_moves(
+        (link for link in solution if grid.get_point(link[0]).child is None),
+    )
+    return True
+
+
+def get_first_solution(futures, deterministic=True):
+    """
+    Returns the first solution among the results of the given futures, or None if
+    there is none, as part of the "parallel" algorithm.
+
+    Args:
+        futures (list): Futures of the results of `solve_subproblem`, in the order in
+            which their subproblems occur in the search tree.
+        deterministic (bool): Whether the first solution is the first in the order
+            of the futures, rather than the first to be found.
+    """
+    if not deterministic:
+        futures = concurrent.futures.as_completed(futures)
+    for future in futures:
+        links = future.result()
+        if links is not None:
+            return links
+    return None
+
+
+def split(grid, depth):
+    """
+    Expands the search tree of the "iterative" strategy, from the current state of
+    the given grid, down to the given depth.
+
+    The grid is mutated along the way but is restored to its original state.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        depth (int): The number of moves after which to stop expanding.
+
+    Returns:
+        list: The subproblems, i.e., the nodes of the search tree at the given depth
+            or, where the grid is solved sooner, at that earlier depth, in the order
+            in which the "iterative" strategy would visit them. Each subproblem is an
+            ordered pair of its moves, as ordered pairs of the row-major indexes of a
+            point and of its new child, and of the index of the point from which the
+            search resumes (i.e., the last child set), or None if no move was made.
+    """
+    subproblems = []
+    moves = []
+    # Each frame holds a head, its neighbors and the position of its next neighbor
+    frames = []
+    current = None
+    while True:
+        if len(moves) == depth or (
+            (current is None or current.is_sink()) and not grid.has_head()
+        ):
+            subproblems.append(
+                (tuple(moves), None if current is None else current.index),
+            )
+        else:
+            if current is None or current.is_sink():
+                current = get_head(grid)
+            frames.append((current, current.get_neighbors(), [0]))
+        # Move on to the next option of the most recent head with untested options
+        current = advance(frames, moves)
+        if current is None and not frames:
+            return subproblems
+
+
+def advance(frames, moves):
+    """
+    Helper function for `split` that sets the child of the most recent head with
+    untested options to its next option, backtracking as necessary.
+
+    Returns:
+        Point: The new child, or None once every head has been exhausted.
+    """
+    while frames:
+        head, neighbors, position = frames[-1]
+        if moves and moves[-1][0] == head.index:
+            moves.pop()
+        while position[0] < len(neighbors):
+            neighbor = neighbors[position[0]]
+            position[0] += 1
+            if is_option(head, neighbor):
+                head.child = neighbor
+                moves.append((head.index, neighbor.index))
+                return neighbor
+        head.child = None
+        frames.pop()
+    return None
+
+
+def initialize_worker(cancellation):
+    """Stores the shared cancellation event within a newly started worker."""
+    global _cancellation  # pylint: disable=C0103,W0603
+    _cancellation = cancellation
+
+
+def solve_subproblem(description, moves, current_index):
+    """
+    Rebuilds a grid from the given description and moves and then searches every
+    extension of it with the "iterative" strategy, resuming from the point at the
+    given index, within a worker of the "parallel" algorithm.
+
+    Returns:
+        tuple: The links of the solution found, as ordered pairs of the row-major
+            indexes of each point with a child and of its child, or None if no
+            solution was found or the search was cancelled.
+    """
+    grid = Grid.rebuild(description, moves)
+    if _cancellation is not None:
+        grid.register(get_cancellation_check(_cancellation))
+    current = None if current_index is None else grid.get_point(current_index)
+    try:
+        if not iterative(grid, current=current):
+            return None
+    except Cancelled:
+        return None
+    return grid.get_links()
+
+
+def get_cancellation_check(cancellation, interval=None):
+    """
+    Returns an observer that raises Cancelled, once every given number of calls
+    (defaulting to CANCELLATION_INTERVAL), if the given event has been set.
+    """
+    interval = CANCELLATION_INTERVAL if interval is None else interval
+    return get_periodic_check(cancellation.is_set, Cancelled, interval)
@@ -7,7 +7,14 @@ single point on the grid of a Gas Lines puzzle.
 from gaslines.utility import Direction, Observable
 
 
-class Point(Observable):
+# Each direction, and its position, in the order specified by the Direction enum
+DIRECTIONS = tuple(Direction)
+DIRECTION_INDEXES = {direction: index for index, direction in enumerate(DIRECTIONS)}
+
+
+# Each point caches its own path state and neighbors, and its public interface is
+# shared with ArrayPoint, so neither can be trimmed to pylint's default limits
+class Point(Observable):  # pylint: disable=R0902,R0904
     """
     Represents a single lattice point in a Gas Lines puzzle grid
     """
@@ -17,11 +24,36 @@ class Point(Observable):
     PIPE = -1
     SINK = 0
 
+    __slots__ = (
+        "_grid",
+        "_location",
+        "_type",
+        "_child",
+        "_parent",
+        "_parents",
+        "_incoming_direction",
+        "_remaining_segments",
+        "_index",
+        "_neighbors",
+    )
+
     def __init__(self, grid, location, type_=PIPE):
         self._grid = grid
         self._location = location
         self._type = type_
         self._child = None
+        # Points with this point as their child, maintained by the `child` setter
+        # Only sinks may have multiple parents, so only sinks need a set of them
+        self._parent = None
+        self._parents = set() if self.is_sink() else None
+        # Path state derived from the parent, maintained by the `child` setter
+        # Directions are stored as indexes into the order of the Direction enum
+        self._incoming_direction = None
+        self._remaining_segments = type_ if self.is_source() else None
+        # Row-major index and adjacent points are provided by the grid via `link`,
+        # which also sets the location of a point created without one
+        self._index = None
+        self._neighbors = ()
 
     @property
     def grid(self):
@@ -48,6 +80,22 @@ class Point(Observable):
         """Returns the column index of the point in the grid."""
         return self.location[1]
 
+    @property
+    def index(self):
+        """
+        Returns the row-major index of the point in the grid, or None if the point has
+        not been linked to a grid.
+        """
+        return self._index
+
+    @property
+    def type(self):
+        """
+        Returns the type of the point, i.e., its number of segments if it is a source,
+        otherwise either Point.SINK or Point.PIPE.
+        """
+        return self._type
+
     def is_source(self):
         """Returns whether the point is a 'source' point."""
         return self._type > 0
@@ -67,23 +115,110 @@ class Point(Observable):
     @Observable.observe
     def child(self, point):
         """Sets this point's child to the given point."""
+        previous = self._child
+        # Points keep the parent records of their children, which are private to
+        # points and deliberately kept out of the public interface
+        if previous is not None:
+            previous._remove_parent(self)  # pylint: disable=W0212
         self._child = point
+        if point is not None:
+            point._add_parent(self)  # pylint: disable=W0212
+        # Let the grid (if any) update its own records and notify its own observers
+        if self._index is not None:
+            self._grid.update(self, previous)
+
+    def _add_parent(self, point):
+        """Records the given point as a parent of this one."""
+        if self._parents is not None:
+            self._parents.add(point)
+        else:
+            self._parent = point
+            self._refresh_path()
+
+    def _remove_parent(self, point):
+        """Records that the given point is no longer a parent of this one."""
+        if self._parents is not None:
+            self._parents.discard(point)
+        elif self._parent is point:
+            self._parent = None
+            self._refresh_path()
+
+    def _refresh_path(self):
+        """
+        Recomputes the incoming direction and remaining segments of this point from
+        those of its parent, and then likewise for its descendants.
+
+        The descendants need only be visited while the recomputed values differ from
+        the stored ones, so during a search, where paths only grow or shrink at their
+        heads, this takes constant time.
+        """
+        # The path state of each point is private to points, so it is read and
+        # written directly here rather than exposed in the public interface
+        # pylint: disable=W0212
+        point = self
+        while point is not None and not point.is_source() and not point.is_sink():
+            parent = point._parent
+            if parent is None:
+                incoming_direction = remaining_segments = None
+            else:
+                incoming_direction = parent._get_direction_index(point)
+                remaining_segments = parent._remaining_segments
+                if remaining_segments is not None:
+                    remaining_segments -= point.is_on_different_segment(parent)
+            path_state = (incoming_direction, remaining_segments)
+            if path_state == (point._incoming_direction, point._remaining_segments):
+                break
+            point._incoming_direction, point._remaining_segments = path_state
+            point = point.child
 
     def has_child(self):
         """Returns whether this point has a child."""
         return self.child is not None
 
+    def link(self, index, neighbors):
+        """
+        Sets the row-major index of this point in its grid and the points adjacent to
+        this one.
+
+        This method is intended to be called only once, by the grid to which this
+        point belongs, upon construction of that grid. Once linked, this point keeps
+        its grid informed of changes to its child, so that the grid may in turn
+        notify its own observers.
+
+        Args:
+            index (int): The row-major index of this point in its grid.
+            neighbors (tuple): The points adjacent to this one, in the order specified
+                by the Direction enum, skipping directions for which no such neighbor
+                exists.
+        """
+        self._index = index
+        self._neighbors = neighbors
+        # The location of a point linked to a grid is derived from its index once
+        self._location = divmod(index, self._grid.length)
+
+    def _get_direction_index(self, neighbor):
+        """
+        Returns the index of the direction, in the order specified by the Direction
+        enum, in which the given point neighbors this one, or None if it does not
+        """
+        if self._index is None:
+            return None
+        adjacent_indexes = self._grid.adjacency[self._index]
+        for index, adjacent_index in enumerate(adjacent_indexes):
+            if adjacent_index is not None and adjacent_index == neighbor.index:
+                return index
+        return None
+
     def get_neighbor(self, direction):
         """
         Returns the point adjacent to this one in the direction specified if one
         exists, otherwise None
         """
-        # Get the hypothetical location of the neighbor
-        # Pairwise add this point's location to the direction vector
-        i, j = tuple(sum(vectors) for vectors in zip(self.location, direction.value))
-        grid = self.grid
-        # Get the neighbor only if that location is actually on the grid
-        return grid[i][j] if 0 <= i < grid.height and 0 <= j < grid.length else None
+        if self._index is None:
+            return None
+        grid = self._grid
+        adjacent_index = grid.adjacency[self._index][DIRECTION_INDEXES[direction]]
+        return None if adjacent_index is None else grid.points[adjacent_index]
 
     def has_neighbor(self, direction):
         """Returns whether this point has a neighbor in the given direction."""
@@ -97,11 +232,7 @@ class Point(Observable):
 
         The specified Direction enum order is NORTH, EAST, SOUTH, WEST
         """
-        return tuple(
-            self.get_neighbor(direction)
-            for direction in Direction
-            if self.has_neighbor(direction)
-        )
+        return self._neighbors
 
     def has_relationship(self, direction):
         """
@@ -126,10 +257,19 @@ class Point(Observable):
         # It doesn't make sense to request the parent of a sink
         if self.is_sink():
             return None
-        for neighbor in self.get_neighbors():
-            if neighbor.child is self:
-                return neighbor
-        return None
+        return self._parent
+
+    @property
+    def parents(self):
+        """
+        Returns the set of all points with this as their child
+
+        Unlike the parent property, this also applies to sinks, which may have any
+        number of parents
+        """
+        if self._parents is not None:
+            return frozenset(self._parents)
+        return frozenset(() if self._parent is None else (self._parent,))
 
     def has_parent(self):
         """Returns whether this point has a parent."""
@@ -165,11 +305,23 @@ class Point(Observable):
         """
         # The first segment after a source point is considered a "freebie"
         # Non-source neighbors without parents are irrelevant
-        if not neighbor.has_parent():
+        # The path state of the neighbor is private to points, as in `_refresh_path`
+        # pylint: disable=W0212
+        incoming_direction = neighbor._incoming_direction
+        if incoming_direction is None:
             return False
-        # Check whether this is in a different row from the parent of its neighbor
-        # Use of row over column was an arbitrary decision
-        return abs(neighbor.parent.row_index - self.row_index) == 1
+        # Check whether the path turns from the neighbor's incoming direction
+        return neighbor._get_direction_index(self) != incoming_direction
+
+    @property
+    def incoming_direction(self):
+        """
+        Returns the direction from this point's parent to this point, or None if this
+        point has no parent (which is always the case for sources and sinks)
+        """
+        if self._incoming_direction is None:
+            return None
+        return DIRECTIONS[self._incoming_direction]
 
     @property
     def remaining_segments(self):
@@ -180,12 +332,8 @@ class Point(Observable):
         # It doesn't make sense to request the remaining segments of an open point
         if self.is_open():
             return None
-        # Base case: number of remaining segments is fixed if the point is a source
-        if self.is_source():
-            return self._type
-        # Recursive case: remaining segments of parent, minus one if on new segment
-        parent = self.parent
-        return parent.remaining_segments - self.is_on_different_segment(parent)
+        # Remaining segments are derived from the parent whenever the parent changes
+        return self._remaining_segments
 
     def __str__(self):
         """
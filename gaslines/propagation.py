@@ -0,0 +1,177 @@
+"""
+Module that holds the "propagating" algorithm for solving Gas Lines puzzles, which
+applies every forced move before branching, as well as helper functions for that
+algorithm.
+"""
+
+
+from gaslines.logic import get_head, is_option
+
+
+def propagating(grid, option=None, select=None, order=None, table=None):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles that only branches
+    on heads with more than one option.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    Before each branch, every head with exactly one option is extended by it, over and
+    over until no such head remains (as in unit propagation), and the search backtracks
+    immediately if any head is left without options. Since every head must eventually
+    be extended, these moves are forced, so they are recorded as a single batch that is
+    undone as a whole when the search backtracks past the branch that led to them.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        option (function): A predicate, with the same signature as "is_option", that
+            determines which neighbors of a head are worth considering as its child.
+            Defaults to "is_option" itself.
+        select (function): A head-selection policy, which returns the head of the
+            given grid on which to branch next. Defaults to selecting the first head
+            in row-major order, as kept track of by the grid itself.
+        order (function): An optional ordering policy, with the same signature and
+            requirements as the `order` argument of the "iterative" strategy, that
+            determines the order in which the options of a head are tried.
+        table (TranspositionTable): An optional table of the Zobrist hashes of states
+            known to be unsolvable, which is consulted after each branch, so that such
+            states are not searched again, and to which every state found to be
+            unsolvable is added. Defaults to None.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    option = is_option if option is None else option
+    select = get_head if select is None else select
+    # The forced moves made prior to any branch
+    forced_moves = propagate(grid, option)
+    if forced_moves is None:
+        return False
+    if table is not None and grid.zobrist_hash in table:
+        undo_moves(forced_moves)
+        return False
+    # Each frame holds a branching head, the index of its next untested neighbor, the
+    # forced moves made after its current child was set and the number of branches
+    # taken before it was selected
+    stack = []
+    current = None
+    start, branches, entered = 0, 0, 0
+    while True:
+        if current is None:
+            # A grid with no remaining heads is already in a solved state
+            if not grid.has_head():
+                return True
+            current, start, entered = select(grid), 0, branches
+        candidates = get_candidates(current, start, order)
+        branch = try_options(grid, current, candidates, option, table)
+        if branch is not None:
+            position, moves = branch
+            branches += 1
+            stack.append((current, position + 1, moves, entered))
+            current = None
+        else:
+            current.child = None
+            # Every branch on "current" failed, so the state it was selected in is
+            # unsolvable, as witnessed by all branches taken since
+            if table is not None:
+                table.add(grid.zobrist_hash, branches - entered)
+            # Backtrack to the most recent branch with untested alternatives, if any
+            if not stack:
+                undo_moves(forced_moves)
+                return False
+            current, start, moves, entered = stack.pop()
+            undo_moves(moves)
+
+
+def get_candidates(current, start, order=None):
+    """
+    Returns the neighbors of the given head, at or after the given position among its
+    (ordered) neighbors, each paired with that position.
+
+    Args:
+        current (Point): A head of a grid.
+        start (int): The position of the first neighbor to return.
+        order (function): An optional ordering policy for the neighbors of the head.
+
+    Returns:
+        Iterable: Ordered pairs of a position and the neighbor at that position.
+    """
+    neighbors = current.get_neighbors()
+    if order is not None:
+        neighbors = order(current, neighbors)
+    return enumerate(neighbors[start:], start)
+
+
+def try_options(grid, current, candidates, option, table=None):
+    """
+    Sets the child of the given head to its first option among the given candidates,
+    after which propagation succeeds and the grid is not in a state known to be
+    unsolvable, as part of the "propagating" algorithm.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        current (Point): A head of the grid.
+        candidates (Iterable): The neighbors of the head left to try, in order, each
+            paired with its position among the (ordered) neighbors of the head.
+        option (function): A predicate, with the same signature as "is_option", that
+            determines which neighbors of a head are worth considering as its child.
+        table (TranspositionTable): An optional table of unsolvable states.
+
+    Returns:
+        tuple: The position of the neighbor that was set as the child of the head and
+            the forced moves that followed, or None if no such neighbor remains.
+    """
+    for position, neighbor in candidates:
+        if not option(current, neighbor):
+            continue
+        current.child = neighbor
+        moves = propagate(grid, option)
+        if moves is None:
+            continue
+        # Skip states that are already known to be unsolvable
+        if table is not None and grid.zobrist_hash in table:
+            undo_moves(moves)
+            continue
+        return position, moves
+    return None
+
+
+def propagate(grid, option=None):
+    """
+    Repeatedly extends every head of the given grid that has exactly one option, until
+    no such head remains.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        option (function): A predicate, with the same signature as "is_option", that
+            determines which neighbors of a head are worth considering as its child.
+            Defaults to "is_option" itself.
+
+    Returns:
+        list: The points whose children were set, in order, or None if some head was
+            found to have no options at all, in which case every move made has
+            already been undone.
+    """
+    option = is_option if option is None else option
+    moves = []
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for head in grid.heads:
+            options = [
+                neighbor for neighbor in head.get_neighbors() if option(head, neighbor)
+            ]
+            if not options:
+                undo_moves(moves)
+                return None
+            if len(options) == 1:
+                head.child = options[0]
+                moves.append(head)
+                is_changed = True
+    return moves
+
+
+def undo_moves(moves):
+    """Resets the children of the given points, in the reverse order of the moves."""
+    for point in reversed(moves):
+        point.child = None
@@ -0,0 +1,123 @@
+"""
+Module that holds a pruning stage for the search algorithms that detects heads that
+can no longer reach any sink, as well as the "reachable" algorithm, which uses it.
+"""
+
+
+import collections
+
+from gaslines.logic import iterative
+
+
+def reachable(grid):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles that retracts every
+    move after which some head can no longer reach any sink through open points.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    Explores the grid in the same order as the "iterative" strategy, skipping only
+    subtrees that contain no solution, so both strategies find the same solution.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    return iterative(grid, prune=Reachability())
+
+
+# Instances are called as pruning stages, so `__call__` is their only public method
+class Reachability:  # pylint: disable=R0903
+    """
+    A pruning stage that determines whether any head of a grid has been walled in by
+    the paths drawn on it, such that it can no longer reach any sink through open
+    points.
+
+    To keep each check cheap, a "witness" path of open points to a sink is remembered
+    for each head. Since each move closes exactly one point, only witnesses through
+    that point need to be discarded, and only heads without a witness need to be
+    searched from, while reopening points never invalidates a witness. Instances are
+    meant to be passed as the `prune` argument of the "iterative" strategy.
+    """
+
+    def __init__(self):
+        # Witnesses by the index of their head, and heads by the indexes they visit
+        self._witnesses = {}
+        self._heads_by_index = collections.defaultdict(set)
+
+    def __call__(self, grid, point):
+        """
+        Returns whether some head of the grid can no longer reach any sink after the
+        child of the given point was set.
+
+        Args:
+            grid (Grid): A Gas Lines grid.
+            point (Point): The point of the grid whose child was just set.
+        """
+        child = point.child
+        if child is not None and not child.is_sink():
+            # The moved head's witness continues from its child if it passed through
+            witness = self._witnesses.get(point.index)
+            if witness and witness[0] == child.index:
+                self._remember(child.index, witness[1:])
+            # Discard every witness that passed through the newly closed point
+            for head_index in tuple(self._heads_by_index.get(child.index, ())):
+                self._forget(head_index)
+        for head in grid.heads:
+            if head.index not in self._witnesses:
+                witness = find_witness(grid, head)
+                if witness is None:
+                    return True
+                self._remember(head.index, witness)
+        return False
+
+    def _remember(self, head_index, witness):
+        """Stores the given witness of the head at the given index."""
+        self._forget(head_index)
+        self._witnesses[head_index] = witness
+        for index in witness:
+            self._heads_by_index[index].add(head_index)
+
+    def _forget(self, head_index):
+        """Discards the witness, if any, of the head at the given index."""
+        for index in self._witnesses.pop(head_index, ()):
+            self._heads_by_index[index].discard(head_index)
+
+
+def find_witness(grid, head):
+    """
+    Searches, breadth first, for a path of open points from the given head to a sink.
+
+    Args:
+        grid (Grid): A Gas Lines grid.
+        head (Point): A head of the grid.
+
+    Returns:
+        tuple: The row-major indexes of the points along the shortest such path,
+            excluding the head and ending with a sink, or None if no such path exists.
+    """
+    adjacency = grid.adjacency
+    # The point from which each visited point was first reached
+    previous_indexes = {head.index: None}
+    queue = collections.deque((head.index,))
+    while queue:
+        index = queue.popleft()
+        for neighbor_index in adjacency[index]:
+            if neighbor_index is None or neighbor_index in previous_indexes:
+                continue
+            neighbor = grid.get_point(neighbor_index)
+            if not neighbor.is_open():
+                continue
+            previous_indexes[neighbor_index] = index
+            if neighbor.is_sink():
+                # Retrace the path back to the head
+                witness = []
+                while neighbor_index != head.index:
+                    witness.append(neighbor_index)
+                    neighbor_index = previous_indexes[neighbor_index]
+                return tuple(reversed(witness))
+            queue.append(neighbor_index)
+    return None
@@ -0,0 +1,575 @@
+"""
+Module that holds the "sat" algorithm for solving Gas Lines puzzles, which encodes a
+grid as a Boolean satisfiability problem in conjunctive normal form (CNF), as well as
+the CDCLSolver class, a pure-Python solver for such problems, and helper functions.
+"""
+
+
+import collections
+import heapq
+import itertools
+import os
+import shutil
+import subprocess
+import tempfile
+
+
+# Installed SAT solvers to look for, in order of preference, all of which accept a
+# DIMACS file as their argument and report in the format of the SAT competitions
+EXECUTABLES = ("kissat", "cadical")
+
+
+def sat(grid, executable=None):
+    """
+    An approach to solving Gas Lines puzzles by reduction to Boolean satisfiability.
+
+    Mutates the grid object provided to record a solution and returns True once a
+    solution has been found or False if no solution exists.
+
+    The grid is encoded as CNF by `encode`, the CNF is solved either by an installed
+    SAT solver or by the built-in CDCLSolver, and the satisfying assignment found, if
+    any, is decoded back into the children of the points of the grid. The grid itself
+    is only mutated once a solution has been found.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        executable (str): The name or path of a SAT solver executable to use, as
+            described by `solve_dimacs`. Defaults to the first of EXECUTABLES that is
+            installed, if any, otherwise the built-in solver is used.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    variable_count, clauses, links = encode(grid)
+    executable = find_executable() if executable is None else executable
+    if executable is None:
+        model = CDCLSolver(variable_count, clauses).solve()
+    else:
+        model = solve_dimacs(executable, variable_count, clauses)
+    if model is None:
+        return False
+    grid.apply_moves(
+        (
+            link
+            for variable, link in links.items()
+            if model[variable] and grid.get_point(link[0]).child is None
+        ),
+    )
+    return True
+
+
+def find_executable():
+    """Returns the path of the first of EXECUTABLES that is installed, if any."""
+    for name in EXECUTABLES:
+        path = shutil.which(name)
+        if path is not None:
+            return path
+    return None
+
+
+def encode(grid):
+    """
+    Encodes the given grid as a CNF formula that is satisfiable if and only if the
+    grid can be solved in its current state.
+
+    There is one variable per potential link from a point to a neighbor, i.e., per
+    directed edge of the grid that neither leaves a sink nor enters a source, and one
+    variable per pipe and number of remaining segments. The clauses require that:
+
+    - each source has exactly one child and each sink has none;
+    - each pipe has at most one parent and at most one child, and has a child if and
+      only if it has a parent;
+    - each pipe with a parent has at least one, and at most one, number of remaining
+      segments, which is determined by its parent in the same manner as for points,
+      i.e., decreasing by one with every turn, such that no path runs out of segments
+      before reaching a sink and every path reaches a sink on its last segment; and
+    - each link already present in the grid is kept.
+
+    As the remaining segments strictly decrease around any loop, which must turn,
+    these clauses also rule out loops of pipes detached from any source.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+
+    Returns:
+        tuple: The number of variables, the clauses, each a list of nonzero integers
+            in the DIMACS convention, and a dictionary mapping each link variable to
+            the ordered pair of the row-major indexes of the point and its child.
+    """
+    encoding = Encoding(
+        grid.adjacency,
+        tuple(point.type for point in grid.points),
+        {},
+        {},
+    )
+    create_link_variables(encoding)
+    create_segment_variables(encoding)
+    clauses = []
+    for index, type_ in enumerate(encoding.types):
+        if type_ > 0:
+            clauses.extend(encode_source(encoding, index, type_))
+        elif type_ < 0:
+            clauses.extend(encode_pipe(encoding, index))
+    # Keep every link already present in the grid
+    for point in grid.points:
+        if point.has_child():
+            clauses.append([encoding.link_variables[point.index, point.child.index]])
+    variable_count = len(encoding.link_variables) + len(encoding.segment_variables)
+    links = {variable: link for link, variable in encoding.link_variables.items()}
+    return variable_count, clauses, links
+
+
+class Encoding(
+    collections.namedtuple(
+        "Encoding",
+        ("adjacency", "types", "link_variables", "segment_variables"),
+    ),
+):
+    """
+    Describes the variables of the encoding of a grid, as built up by `encode`.
+
+    Attributes:
+        adjacency (tuple): The adjacency table of the grid.
+        types (tuple): The type of each point of the grid, in row-major order.
+        link_variables (dict): The variable of each link, by the ordered pair of the
+            row-major indexes of the point and its child.
+        segment_variables (dict): The variable of each pipe and number of remaining
+            segments, by the ordered pair of the two.
+    """
+
+    __slots__ = ()
+
+    @property
+    def maximum_segments(self):
+        """Returns the largest number of segments of any source."""
+        return max(self.types, default=0)
+
+
+def create_link_variables(encoding):
+    """Creates a variable per link that leaves no sink and enters no source."""
+    for index, adjacent_indexes in enumerate(encoding.adjacency):
+        if encoding.types[index] == 0:
+            continue
+        for neighbor in adjacent_indexes:
+            if neighbor is not None and encoding.types[neighbor] <= 0:
+                variable = len(encoding.link_variables) + 1
+                encoding.link_variables[index, neighbor] = variable
+
+
+def create_segment_variables(encoding):
+    """Creates a variable per pipe and possible number of remaining segments."""
+    for index, type_ in enumerate(encoding.types):
+        if type_ < 0:
+            for segments in range(1, encoding.maximum_segments + 1):
+                variable = len(encoding.link_variables)
+                variable += len(encoding.segment_variables) + 1
+                encoding.segment_variables[index, segments] = variable
+
+
+def get_children(encoding, index):
+    """Returns the pairs of neighbor indexes and link variables of a point."""
+    return [
+        (neighbor, encoding.link_variables[index, neighbor])
+        for neighbor in encoding.adjacency[index]
+        if (index, neighbor) in encoding.link_variables
+    ]
+
+
+def get_parents(encoding, index):
+    """Returns the pairs of neighbor indexes and link variables into a point."""
+    return [
+        (neighbor, encoding.link_variables[neighbor, index])
+        for neighbor in encoding.adjacency[index]
+        if (neighbor, index) in encoding.link_variables
+    ]
+
+
+def encode_exactly_one(variables, at_least_one=True):
+    """Returns clauses requiring that exactly (or at most) one variable is true."""
+    clauses = [list(variables)] if at_least_one else []
+    for first, second in itertools.combinations(variables, 2):
+        clauses.append([-first, -second])
+    return clauses
+
+
+def encode_source(encoding, index, segments):
+    """Returns the clauses of the source at the given index."""
+    children = get_children(encoding, index)
+    clauses = encode_exactly_one([variable for _, variable in children])
+    for child, variable in children:
+        clauses.extend(encode_arrival(encoding, child, segments, [variable]))
+    return clauses
+
+
+def encode_pipe(encoding, index):
+    """Returns the clauses of the pipe at the given index."""
+    parents = get_parents(encoding, index)
+    children = get_children(encoding, index)
+    parent_variables = [variable for _, variable in parents]
+    child_variables = [variable for _, variable in children]
+    segment_variables = [
+        encoding.segment_variables[index, segments]
+        for segments in range(1, encoding.maximum_segments + 1)
+    ]
+    clauses = encode_exactly_one(parent_variables, at_least_one=False)
+    clauses.extend(encode_exactly_one(child_variables, at_least_one=False))
+    clauses.extend(encode_exactly_one(segment_variables, at_least_one=False))
+    for parent_variable in parent_variables:
+        clauses.append([-parent_variable, *child_variables])
+        clauses.append([-parent_variable, *segment_variables])
+    for child_variable in child_variables:
+        clauses.append([-child_variable, *parent_variables])
+    for parent, child in itertools.product(parents, children):
+        clauses.extend(encode_turn(encoding, index, parent, child))
+    return clauses
+
+
+def encode_turn(encoding, index, parent, child):
+    """
+    Returns the clauses linking the remaining segments of the pipe at the given index
+    to those of the given child, when reached from the given parent, where both the
+    parent and the child are pairs of a neighbor index and its link variable.
+    """
+    (parent_index, parent_variable), (child_index, child_variable) = parent, child
+    if parent_index == child_index:
+        return [[-parent_variable, -child_variable]]
+    # A turn at this pipe starts a new segment
+    incoming_direction = encoding.adjacency[parent_index].index(index)
+    is_turn = incoming_direction != encoding.adjacency[index].index(child_index)
+    clauses = []
+    for segments in range(1, encoding.maximum_segments + 1):
+        conditions = [
+            parent_variable,
+            child_variable,
+            encoding.segment_variables[index, segments],
+        ]
+        clauses.extend(
+            encode_arrival(encoding, child_index, segments - is_turn, conditions),
+        )
+    return clauses
+
+
+def encode_arrival(encoding, index, segments, conditions):
+    """
+    Returns the clauses requiring that, under the given conditions, the point at the
+    given index is reached with the given number of remaining segments.
+    """
+    clause = [-condition for condition in conditions]
+    if segments <= 0 or (encoding.types[index] == 0 and segments != 1):
+        return [clause]
+    if encoding.types[index] < 0:
+        return [[*clause, encoding.segment_variables[index, segments]]]
+    return []
+
+
+def solve_dimacs(executable, variable_count, clauses):
+    """
+    Solves the given CNF formula with an external SAT solver, by way of a DIMACS file.
+
+    Args:
+        executable (str): The name or path of a SAT solver executable, which is run
+            with the path of the DIMACS file as its only argument and which reports
+            its result in the format of the SAT competitions.
+        variable_count (int): The number of variables of the formula.
+        clauses (list): The clauses of the formula, each a list of nonzero integers.
+
+    Returns:
+        list: For each variable, indexed from one, whether it is true in the
+            satisfying assignment found, or None if the formula is unsatisfiable.
+
+    Raises:
+        RuntimeError: If the solver reports neither satisfiability nor
+            unsatisfiability.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "grid.cnf")
+        with open(path, "w", encoding="ascii") as file:
+            write_dimacs(file, variable_count, clauses)
+        result = subprocess.run(
+            (executable, path),
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+    return read_dimacs_result(result.stdout, variable_count)
+
+
+def write_dimacs(file, variable_count, clauses):
+    """Writes the given CNF formula to the given file in the DIMACS format."""
+    file.write(f"p cnf {variable_count} {len(clauses)}\n")
+    for clause in clauses:
+        file.write(" ".join(map(str, (*clause, 0))) + "\n")
+
+
+def read_dimacs_result(output, variable_count):
+    """
+    Reads the result reported by a SAT solver in the format of the SAT competitions,
+    as described by `solve_dimacs`.
+    """
+    model = [False] * (variable_count + 1)
+    status = None
+    for line in output.splitlines():
+        if line.startswith("s "):
+            status = line[2:].strip()
+        elif line.startswith("v "):
+            for literal in map(int, line[2:].split()):
+                if literal > 0:
+                    model[literal] = True
+    if status == "UNSATISFIABLE":
+        return None
+    if status != "SATISFIABLE":
+        raise RuntimeError(f"SAT solver reported no result: {output!r}")
+    return model
+
+
+# The search state of the solver is inherently shared by all of its steps, which
+# are only ever driven through `solve`
+class CDCLSolver:  # pylint: disable=R0902,R0903
+    """
+    Represents a conflict-driven clause learning (CDCL) SAT solver for a CNF formula
+
+    Uses two watched literals per clause for unit propagation, learns the first unique
+    implication point (1UIP) clause of every conflict, backjumps non-chronologically,
+    selects decision variables by their (exponentially decaying) activity in recent
+    conflicts, saves the phase of every variable and restarts according to the Luby
+    sequence. Every choice is deterministic.
+    """
+
+    # Conflicts per unit of the Luby restart sequence, and the activity decay factor
+    RESTART_INTERVAL = 64
+    DECAY = 0.95
+
+    def __init__(self, variable_count, clauses):
+        self._clauses = []
+        # Clauses by the literals that they watch, with literals as list indexes
+        self._watches = [[] for _ in range(2 * variable_count + 2)]
+        self._values = [None] * (variable_count + 1)
+        self._levels = [0] * (variable_count + 1)
+        self._reasons = [None] * (variable_count + 1)
+        self._phases = [False] * (variable_count + 1)
+        self._activities = [0.0] * (variable_count + 1)
+        self._increment = 1.0
+        self._heap = [(0.0, variable) for variable in range(1, variable_count + 1)]
+        self._trail = []
+        self._trail_limits = []
+        self._propagated = 0
+        self._is_unsatisfiable = False
+        for clause in clauses:
+            self._add_clause(clause)
+
+    @staticmethod
+    def _watch_index(literal):
+        return 2 * literal if literal > 0 else -2 * literal + 1
+
+    def _value(self, literal):
+        """Returns the truth value of the given literal, or None if unassigned."""
+        value = self._values[abs(literal)]
+        return value if value is None or literal > 0 else not value
+
+    def _add_clause(self, clause):
+        clause = list(dict.fromkeys(clause))
+        if any(-literal in clause for literal in clause):
+            return
+        if not clause:
+            self._is_unsatisfiable = True
+        elif len(clause) == 1:
+            if self._value(clause[0]) is False:
+                self._is_unsatisfiable = True
+            elif self._value(clause[0]) is None:
+                self._assign(clause[0], None)
+        else:
+            self._attach(clause)
+
+    def _attach(self, clause):
+        """Stores the given clause, watching its first two literals."""
+        self._clauses.append(clause)
+        self._watches[self._watch_index(clause[0])].append(clause)
+        self._watches[self._watch_index(clause[1])].append(clause)
+
+    def _assign(self, literal, reason):
+        variable = abs(literal)
+        self._values[variable] = literal > 0
+        self._levels[variable] = len(self._trail_limits)
+        self._reasons[variable] = reason
+        self._trail.append(literal)
+
+    def _propagate(self):
+        """
+        Assigns every literal implied by unit propagation, returning a clause that
+        has become false, if any.
+        """
+        while self._propagated < len(self._trail):
+            false_literal = -self._trail[self._propagated]
+            self._propagated += 1
+            watches = self._watches[self._watch_index(false_literal)]
+            position = 0
+            while position < len(watches):
+                clause = watches[position]
+                if self._update_watch(clause, false_literal):
+                    # The clause now watches another literal instead
+                    watches[position] = watches[-1]
+                    watches.pop()
+                    continue
+                position += 1
+                if self._value(clause[0]) is False:
+                    return clause
+                if self._value(clause[0]) is None:
+                    self._assign(clause[0], clause)
+        return None
+
+    def _update_watch(self, clause, false_literal):
+        """
+        Moves the watch of the given clause from the given false literal to another
+        literal that is not false, if there is one and the clause is not already
+        satisfied, returning whether the watch was moved.
+        """
+        if clause[0] == false_literal:
+            clause[0], clause[1] = clause[1], clause[0]
+        if self._value(clause[0]) is True:
+            return False
+        for position in range(2, len(clause)):
+            if self._value(clause[position]) is not False:
+                clause[1], clause[position] = clause[position], clause[1]
+                self._watches[self._watch_index(clause[1])].append(clause)
+                return True
+        return False
+
+    def _analyze(self, conflict):
+        """
+        Returns the 1UIP clause learned from the given conflicting clause, with its
+        asserting literal first, and the level to which to backjump.
+        """
+        level = len(self._trail_limits)
+        seen = set()
+        learned = [None]
+        pending = 0
+        position = len(self._trail) - 1
+        clause = conflict
+        # No literal is zero, so none is skipped until one has been resolved on
+        literal = 0
+        while True:
+            for other in clause:
+                variable = abs(other)
+                if other == literal or variable in seen or not self._levels[variable]:
+                    continue
+                seen.add(variable)
+                self._bump(variable)
+                if self._levels[variable] == level:
+                    pending += 1
+                else:
+                    learned.append(other)
+            # Walk back along the trail to the next literal of this level involved
+            while abs(self._trail[position]) not in seen:
+                position -= 1
+            literal = self._trail[position]
+            position -= 1
+            pending -= 1
+            if not pending:
+                break
+            clause = self._reasons[abs(literal)]
+        learned[0] = -literal
+        # Watch the literal of the highest remaining level second
+        backjump_level = 0
+        for position in range(1, len(learned)):
+            if self._levels[abs(learned[position])] > backjump_level:
+                backjump_level = self._levels[abs(learned[position])]
+                learned[1], learned[position] = learned[position], learned[1]
+        return learned, backjump_level
+
+    def _bump(self, variable):
+        self._activities[variable] += self._increment
+        heapq.heappush(self._heap, (-self._activities[variable], variable))
+        if self._activities[variable] > 1e100:
+            # Rescale every activity to avoid overflow
+            self._activities = [activity * 1e-100 for activity in self._activities]
+            self._increment *= 1e-100
+            self._heap = [
+                (-activity, variable)
+                for variable, activity in enumerate(self._activities)
+                if variable
+            ]
+            heapq.heapify(self._heap)
+
+    def _backjump(self, level):
+        """Unassigns every literal assigned above the given level."""
+        if len(self._trail_limits) <= level:
+            return
+        limit = self._trail_limits[level]
+        for literal in self._trail[limit:]:
+            variable = abs(literal)
+            self._phases[variable] = literal > 0
+            self._values[variable] = None
+            self._reasons[variable] = None
+            heapq.heappush(self._heap, (-self._activities[variable], variable))
+        del self._trail[limit:]
+        del self._trail_limits[level:]
+        self._propagated = limit
+
+    def _decide(self):
+        """Assigns the most active unassigned variable, returning False if none is."""
+        while self._heap:
+            _, variable = heapq.heappop(self._heap)
+            if self._values[variable] is None:
+                self._trail_limits.append(len(self._trail))
+                self._assign(variable if self._phases[variable] else -variable, None)
+                return True
+        return False
+
+    def solve(self):
+        """
+        Searches for a satisfying assignment of the formula.
+
+        Returns:
+            list: For each variable, indexed from one, whether it is true in the
+                satisfying assignment found, or None if the formula is
+                unsatisfiable.
+        """
+        if self._is_unsatisfiable:
+            return None
+        for restart in itertools.count(1):
+            status = self._search(self.RESTART_INTERVAL * get_luby(restart))
+            if status is not None:
+                break
+            self._backjump(0)
+        if not status:
+            return None
+        return [False] + [bool(value) for value in self._values[1:]]
+
+    def _search(self, conflict_limit):
+        """
+        Searches until a conflict limit is reached, returning whether the formula is
+        satisfiable, or None if the limit was reached first.
+        """
+        conflicts = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is None:
+                if conflicts >= conflict_limit:
+                    return None
+                if not self._decide():
+                    return True
+                continue
+            conflicts += 1
+            if not self._trail_limits:
+                return False
+            learned, level = self._analyze(conflict)
+            self._backjump(level)
+            if len(learned) == 1:
+                self._assign(learned[0], None)
+            else:
+                self._attach(learned)
+                self._assign(learned[0], learned)
+            self._increment /= self.DECAY
+
+
+def get_luby(index):
+    """Returns the element at the given index, from one, of the Luby sequence."""
+    index -= 1
+    size, exponent = 1, 0
+    while size < index + 1:
+        size, exponent = 2 * size + 1, exponent + 1
+    while size - 1 != index:
+        size = (size - 1) // 2
+        exponent -= 1
+        index %= size
+    return 1 << exponent
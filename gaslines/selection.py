@@ -0,0 +1,60 @@
+"""
+Module that holds head-selection policies for the search algorithms, as well as the
+"most_constrained" algorithm, which uses them.
+"""
+
+
+from gaslines.logic import is_option
+from gaslines.propagation import propagating
+
+
+def most_constrained(grid):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles that applies every
+    forced move and then branches on the head with the fewest options.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    return propagating(grid, select=get_most_constrained_head)
+
+
+def get_most_constrained_head(grid, option=None):
+    """
+    Returns the head of the given grid with the fewest options (i.e., the "minimum
+    remaining values" heuristic), or None if the grid has no head.
+
+    Ties are broken in favor of the first head in row-major order, so the selection is
+    deterministic.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        option (function): A predicate, with the same signature as "is_option", that
+            determines which neighbors of a head are worth considering as its child.
+            Defaults to "is_option" itself.
+    """
+    option = is_option if option is None else option
+    best_head, best_count = None, None
+    for head in grid.heads:
+        count = count_options(head, option)
+        if best_count is None or count < best_count:
+            best_head, best_count = head, count
+            # No head can be more constrained than one with a single option
+            if count <= 1:
+                break
+    return best_head
+
+
+def count_options(head, option=None):
+    """
+    Returns the number of neighbors of the given head that are worth considering as
+    its child, according to the given predicate, which defaults to "is_option".
+    """
+    option = is_option if option is None else option
+    return sum(option(head, neighbor) for neighbor in head.get_neighbors())
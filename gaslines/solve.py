@@ -5,10 +5,34 @@ Lines puzzle.
 """
 
 
+import collections
+import contextlib
 import functools
+import multiprocessing
+import multiprocessing.util
+import signal
+import threading
+import time
 
 from gaslines import display
+from gaslines.corpus import SharedCorpus
+from gaslines.grid import Grid
 from gaslines.logic import full_recursive
+from gaslines.utility import get_periodic_check
+
+
+# Number of mutations between checks of whether a puzzle's deadline has passed
+DEADLINE_INTERVAL = 256
+
+# Message of the TimeoutError raised once a puzzle's deadline has passed
+DEADLINE_MESSAGE = "The deadline for solving the puzzle has passed"
+
+# Number of tasks (i.e., chunks of puzzles) after which a worker is replaced
+MAX_TASKS_PER_CHILD = 1000
+
+# Corpus of the puzzles solved by a pool of workers, which is attached to by each
+# worker in `attach_corpus` and so is not a constant
+_corpus = None  # pylint: disable=C0103
 
 
 def solve(grid, strategy=full_recursive, reveal_delay=None):
@@ -37,3 +61,211 @@ def solve(grid, strategy=full_recursive, reveal_delay=None):
         # Also reveal the grid in its initial state, prior to solving it
         reveal()
     return strategy(grid)
+
+
+# Every option of a batch is forwarded to its pool of workers, so none can be dropped
+def solve_many(  # pylint: disable=R0913
+    puzzles,
+    jobs=None,
+    chunksize=1,
+    ordered=True,
+    strategy=full_recursive,
+    timeout=None,
+    max_tasks_per_child=MAX_TASKS_PER_CHILD,
+    shared=False,
+):
+    """
+    Solves many Gas Lines puzzles (using the strategy provided) across a pool of
+    worker processes, yielding the result of each as soon as it is available.
+
+    Workers are sent puzzle descriptions, as accepted by the Grid class, rather than
+    grids, and send back only the links of each solution. Workers are replaced after
+    a number of tasks so that the memory they use stays bounded over long batches.
+
+    Alternatively, all puzzles may first be stored in a SharedCorpus, i.e., a single
+    block of shared memory, which every worker attaches to once. Workers are then
+    sent only the index of each puzzle, read the puzzle from the corpus and record
+    its result there, so that the cost of communication no longer depends on the
+    size of the puzzles. In that case, the puzzles provided are consumed in full up
+    front, and the corpus is destroyed once every result has been yielded, or once
+    the generator is closed.
+
+    Args:
+        puzzles (Iterable): The descriptions of the puzzles to solve.
+        jobs (int): The number of worker processes. Defaults to the number of CPUs.
+        chunksize (int): The number of puzzles sent to a worker at a time. Larger
+            chunks reduce the overhead of communication for many small puzzles.
+            Defaults to one.
+        ordered (bool): Whether results are yielded in the order of the puzzles,
+            rather than in the order in which they are found. Defaults to True.
+        strategy (function): The choice of algorithm with which to solve each
+            puzzle. Must be defined at the top level of a module, so that it can be
+            sent to the workers. Defaults to the "full_recursive" strategy.
+        timeout (float): If not None, the number of seconds after which the search
+            for a solution to a puzzle is abandoned, as described by
+            `solve_before_deadline`. Defaults to None.
+        max_tasks_per_child (int): The number of tasks, i.e., chunks of puzzles,
+            after which each worker is replaced, or None to never replace workers.
+            Defaults to one thousand.
+        shared (bool): Whether to hold the puzzles and their results in shared
+            memory. Defaults to False.
+
+    Yields:
+        Result: The result of each puzzle.
+    """
+    corpus = SharedCorpus.create(puzzles) if shared else None
+    if corpus is None:
+        worker = functools.partial(solve_puzzle, strategy, timeout)
+        tasks, initializer = enumerate(puzzles), None
+    else:
+        worker = functools.partial(solve_corpus_puzzle, strategy, timeout)
+        tasks = range(len(corpus))
+        initializer = functools.partial(attach_corpus, corpus.name)
+    try:
+        with multiprocessing.Pool(
+            jobs,
+            initializer=initializer,
+            maxtasksperchild=max_tasks_per_child,
+        ) as pool:
+            imap = pool.imap if ordered else pool.imap_unordered
+            for outcome in imap(worker, tasks, chunksize):
+                yield outcome if corpus is None else get_corpus_result(corpus, outcome)
+    finally:
+        if corpus is not None:
+            corpus.close()
+            corpus.unlink()
+
+
+class Result(
+    collections.namedtuple("Result", ("index", "solved", "links")),
+):
+    """
+    Describes the outcome of solving a single puzzle with `solve_many`.
+
+    Attributes:
+        index (int): The position of the puzzle among all puzzles provided.
+        solved (bool): Whether the puzzle has a solution, or None if its search was
+            abandoned once its deadline had passed.
+        links (tuple): The links of the solution, as ordered pairs of the row-major
+            indexes of each point with a child and of its child, or an empty tuple
+            if no solution was found.
+    """
+
+    __slots__ = ()
+
+
+def solve_puzzle(strategy, timeout, item):
+    """
+    Solves a single puzzle on behalf of a worker of `solve_many`.
+
+    Args:
+        strategy (function): The choice of algorithm with which to solve the puzzle.
+        timeout (float): If not None, the number of seconds after which to abandon
+            the search.
+        item (tuple): An ordered pair of the index and description of the puzzle.
+
+    Returns:
+        Result: The result of the puzzle.
+    """
+    index, description = item
+    grid = Grid(description)
+    solved = solve_before_deadline(grid, strategy, timeout)
+    return Result(index, solved, grid.get_links() if solved else ())
+
+
+def get_corpus_result(corpus, index):
+    """Returns the result of the puzzle at the given index of the given corpus."""
+    solved, grid = corpus.get_result(index)
+    return Result(index, solved, grid.get_links() if solved else ())
+
+
+def attach_corpus(name):
+    """
+    Attaches a worker of `solve_many` to the corpus of the given name, which the
+    worker closes again as it exits.
+    """
+    global _corpus  # pylint: disable=C0103,W0603
+    _corpus = SharedCorpus.attach(name)
+    multiprocessing.util.Finalize(None, _corpus.close, exitpriority=0)
+
+
+def solve_corpus_puzzle(strategy, timeout, index):
+    """
+    Solves the puzzle at the given index of the attached corpus on behalf of a worker
+    of `solve_many`, recording its result in the corpus.
+
+    Returns:
+        int: The index of the puzzle.
+    """
+    grid = _corpus.get_puzzle(index)
+    _corpus.set_result(index, solve_before_deadline(grid, strategy, timeout), grid)
+    return index
+
+
+def solve_before_deadline(grid, strategy, timeout):
+    """
+    Solves the given grid with the given strategy, abandoning the search once the
+    given number of seconds, if not None, have passed.
+
+    The deadline is checked both by an observer of the grid and, where possible, by
+    an alarm, as described by `set_alarm`, so that even strategies that do not mutate
+    the grid while searching are interrupted.
+
+    Returns:
+        bool: Whether the grid has a solution, or None if the search was abandoned.
+    """
+    if timeout is None:
+        return solve(grid, strategy=strategy)
+    grid.register(get_deadline_check(time.monotonic() + timeout))
+    solved = None
+    try:
+        with set_alarm(timeout):
+            solved = solve(grid, strategy=strategy)
+    except TimeoutError:
+        # The alarm may go off after the search is done, in which case it is kept
+        pass
+    return solved
+
+
+def get_deadline_check(deadline, interval=None):
+    """
+    Returns an observer that raises a TimeoutError, once every given number of calls
+    (which defaults to `DEADLINE_INTERVAL`), if the given deadline, as measured by
+    `time.monotonic`, has passed.
+    """
+    interval = DEADLINE_INTERVAL if interval is None else interval
+    return get_periodic_check(
+        lambda: time.monotonic() > deadline,
+        functools.partial(TimeoutError, DEADLINE_MESSAGE),
+        interval,
+    )
+
+
+@contextlib.contextmanager
+def set_alarm(timeout):
+    """
+    Returns a context manager that raises a TimeoutError within its block once the
+    given (positive) number of seconds have passed.
+
+    The alarm relies on the SIGALRM signal, so it is only set on platforms that
+    support `signal.setitimer` and from the main thread, as in the workers of
+    `solve_many`. Otherwise, the block is run without an alarm.
+    """
+    if (
+        timeout <= 0
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def handle_alarm(_signal_number, _frame):
+        raise TimeoutError(DEADLINE_MESSAGE)
+
+    previous_handler = signal.signal(signal.SIGALRM, handle_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
@@ -0,0 +1,338 @@
+"""
+Module that holds the "stealing" algorithm for solving Gas Lines puzzles, which
+balances the search of a single puzzle across worker processes by work stealing, as
+well as the classes and functions of its coordinator and workers.
+
+Workers communicate with the coordinator over multiprocessing connections, either
+pipes or, optionally, TCP sockets, so that workers may also run on other machines.
+Every message is a tuple whose first item names its kind:
+
+- ("grid", description): Sent to each worker once, before anything else.
+- ("work", branch): Assigns a branch of the search tree to an idle worker.
+- ("steal",): Asks a worker to give away part of its branch.
+- ("branch", branch): Answers a request to steal, with None if there is nothing
+  to give away.
+- ("idle",): Reports that a worker has exhausted its branch without a solution.
+- ("solution", links): Reports the links of a solution.
+- ("stop",): Tells a worker to exit.
+
+A branch is a triple of the moves that rebuild the grid state at its root, as ordered
+pairs of the row-major indexes of a point and of its new child, the index of the
+point from which to resume the search (or None) and the position among its neighbors
+of the first neighbor to try.
+"""
+
+
+import multiprocessing
+import multiprocessing.connection
+import os
+
+from gaslines.grid import Grid
+from gaslines.logic import get_head, get_next_index
+
+
+# Number of steps that a worker searches between checks for messages
+STEPS_PER_POLL = 64
+
+
+def stealing(grid, jobs=None, address=None, authkey=None, remote_jobs=0):
+    """
+    A parallel approach to solving Gas Lines puzzles that balances the search tree of
+    the "iterative" strategy across worker processes by work stealing.
+
+    Mutates the grid object provided to record a solution and returns True once a
+    solution has been found or False if no solution exists.
+
+    The whole search tree is initially assigned to a single worker. Whenever a worker
+    is idle, the coordinator asks a busy worker to give away the untried neighbors of
+    the oldest point on its stack, i.e., the largest branch it has left, which the
+    idle worker then rebuilds and searches. The search ends as soon as a solution is
+    found, or once every worker is idle with no branch left to give. Since branches
+    are explored concurrently, puzzles with several solutions may be solved
+    differently from run to run. The grid itself is only mutated once a solution has
+    been found.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        jobs (int): The number of local worker processes. Defaults to the number of
+            CPUs.
+        address (tuple): If not None, the (host, port) pair on which to accept
+            workers over TCP, rather than communicating with local workers over
+            pipes. A port of zero selects any free port. Defaults to None.
+        authkey (bytes): The key with which TCP workers must authenticate. Defaults
+            to a random key, which only suffices for local workers.
+        remote_jobs (int): The number of additional workers, started elsewhere by
+            `connect_worker`, to wait for when using TCP. Defaults to zero.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    jobs = os.cpu_count() if jobs is None else jobs
+    if address is None:
+        connections, processes = start_pipe_workers(jobs)
+    else:
+        authkey = os.urandom(32) if authkey is None else authkey
+        connections, processes = start_tcp_workers(
+            jobs,
+            address,
+            authkey,
+            remote_jobs,
+        )
+    try:
+        links = Coordinator(connections).run(grid.describe(), grid.get_links())
+    finally:
+        for connection in connections:
+            connection.close()
+        for process in processes:
+            process.join()
+    if links is None:
+        return False
+    grid.apply_moves(
+        (link for link in links if grid.get_point(link[0]).child is None),
+    )
+    return True
+
+
+def start_pipe_workers(jobs):
+    """
+    Starts the given number of local workers, each connected by a pipe, returning
+    the coordinator's ends of the pipes and the worker processes.
+    """
+    connections, processes = [], []
+    for _ in range(jobs):
+        connection, worker_connection = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=run_worker,
+            args=(worker_connection,),
+            daemon=True,
+        )
+        process.start()
+        worker_connection.close()
+        connections.append(connection)
+        processes.append(process)
+    return connections, processes
+
+
+def start_tcp_workers(jobs, address, authkey, remote_jobs=0):
+    """
+    Starts the given number of local workers, each connected over TCP, and waits for
+    the given number of remote workers to connect as well, returning the
+    coordinator's ends of the connections and the local worker processes.
+    """
+    with multiprocessing.connection.Listener(address, authkey=authkey) as listener:
+        processes = []
+        for _ in range(jobs):
+            process = multiprocessing.Process(
+                target=connect_worker,
+                args=(listener.address, authkey),
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
+        connections = [listener.accept() for _ in range(jobs + remote_jobs)]
+    return connections, processes
+
+
+def connect_worker(address, authkey):
+    """
+    Connects to the coordinator of the "stealing" algorithm at the given address over
+    TCP and then serves as one of its workers until told to stop.
+
+    This function may be called on any machine that can reach the coordinator, which
+    must have been told to wait for it by way of the `remote_jobs` argument.
+
+    Args:
+        address (tuple): The (host, port) pair of the coordinator.
+        authkey (bytes): The key with which to authenticate.
+    """
+    with multiprocessing.connection.Client(address, authkey=authkey) as connection:
+        run_worker(connection)
+
+
+# The coordinator is only ever driven through `run`, which lasts the whole search
+class Coordinator:  # pylint: disable=R0903
+    """
+    Represents the coordinator of the "stealing" algorithm, which assigns branches to
+    workers and relays requests to steal between them
+
+    Keeps track of which workers are busy, which idle workers are waiting for a
+    branch and from which busy worker each of them has been promised one.
+    """
+
+    def __init__(self, connections):
+        self._connections = connections
+        self._busy = set()
+        self._idle = []
+        # The idle worker awaiting a branch from each busy worker that was asked
+        self._thieves = {}
+
+    def run(self, description, links):
+        """
+        Searches the grid with the given description and links across the workers.
+
+        Returns:
+            tuple: The links of the solution found, or None if there is none.
+        """
+        for connection in self._connections:
+            connection.send(("grid", description))
+        self._connections[0].send(("work", (links, None, 0)))
+        self._busy.add(0)
+        self._idle = list(range(1, len(self._connections)))
+        try:
+            while self._busy or self._thieves:
+                self._request_steals()
+                for connection in multiprocessing.connection.wait(self._connections):
+                    solution = self._receive(self._connections.index(connection))
+                    if solution is not None:
+                        return solution
+            return None
+        finally:
+            for connection in self._connections:
+                connection.send(("stop",))
+
+    def _request_steals(self):
+        """Asks busy workers, which were not already asked, for branches to steal."""
+        victims = sorted(self._busy - self._thieves.keys())
+        while self._idle and victims:
+            victim = victims.pop(0)
+            self._thieves[victim] = self._idle.pop(0)
+            self._connections[victim].send(("steal",))
+
+    def _receive(self, worker):
+        """
+        Handles the next message from the given worker, returning the links of a
+        solution if it reported one.
+        """
+        message = self._connections[worker].recv()
+        if message[0] == "solution":
+            return message[1]
+        if message[0] == "idle":
+            self._busy.discard(worker)
+            self._idle.append(worker)
+        elif message[0] == "branch":
+            thief = self._thieves.pop(worker)
+            if message[1] is None:
+                self._idle.append(thief)
+            else:
+                self._connections[thief].send(("work", message[1]))
+                self._busy.add(thief)
+        return None
+
+
+class Search:
+    """
+    Represents the search of a single branch by a worker of the "stealing" algorithm,
+    which proceeds exactly like the "iterative" strategy, one step at a time, while
+    allowing parts of its branch to be given away in between steps
+    """
+
+    def __init__(self, description, branch):
+        moves, current_index, start = branch
+        self._moves = tuple(moves)
+        self._grid = Grid.rebuild(description, self._moves)
+        self._current = (
+            None if current_index is None else self._grid.get_point(current_index)
+        )
+        self._start = start
+        # Each frame holds a point whose child is set and its next neighbor position
+        self._stack = []
+
+    @property
+    def grid(self):
+        """Returns the grid being searched."""
+        return self._grid
+
+    def run(self, steps):
+        """
+        Searches for up to the given number of steps.
+
+        Returns:
+            bool: Whether a solution was found, False if the branch was exhausted, or
+                None if the search is not yet finished.
+        """
+        for _ in range(steps):
+            result = self._step()
+            if result is not None:
+                return result
+        return None
+
+    def _step(self):
+        """Tries the next candidate, mirroring a single iteration of "iterative"."""
+        current = self._current
+        if current is None or current.is_sink():
+            # A grid with no remaining heads is already in a solved state
+            if not self._grid.has_head():
+                return True
+            current, self._start = get_head(self._grid), 0
+        neighbors = current.get_neighbors()
+        index = get_next_index(current, neighbors, self._start)
+        if index is None:
+            current.child = None
+            # Backtrack to the most recent point with untested neighbors, if any
+            if not self._stack:
+                return False
+            self._current, self._start = self._stack.pop()
+            return None
+        current.child = neighbors[index]
+        self._stack.append([current, index + 1])
+        self._current, self._start = neighbors[index], 0
+        return None
+
+    def donate(self):
+        """
+        Gives away the untried neighbors of the oldest point on the stack that has
+        any, which this search will then no longer try.
+
+        Returns:
+            tuple: The branch given away, or None if there is nothing to give away.
+        """
+        for depth, frame in enumerate(self._stack):
+            point, start = frame
+            if start >= len(point.get_neighbors()):
+                continue
+            frame[1] = len(point.get_neighbors())
+            moves = self._moves + tuple(
+                (point.index, point.child.index) for point, _ in self._stack[:depth]
+            )
+            return moves, point.index, start
+        return None
+
+
+def run_worker(connection):
+    """
+    Serves as a worker of the "stealing" algorithm over the given connection until
+    told to stop.
+    """
+    description = connection.recv()[1]
+    while True:
+        message = connection.recv()
+        if message[0] == "stop":
+            return
+        if message[0] == "steal":
+            connection.send(("branch", None))
+        elif message[0] == "work":
+            if not search_branch(connection, Search(description, message[1])):
+                return
+
+
+def search_branch(connection, search):
+    """
+    Searches the given branch on behalf of a worker, answering requests to steal in
+    between, and then reports the outcome.
+
+    Returns:
+        bool: Whether the worker should carry on, i.e., False if it was told to stop.
+    """
+    while True:
+        result = search.run(STEPS_PER_POLL)
+        if result is not None:
+            if result:
+                connection.send(("solution", search.grid.get_links()))
+            else:
+                connection.send(("idle",))
+            return True
+        while connection.poll():
+            message = connection.recv()
+            if message[0] == "stop":
+                return False
+            connection.send(("branch", search.donate()))
@@ -0,0 +1,116 @@
+"""
+Module that holds the TranspositionTable class, a bounded table of grid states known to
+be unsolvable, as well as the "transposing" algorithm, which uses it.
+"""
+
+
+import collections
+
+from gaslines.propagation import propagating
+
+
+def transposing(grid, table=None):
+    """
+    A depth-first, iterative approach to solving Gas Lines puzzles that applies every
+    forced move before branching and never searches a state that is known to be
+    unsolvable twice.
+
+    Mutates the grid object provided to search for a solution and returns True
+    once a solution has been found or False if no solution exists.
+
+    States are identified by the Zobrist hash of the grid. A table may be shared
+    between searches, e.g., of the same puzzle from different partial solutions, in
+    which case states refuted by one search are skipped by all subsequent searches.
+
+    Args:
+        grid (Grid): A partially solved Gas Lines grid.
+        table (TranspositionTable): The table of unsolvable states to consult and
+            update. Defaults to a new table with the default capacity and policy.
+
+    Returns:
+        bool: Whether the grid can be (or is) solved in its current state.
+    """
+    table = TranspositionTable() if table is None else table
+    return propagating(grid, table=table)
+
+
+class TranspositionTable:
+    """
+    Represents a bounded set of the Zobrist hashes of grid states known to be
+    unsolvable
+
+    Once the table is full, entries are replaced according to one of two policies:
+
+    - "lru": The least recently stored or found entry is evicted.
+    - "depth": As with the depth-preferred replacement of game-tree search, each
+      hash is assigned a single slot, whose entry is only replaced by one that took at
+      least as much work (i.e., as many branches) to refute, so that the most
+      expensive refutations are kept.
+
+    Since only hashes are stored, distinct states with the same hash are conflated,
+    which, with 64-bit keys, is vanishingly unlikely.
+    """
+
+    POLICIES = ("lru", "depth")
+
+    def __init__(self, capacity=1 << 16, policy="lru"):
+        if capacity < 1:
+            raise ValueError(f"Capacity must be positive, not {capacity}")
+        if policy not in TranspositionTable.POLICIES:
+            raise ValueError(f"Unknown replacement policy: {policy!r}")
+        self._capacity = capacity
+        self._policy = policy
+        # Hashes in order of use for "lru", or (hash, work) slots for "depth"
+        if policy == "lru":
+            self._entries = collections.OrderedDict()
+        else:
+            self._entries = [None] * capacity
+
+    @property
+    def capacity(self):
+        """Returns the maximum number of entries of the table."""
+        return self._capacity
+
+    @property
+    def policy(self):
+        """Returns the name of the replacement policy of the table."""
+        return self._policy
+
+    def __len__(self):
+        """Returns the number of entries currently in the table."""
+        if self._policy == "lru":
+            return len(self._entries)
+        return sum(entry is not None for entry in self._entries)
+
+    def __contains__(self, key):
+        """Returns whether the given hash is in the table, marking it as used if so."""
+        if self._policy == "lru":
+            if key not in self._entries:
+                return False
+            self._entries.move_to_end(key)
+            return True
+        entry = self._entries[key % self._capacity]
+        return entry is not None and entry[0] == key
+
+    def add(self, key, work=1):
+        """
+        Adds the given hash to the table, replacing another entry if necessary and
+        allowed by the policy of the table.
+
+        Args:
+            key (int): The Zobrist hash of an unsolvable state.
+            work (int): The number of branches taken to refute the state. Only used
+                by the "depth" policy. Defaults to one.
+        """
+        if self._policy == "lru":
+            self._entries[key] = None
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+            return
+        slot = key % self._capacity
+        entry = self._entries[slot]
+        if entry is not None and entry[0] == key:
+            self._entries[slot] = (key, max(work, entry[1]))
+        elif entry is None or work >= entry[1]:
+            self._entries[slot] = (key, work)
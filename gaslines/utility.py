@@ -33,6 +33,32 @@ def get_number_of_rows(string):
     return len(string.split("\n"))
 
 
+def get_periodic_check(predicate, exception, interval):
+    """
+    Returns an observer that, once every given number of calls, raises an exception
+    created by the given factory if the given predicate holds.
+
+    Such an observer may be registered with a grid to abandon its search from within,
+    at the cost of a single counter increment for most mutations.
+
+    Args:
+        predicate (callable): A callable, taking no arguments, that returns whether
+            to raise an exception.
+        exception (callable): A callable, taking no arguments, such as an exception
+            class, that returns a new exception to raise each time.
+        interval (int): The number of calls between evaluations of the predicate.
+    """
+    calls = 0
+
+    def check():
+        nonlocal calls
+        calls += 1
+        if calls % interval == 0 and predicate():
+            raise exception()
+
+    return check
+
+
 class Observable:
     """
     A simple implementation of the observer design pattern.
@@ -41,12 +67,14 @@ class Observable:
     can use its functionality out-of-the-box by specifying it as a base class.
     """
 
+    __slots__ = ("_observers",)
+
     def __new__(cls, *_args, **_kwargs):
         # The args and kwargs may be used by __init__ but are not used here
         instance = super().__new__(cls)
-        # Explicitly initialize the list of observers
+        # Explicitly initialize the (lazily allocated) list of observers
         # This is done here to prevent the need for explicit initialization elsewhere
-        instance._observers = []
+        instance._observers = None
         return instance
 
     def register(self, observer):
@@ -57,7 +85,10 @@ class Observable:
             observer (callable): A callable to invoke upon notification by this
                 observable.
         """
-        self._observers.append(observer)  # pylint: disable=E1101
+        # The list is allocated by the first registration, as set up by `__new__`
+        if self._observers is None:  # pylint: disable=E0203,E1101
+            self._observers = []  # pylint: disable=W0201
+        self._observers.append(observer)
 
     def notify(self):
         """
@@ -66,7 +97,7 @@ class Observable:
         Under the current implementation, observers are notified exactly in accordance
         with the order and amount that they were registered.
         """
-        for observer in self._observers:  # pylint: disable=E1101
+        for observer in self._observers or ():  # pylint: disable=E1101
             observer()
 
     @staticmethod
@@ -75,6 +106,9 @@ class Observable:
         Decorates a given method so that observers are notified any time it is called,
         immediately afterwards.
 
+        If no observers are registered, notification is skipped altogether, so that
+        unobserved instances pay no more than a single check per call.
+
         This method is intended to be used only as a decorater of methods of
         Observable-derived classes.
 
@@ -85,7 +119,9 @@ class Observable:
         @functools.wraps(method)
         def wrapper(self, *args, **kwargs):
             result = method(self, *args, **kwargs)
-            self.notify()
+            # The wrapper is only ever bound to Observable instances
+            if self._observers:  # pylint: disable=W0212
+                self.notify()
             return result
 
         return wrapper
@@ -0,0 +1,163 @@
+"""All unit tests for the gaslines array_grid module."""
+
+
+import pickle
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid, ArrayPoint
+from gaslines.grid import Grid, get_adjacency
+from gaslines.logic import full_recursive, iterative, partial_recursive
+from gaslines.solve import solve
+from gaslines.utility import Direction
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import draw_path
+
+
+SOLVED_GRID_STRING = """\
+3---·---·
+        |
+·---2   ·
+|       |
+*---·---·\
+"""
+
+
+def test_dimensions_and_subscripting_return_views_of_points():
+    """Verifies that an array grid is subscripted just like a grid of points."""
+    grid = ArrayGrid(((-1, -1, -1), (0, 0, 0), (1, 2, 3)))
+    assert grid.height == 3
+    assert grid.length == 3
+    with pytest.raises(IndexError):
+        assert grid[3]
+    # Test that views of the same point are equal, even if not identical
+    assert grid[1][2] == grid[1][2]
+    assert grid[1][2] != grid[2][1]
+    assert grid[1][2].location == (1, 2)
+    assert grid[2][1].index == 7
+    assert all(isinstance(point, ArrayPoint) for point in grid.points)
+    assert [point.is_sink() for point in grid[1]] == [True] * 3
+    assert [point.remaining_segments for point in grid[2]] == [1, 2, 3]
+
+
+def test_points_with_path_return_same_state_as_grid_of_points():
+    """Verifies that an array grid tracks paths exactly like a grid of points."""
+    path = ((0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1))
+    grids = (small_solvable_grid(), small_solvable_grid(ArrayGrid))
+    for grid in grids:
+        draw_path(grid, path)
+    grid, array_grid = grids
+    for point, array_point in zip(grid.points, array_grid.points):
+        assert point.is_open() == array_point.is_open()
+        assert point.is_head() == array_point.is_head()
+        assert point.remaining_segments == array_point.remaining_segments
+        assert point.incoming_direction == array_point.incoming_direction
+        assert (point.parent is None) == (array_point.parent is None)
+    assert array_grid[2][1].parent == array_grid[2][2]
+    assert array_grid[2][2].has_relationship(Direction.WEST)
+    assert array_grid.heads == (array_grid[1][1], array_grid[2][1])
+    # Test that disconnecting part of a path resets the rest of the path
+    array_grid[0][1].child = None
+    assert array_grid[2][1].remaining_segments is None
+    assert array_grid.heads == (array_grid[0][1], array_grid[1][1], array_grid[2][1])
+
+
+def test_str_with_complete_board_returns_correct_string():
+    """Verifies that the string representation of a solved array grid is correct."""
+    grid = small_solvable_grid(ArrayGrid)
+    draw_path(grid, ((0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0)))
+    draw_path(grid, ((1, 1), (1, 0), (2, 0)))
+    assert str(grid) == SOLVED_GRID_STRING
+    assert grid[2][0].parents == {grid[1][0], grid[2][1]}
+
+
+@pytest.mark.parametrize("shape", ((1, 1), (1, 4), (4, 1), (3, 5)))
+def test_neighbors_are_computed_as_in_adjacency_table(shape):
+    """Verifies that neighbors are computed arithmetically as tabulated for grids."""
+    height, length = shape
+    grid = ArrayGrid(((-1,) * length,) * height)
+    adjacency = get_adjacency(height, length)
+    for index, adjacent_indexes in enumerate(adjacency):
+        for direction_index, adjacent_index in enumerate(adjacent_indexes):
+            assert grid.get_adjacent_index(index, direction_index) == adjacent_index
+            if adjacent_index is not None:
+                assert grid.get_direction_index(index, adjacent_index) == (
+                    direction_index
+                )
+        for other_index in range(len(adjacency)):
+            if other_index not in adjacent_indexes:
+                assert grid.get_direction_index(index, other_index) is None
+    assert grid.adjacency is adjacency
+
+
+def test_copy_returns_independent_grid():
+    """Verifies that mutating a copy of an array grid leaves the original intact."""
+    grid = small_solvable_grid(ArrayGrid)
+    draw_path(grid, ((0, 0), (0, 1), (0, 2)))
+    copy = grid.copy()
+    assert str(copy) == str(grid)
+    copy[0][1].child = None
+    assert grid[0][1].child == grid[0][2]
+    assert grid[0][2].remaining_segments == 3
+    assert copy[0][2].remaining_segments is None
+    assert copy.heads == (copy[0][1], copy[1][1])
+
+
+def test_copy_tracks_zobrist_hash_as_grid():
+    """Verifies that copies of array grids hash states as grids of points do."""
+    grid = small_solvable_grid(ArrayGrid)
+    point_grid = small_solvable_grid(Grid)
+    draw_path(grid, ((0, 0), (0, 1)))
+    draw_path(point_grid, ((0, 0), (0, 1)))
+    # Test both a copy whose hash is indexed when read and one whose hash is tracked
+    assert grid.copy().zobrist_hash == point_grid.zobrist_hash
+    copy = grid.copy()
+    copy[0][1].child = copy[0][2]
+    point_grid[0][1].child = point_grid[0][2]
+    assert copy.zobrist_hash == point_grid.zobrist_hash
+    tracked_copy = copy.copy()
+    tracked_copy[0][1].child = None
+    point_grid[0][1].child = None
+    assert tracked_copy.zobrist_hash == point_grid.zobrist_hash
+
+
+def test_describe_and_rebuild_match_grid():
+    """Verifies that array grids are described and rebuilt as grids of points are."""
+    grid = august_9_grid(ArrayGrid)
+    point_grid = august_9_grid(Grid)
+    draw_path(grid, ((0, 0), (0, 1)))
+    draw_path(point_grid, ((0, 0), (0, 1)))
+    assert grid.describe() == point_grid.describe()
+    assert grid.get_links() == point_grid.get_links()
+    other_grid = ArrayGrid.rebuild(grid.describe(), grid.get_links())
+    assert isinstance(other_grid, ArrayGrid)
+    assert other_grid.to_bytes() == point_grid.to_bytes()
+
+
+def test_pickle_returns_equal_array_grid():
+    """Verifies that array grids are pickled as array grids, without observers."""
+    grid = august_9_grid(ArrayGrid)
+    assert iterative(grid)
+    grid.register(lambda: None)
+    other_grid = pickle.loads(pickle.dumps(grid))
+    assert isinstance(other_grid, ArrayGrid)
+    assert str(other_grid) == str(grid)
+    assert other_grid.to_bytes() == grid.to_bytes()
+    # Test that both kinds of grid share the same representation
+    point_grid = august_9_grid(Grid)
+    assert iterative(point_grid)
+    assert point_grid.to_bytes() == grid.to_bytes()
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    (full_recursive, partial_recursive, iterative),
+)
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+def test_algorithm_with_array_grid_finds_same_solution(strategy, grid):
+    """Verifies that each algorithm solves an array grid as it does a point grid."""
+    array_grid = grid(ArrayGrid)
+    assert solve(array_grid, strategy=strategy)
+    point_grid = grid(Grid)
+    assert strategy(point_grid)
+    assert str(array_grid) == str(point_grid)
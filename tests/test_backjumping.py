@@ -0,0 +1,98 @@
+"""All unit tests for the gaslines backjumping module."""
+
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.backjumping import (
+    NogoodCache,
+    backjumping,
+    get_link_conflicts,
+    get_option_conflicts,
+)
+from gaslines.grid import Grid
+from gaslines.logic import iterative, partial_recursive
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import draw_path, record_search
+
+
+def test_get_link_conflicts_returns_depth_of_decision_linking_point():
+    """Verifies that only links set by decisions are responsible for conflicts."""
+    grid = Grid(((3, -1, -1), (-1, -1, 0)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2)))
+    depths = {1: 4}
+    assert get_link_conflicts(depths, grid[0][2]) == {4}
+    # Test that links of the initial grid and points without parents are exempt
+    assert get_link_conflicts(depths, grid[0][1]) == set()
+    assert get_link_conflicts(depths, grid[0][0]) == set()
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_get_option_conflicts_returns_depths_of_responsible_decisions(grid_class):
+    """Verifies that the decisions responsible for each non-option are identified."""
+    grid = grid_class(((2, -1, -1), (-1, -1, -1), (1, -1, 0)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2), (1, 2)))
+    draw_path(grid, ((2, 0), (1, 0)))
+    depths = {0: 0, 1: 1, 2: 2, 6: 3}
+    current = grid[1][2]
+    # Test that closed neighbors are blamed on the decision that closed them
+    assert get_option_conflicts(depths, current, grid[0][2]) == {1}
+    # Test that exhausted segments are blamed on the whole path of the head
+    assert get_option_conflicts(depths, current, grid[1][1]) == {0, 1, 2}
+    assert get_option_conflicts(depths, grid[1][0], grid[1][1]) == {3}
+
+
+def test_nogood_cache_finds_nogoods_whose_links_are_all_present():
+    """Verifies that nogoods are only found once all of their links are present."""
+    grid = Grid(((2, -1, -1), (-1, -1, -1), (1, -1, 0)))
+    nogoods = NogoodCache()
+    nogoods.add(((0, 1), (6, 3)))
+    # Test that empty and duplicate nogoods are not added
+    nogoods.add(())
+    nogoods.add(((6, 3), (0, 1)))
+    assert len(nogoods) == 1
+    draw_path(grid, ((0, 0), (0, 1)))
+    assert nogoods.find(grid, grid[0][0]) is None
+    draw_path(grid, ((2, 0), (1, 0)))
+    assert nogoods.find(grid, grid[2][0]) == frozenset(((0, 1), (6, 3)))
+
+
+def test_nogood_cache_with_full_cache_evicts_oldest_nogood():
+    """Verifies that the oldest nogood is evicted once the cache is full."""
+    nogoods = NogoodCache(2)
+    for nogood in (((0, 1),), ((1, 2),), ((2, 3),)):
+        nogoods.add(nogood)
+    assert ((0, 1),) not in nogoods
+    assert ((1, 2),) in nogoods
+    assert ((2, 3),) in nogoods
+    assert len(nogoods) == nogoods.capacity
+    with pytest.raises(ValueError, match="Capacity must be positive"):
+        NogoodCache(0)
+
+
+def test_backjumping_with_nogoods_and_unsolvable_example_returns_false():
+    """Verifies that the backjumping algorithm, with a nogood cache, fails as well."""
+    grid = Grid(((2, -1, -1), (-1, -1, -1), (-1, -1, 0), (1, -1, -1)))
+    nogoods = NogoodCache()
+    assert not backjumping(grid, nogoods)
+    assert not any(point.has_child() for point in grid.points)
+    assert nogoods
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+@pytest.mark.parametrize("nogood_cache", (lambda: None, NogoodCache))
+def test_backjumping_with_solvable_example_mutates_no_more_than_chronological(
+    grid,
+    nogood_cache,
+):
+    """
+    Verifies that the backjumping algorithm, with or without a nogood cache, makes no
+    more mutations to solve each provided puzzle than the chronological search of the
+    partial_recursive algorithm, which branches on the same heads.
+    """
+    backjumping_search = record_search(
+        lambda grid: backjumping(grid, nogood_cache()),
+        grid(),
+    )
+    assert backjumping_search[-1] == record_search(iterative, grid())[-1]
+    assert len(backjumping_search) <= len(record_search(partial_recursive, grid()))
@@ -0,0 +1,52 @@
+"""All unit tests for the gaslines bitboard module."""
+
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.bitboard import bitboard, get_neighbor_bits, read_bitboards
+from gaslines.grid import Grid
+from gaslines.solve import solve
+from tests.test_logic import august_9_grid
+from tests.utility import draw_path
+
+
+def test_get_neighbor_bits_returns_neighbors_in_direction_order():
+    """Verifies that the neighbor table describes the expected neighbors."""
+    assert get_neighbor_bits(2, 2) == (
+        ((1, 1, 0b0010), (2, 2, 0b0100)),
+        ((2, 3, 0b1000), (3, 0, 0b0001)),
+        ((0, 0, 0b0001), (1, 3, 0b1000)),
+        ((0, 1, 0b0010), (3, 2, 0b0100)),
+    )
+
+
+def test_read_bitboards_with_incomplete_puzzle_returns_state():
+    """Verifies that the bitboards read from a grid reflect its current state."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2), (1, 2)))
+    closed, sinks, heads, head_states = read_bitboards(grid)
+    assert closed == 0b000110111
+    assert sinks == 0b001000000
+    assert heads == 0b000110000
+    # Test that the state of each head includes its direction and remaining segments
+    assert head_states == {4: (None, 2), 5: (2, 2)}
+
+
+def test_bitboard_with_incomplete_puzzle_extends_existing_paths():
+    """Verifies that the bitboard algorithm continues from a partially solved grid."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2), (1, 2)))
+    assert bitboard(grid)
+    assert not grid.has_head()
+    assert grid[1][2].child is grid[2][2]
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_bitboard_with_solvable_example_notifies_observers_once(grid_class):
+    """Verifies that the bitboard algorithm only mutates the grid once solved."""
+    states = []
+    grid = august_9_grid(grid_class)
+    grid.register(lambda: states.append(str(grid)))
+    assert solve(grid, strategy=bitboard)
+    assert len(states) == 1
@@ -0,0 +1,81 @@
+"""All unit tests for the gaslines bounds module."""
+
+
+import math
+
+from gaslines.bounds import (
+    compute_segment_bounds,
+    get_segment_bounds,
+    get_segment_feasibility,
+    is_feasible,
+    is_within_bounds,
+)
+from gaslines.grid import Grid
+from gaslines.logic import is_option
+from tests.utility import draw_path
+
+
+def test_get_segment_bounds_returns_fewest_segments_to_sink():
+    """Verifies that the segment bounds count the fewest segments needed."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    bounds = get_segment_bounds(grid)
+    # Test that sinks need only the segment on which they are reached
+    assert bounds[6] == (1, 1, 1, 1)
+    # Test that heading towards a sink is cheaper than heading away from it
+    assert bounds[7] == (2, math.inf, 2, 1)
+    assert bounds[1] == (4, 3, 4, math.inf)
+    # Test that sources are impassable
+    assert bounds[0] == (math.inf,) * 4
+    assert bounds[4] == (math.inf,) * 4
+
+
+def test_get_segment_bounds_with_same_layout_is_shared():
+    """Verifies that grids with the same layout share their segment bounds."""
+    first_grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    second_grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(second_grid, ((0, 0), (0, 1)))
+    assert get_segment_bounds(first_grid) is get_segment_bounds(second_grid)
+    assert compute_segment_bounds(1, 2, frozenset(), frozenset((0,))) == (
+        (math.inf,) * 4,
+        (math.inf,) * 4,
+    )
+
+
+def test_is_within_bounds_with_dead_end_option_returns_false():
+    """Verifies that options that cannot reach a sink in time are not within bounds."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    bounds = get_segment_bounds(grid)
+    current = grid[1][1]
+    # Test that moving north leaves too few segments to reach the sink
+    assert is_option(current, grid[0][1])
+    assert not is_within_bounds(bounds, current, grid[0][1])
+    assert is_within_bounds(bounds, current, grid[1][0])
+    assert is_within_bounds(bounds, current, grid[2][1])
+
+
+def test_get_segment_feasibility_returns_exact_segment_counts():
+    """Verifies that the segment feasibility marks exactly the reachable counts."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    feasibility = get_segment_feasibility(grid)
+    # Test that sinks are reached on exactly their last segment
+    assert feasibility[6] == (0b0010,) * 4
+    # Test that heading west along the bottom row reaches the sink on one segment
+    assert feasibility[7][3] == 0b0010
+    # Test that heading east along the top row reaches the sink on three segments
+    assert feasibility[1][1] == 0b1000
+    assert feasibility[2][1] == 0b1000
+    # Test that sources are impassable and counts beyond the maximum are ignored
+    assert feasibility[1][0] == 0
+    assert feasibility[0] == (0,) * 4
+
+
+def test_is_feasible_with_inexact_option_returns_false():
+    """Verifies that options that cannot reach a sink exactly are not feasible."""
+    grid = Grid(((2, -1, -1, 0),))
+    feasibility = get_segment_feasibility(grid)
+    current = grid[0][0]
+    # Test that two segments suffice, but a single row only allows for one segment
+    assert is_within_bounds(get_segment_bounds(grid), current, grid[0][1])
+    assert not is_feasible(feasibility, current, grid[0][1])
+    grid = Grid(((1, -1, -1, 0),))
+    assert is_feasible(get_segment_feasibility(grid), grid[0][0], grid[0][1])
@@ -0,0 +1,55 @@
+"""All unit tests for the gaslines corpus module."""
+
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.corpus import SharedCorpus
+from gaslines.logic import iterative
+from tests.test_logic import july_12_grid, small_solvable_grid
+from tests.utility import draw_path
+
+
+def test_create_stores_puzzles_in_order():
+    """Verifies that puzzles are stored back to back, as descriptions or grids."""
+    grid = small_solvable_grid(ArrayGrid)
+    draw_path(grid, ((0, 0), (0, 1)))
+    corpus = SharedCorpus.create((((2, -1), (0, 0)), grid, july_12_grid()))
+    try:
+        assert len(corpus) == 3
+        assert str(corpus.get_puzzle(0)) == str(ArrayGrid(((2, -1), (0, 0))))
+        assert str(corpus.get_puzzle(1)) == str(grid)
+        assert str(corpus.get_puzzle(2)) == str(july_12_grid())
+        assert all(corpus.get_result(index) is None for index in range(3))
+    finally:
+        corpus.close()
+        corpus.unlink()
+
+
+def test_set_result_with_attached_corpus_is_shared():
+    """Verifies that results recorded through one attachment are seen by another."""
+    corpus = SharedCorpus.create((small_solvable_grid(), ((2, 0),), ((1, -1, 0),)))
+    try:
+        other_corpus = SharedCorpus.attach(corpus.name)
+        grid = other_corpus.get_puzzle(0)
+        assert iterative(grid)
+        other_corpus.set_result(0, True, grid)
+        other_corpus.set_result(1, False, other_corpus.get_puzzle(1))
+        other_corpus.set_result(2, None, other_corpus.get_puzzle(2))
+        other_corpus.close()
+        solved, solution = corpus.get_result(0)
+        assert solved
+        assert str(solution) == str(grid)
+        assert corpus.get_result(1) == (False, None)
+        assert corpus.get_result(2) == (None, None)
+        # Test that recording a result leaves the puzzle itself intact
+        assert str(corpus.get_puzzle(0)) == str(small_solvable_grid())
+    finally:
+        corpus.close()
+        corpus.unlink()
+
+
+def test_create_without_puzzles_returns_empty_corpus():
+    """Verifies that an empty batch of puzzles makes for an empty corpus."""
+    corpus = SharedCorpus.create(())
+    assert len(corpus) == 0
+    corpus.close()
+    corpus.unlink()
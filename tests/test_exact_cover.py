@@ -0,0 +1,62 @@
+"""All unit tests for the gaslines exact_cover module."""
+
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.exact_cover import enumerate_paths, exact_cover, find_exact_cover
+from gaslines.grid import Grid
+from gaslines.logic import iterative
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import draw_path, record_search
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_enumerate_paths_generates_paths_with_exact_segments(grid_class):
+    """Verifies that every path to a sink in exactly the remaining segments is found."""
+    grid = grid_class(((2, -1, -1), (-1, -1, -1), (-1, -1, 0)))
+    assert list(enumerate_paths(grid, grid[0][0])) == [(1, 2, 5, 8), (3, 6, 7, 8)]
+    grid = grid_class(((3, -1, -1), (-1, -1, -1), (-1, -1, 0)))
+    assert list(enumerate_paths(grid, grid[0][0])) == [(1, 4, 7, 8), (3, 4, 5, 8)]
+
+
+def test_enumerate_paths_with_partial_path_continues_from_head():
+    """Verifies that paths continue from a head with its incoming direction."""
+    grid = Grid(((2, -1, -1), (-1, -1, -1), (-1, -1, 0)))
+    draw_path(grid, ((0, 0), (0, 1)))
+    assert list(enumerate_paths(grid, grid[0][1])) == [(2, 5, 8)]
+    # Test that closed points are avoided
+    grid[0][1].child = grid[1][1]
+    assert not list(enumerate_paths(grid, grid[1][1]))
+
+
+@pytest.mark.parametrize(
+    ("primary_count", "rows", "selection"),
+    (
+        # Knuth's example from "Dancing Links"
+        (
+            7,
+            ((2, 4, 5), (0, 3, 6), (1, 2, 5), (0, 3), (1, 6), (3, 4, 6)),
+            [3, 0, 4],
+        ),
+        # Secondary columns need not be covered, but may only be covered once
+        (2, ((0, 2), (1, 2), (1,)), [0, 2]),
+        (2, ((0, 2), (1, 2)), None),
+        (1, (), None),
+        (0, (), []),
+    ),
+)
+def test_find_exact_cover_returns_first_exact_cover(primary_count, rows, selection):
+    """Verifies that Algorithm X finds an exact cover whenever one exists."""
+    assert find_exact_cover(primary_count, rows) == selection
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_exact_cover_with_solvable_example_finds_solution_at_once(grid, grid_class):
+    """
+    Verifies that the exact_cover algorithm finds the same solution to each provided
+    puzzle as the iterative algorithm, notifying observers of it only once.
+    """
+    exact_cover_search = record_search(exact_cover, grid(grid_class))
+    assert exact_cover_search == record_search(iterative, grid())[-1:]
@@ -1,9 +1,21 @@
 """All unit tests for the gaslines grid module."""
 
 
+import pickle
+
 import pytest
 
-from gaslines.grid import Grid
+from gaslines.grid import (
+    HEADER,
+    MAGIC,
+    VERSION,
+    ChildChange,
+    Grid,
+    get_adjacency,
+    get_layout_key,
+    get_zobrist_keys,
+)
+from gaslines.utility import Direction
 from tests.utility import draw_path
 
 
@@ -75,6 +87,51 @@ def test_subscripting_returns_correct_points():
         assert point.is_source()
 
 
+def test_adjacency_returns_neighbor_indexes_in_direction_order():
+    """Verifies that the adjacency table lists the expected neighbors of each point."""
+    assert get_adjacency(2, 3) == (
+        (None, 1, 3, None),
+        (None, 2, 4, 0),
+        (None, None, 5, 1),
+        (0, 4, None, None),
+        (1, 5, None, 3),
+        (2, None, None, 4),
+    )
+
+
+def test_adjacency_with_same_shape_is_shared_between_grids():
+    """Verifies that grids of the same shape share a single adjacency table."""
+    assert get_adjacency(4, 5) is get_adjacency(4, 5)
+    first_grid = Grid(((1, -1), (-1, 0)))
+    second_grid = Grid(((-1, 0), (1, -1)))
+    # Test that each grid links its own points according to the shared table
+    assert first_grid[0][0].get_neighbors() == (first_grid[0][1], first_grid[1][0])
+    assert second_grid[0][0].get_neighbors() == (second_grid[0][1], second_grid[1][0])
+
+
+def test_heads_with_mutations_returns_heads_in_row_major_order():
+    """Verifies that the grid keeps track of its heads as its points are mutated."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    assert grid.heads == (grid[0][0], grid[1][1])
+    assert grid.get_head() is grid[0][0]
+    # Test that the head of a path moves along with the path
+    draw_path(grid, ((1, 1), (1, 2), (0, 2)))
+    assert grid.heads == (grid[0][0], grid[0][2])
+    # Test that a path reaching a sink no longer has a head
+    draw_path(grid, ((0, 0), (1, 0), (2, 0)))
+    assert grid.heads == (grid[0][2],)
+    assert grid.has_head()
+    # Test that undoing the end of a path restores its former head
+    grid[1][2].child = None
+    assert grid.heads == (grid[1][2],)
+    grid[1][2].child = grid[2][2]
+    grid[2][2].child = grid[2][1]
+    grid[2][1].child = grid[2][0]
+    assert not grid.heads
+    assert not grid.has_head()
+    assert grid.get_head() is None
+
+
 def test_str_with_empty_board_returns_correct_string():
     """Verifies that the string representation of an unsolved grid is correct."""
     grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
@@ -107,3 +164,219 @@ def test_observability_with_point_mutations_notifies_observers():
         # Mutating the point's child field should indeed notify observers
         point.child = None
         assert incrementor.count == i
+
+
+def test_observability_without_observers_skips_notification(monkeypatch):
+    """Verifies that mutating the points of an unobserved grid notifies nobody."""
+    grid = Grid(((1, -1), (-1, 0)))
+
+    def fail(_grid):
+        pytest.fail("An unobserved grid should not dispatch notifications")
+
+    monkeypatch.setattr(Grid, "notify", fail)
+    draw_path(grid, ((0, 0), (0, 1), (1, 1)))
+    grid[0][1].child = None
+
+
+def test_batch_updates_with_point_mutations_notifies_observers_once():
+    """Verifies that mutations made within a batch result in a single notification."""
+    grid = Grid(((1, -1), (-1, 0)))
+    incrementor = Incrementor()
+    grid.register(incrementor.increment)
+    with grid.batch_updates():
+        draw_path(grid, ((0, 0), (0, 1), (1, 1)))
+        # Test that nested batches defer notification to the outermost batch
+        with grid.batch_updates():
+            grid[0][1].child = None
+        assert incrementor.count == 0
+    assert incrementor.count == 1
+    # Test that a batch without mutations results in no notification
+    with grid.batch_updates():
+        pass
+    assert incrementor.count == 1
+
+
+def test_apply_moves_with_moves_notifies_observers_once():
+    """Verifies that moves given by row-major indexes are applied as one batch."""
+    grid = Grid(((1, -1), (-1, 0)))
+    incrementor = Incrementor()
+    grid.register(incrementor.increment)
+    grid.apply_moves(((0, 1), (1, 3)))
+    assert incrementor.count == 1
+    assert grid[0][0].child is grid[0][1]
+    assert grid[0][1].child is grid[1][1]
+    assert not grid.has_head()
+
+
+def test_subscribe_with_point_mutations_publishes_changes():
+    """Verifies that grids publish each point mutation to their subscribers."""
+    grid = Grid(((1, -1), (-1, 0)))
+    changes = []
+    grid.subscribe(changes.append)
+    # Test that observers continue to be notified alongside subscribers
+    incrementor = Incrementor()
+    grid.register(incrementor.increment)
+    source, pipe, sink = grid[0][0], grid[0][1], grid[1][1]
+    with grid.batch_updates():
+        draw_path(grid, ((0, 0), (0, 1), (1, 1)))
+        source.child = grid[1][0]
+    assert changes == [
+        ChildChange(source, None, pipe, 1),
+        ChildChange(pipe, None, sink, 2),
+        ChildChange(source, pipe, grid[1][0], 3),
+    ]
+    assert incrementor.count == 1
+
+
+def test_zobrist_hash_with_point_mutations_identifies_states():
+    """Verifies that the Zobrist hash depends only on the current state of the grid."""
+    grid = Grid(((2, -1, -1), (-1, -1, -1), (1, -1, 0)))
+    initial_hash = grid.zobrist_hash
+    draw_path(grid, ((0, 0), (0, 1), (0, 2)))
+    first_hash = grid.zobrist_hash
+    draw_path(grid, ((2, 0), (2, 1)))
+    # Test that the same state reached in a different order has the same hash
+    other_grid = Grid(((2, -1, -1), (-1, -1, -1), (1, -1, 0)))
+    draw_path(other_grid, ((2, 0), (2, 1)))
+    draw_path(other_grid, ((0, 0), (0, 1), (0, 2)))
+    assert grid.zobrist_hash == other_grid.zobrist_hash != first_hash
+    # Test that undoing moves restores the previous hash
+    grid[2][0].child = None
+    assert grid.zobrist_hash == first_hash
+    grid[0][1].child = grid[1][1]
+    assert grid.zobrist_hash not in (initial_hash, first_hash)
+
+
+def test_zobrist_hash_with_same_shape_uses_same_keys():
+    """Verifies that the Zobrist hash of a state is computed the same in any grid."""
+    grid = Grid(((1, -1), (-1, 0)))
+    draw_path(grid, ((0, 0), (0, 1)))
+    layout_key = get_layout_key(bytes((1, 255, 255, 0)))
+    assert grid.zobrist_hash == layout_key ^ get_zobrist_keys(2, 2)[0][1]
+    assert get_zobrist_keys(2, 2) is get_zobrist_keys(2, 2)
+
+
+def test_zobrist_hash_with_different_layouts_differs():
+    """Verifies that the same links in puzzles of the same shape hash differently."""
+    grid = Grid(((1, -1), (-1, 0)))
+    other_grid = Grid(((2, -1), (-1, 0)))
+    assert grid.zobrist_hash != other_grid.zobrist_hash
+    draw_path(grid, ((0, 0), (0, 1)))
+    draw_path(other_grid, ((0, 0), (0, 1)))
+    assert grid.zobrist_hash != other_grid.zobrist_hash
+
+
+def test_zobrist_hash_is_only_tracked_once_requested():
+    """Verifies that the Zobrist hash is computed in full when first requested."""
+    grid = Grid(((2, -1, -1), (-1, -1, -1), (1, -1, 0)))
+    other_grid = Grid(((2, -1, -1), (-1, -1, -1), (1, -1, 0)))
+    assert other_grid.zobrist_hash
+    draw_path(grid, ((0, 0), (0, 1), (0, 2)))
+    draw_path(other_grid, ((0, 0), (0, 1), (0, 2)))
+    # Test that the hash of the grid is indexed from the state it was first read in
+    assert grid.zobrist_hash == other_grid.zobrist_hash
+
+
+def test_to_bytes_with_path_returns_compact_representation():
+    """Verifies that grids are represented by their types and child directions."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2), (1, 2)))
+    data = grid.to_bytes()
+    # Test the header, types and (packed) child directions in turn
+    assert data[:7] == b"GL\x01\x03\x00\x03\x00"
+    assert data[7:16] == bytes((3, 255, 255, 255, 2, 255, 0, 255, 255))
+    assert data[16:] == bytes((0x22, 0x03, 0x00, 0x00, 0x00))
+
+
+def test_from_bytes_recreates_equal_grid():
+    """Verifies that grids are recreated from their representations in full."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0)))
+    draw_path(grid, ((1, 1), (1, 0), (2, 0)))
+    other_grid = Grid.from_bytes(grid.to_bytes())
+    assert str(other_grid) == str(grid) == GRID_STRING_2
+    assert not other_grid.heads
+    assert other_grid.zobrist_hash == grid.zobrist_hash
+    assert other_grid[2][1].remaining_segments == 1
+
+
+def test_describe_disregards_paths_on_grid():
+    """Verifies that grids are described as they were originally created."""
+    description = ((3, -1, -1), (-1, 2, -1), (0, -1, -1))
+    grid = Grid(description)
+    draw_path(grid, ((0, 0), (0, 1), (0, 2)))
+    assert grid.describe() == description
+    assert [point.type for point in grid.points] == [3, -1, -1, -1, 2, -1, 0, -1, -1]
+
+
+def test_rebuild_recreates_grid_from_links():
+    """Verifies that grids are rebuilt from their descriptions and links."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2), (1, 2)))
+    assert grid.get_links() == ((0, 1), (1, 2), (2, 5))
+    other_grid = Grid.rebuild(grid.describe(), grid.get_links())
+    assert str(other_grid) == str(grid)
+    assert [head.location for head in other_grid.heads] == [(1, 1), (1, 2)]
+
+
+def test_from_bytes_with_invalid_data_raises_value_error():
+    """Verifies that data of another format or of the wrong size is rejected."""
+    data = Grid(((2, -1), (0, 0))).to_bytes()
+    for invalid_data, message in (
+        (b"XX" + data[2:], "supported version"),
+        (data[:2] + b"\x02" + data[3:], "supported version"),
+        (data[:-1], "dimensions"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            Grid.from_bytes(invalid_data)
+
+
+def test_from_bytes_with_empty_grid_raises_value_error():
+    """Verifies that data describing a grid without any points is rejected."""
+    for invalid_data in (
+        HEADER.pack(MAGIC, VERSION, 0, 2),
+        HEADER.pack(MAGIC, VERSION, 2, 0),
+    ):
+        with pytest.raises(ValueError, match="any points"):
+            Grid.from_bytes(invalid_data)
+
+
+def test_from_bytes_with_invalid_type_raises_value_error():
+    """Verifies that data holding a point of an unknown type is rejected."""
+    data = bytearray(Grid(((2, -1), (0, 0))).to_bytes())
+    data[HEADER.size + 1] = 0xFE
+    with pytest.raises(ValueError, match="unknown type"):
+        Grid.from_bytes(data)
+
+
+def test_from_bytes_with_invalid_direction_raises_value_error():
+    """Verifies that data holding a link in an unknown direction is rejected."""
+    data = bytearray(Grid(((2, -1), (0, 0))).to_bytes())
+    data[HEADER.size + 4] = 0x05
+    with pytest.raises(ValueError, match="unknown direction"):
+        Grid.from_bytes(data)
+
+
+def test_from_bytes_with_link_off_grid_raises_value_error():
+    """Verifies that data holding a link that leads off the grid is rejected."""
+    data = bytearray(Grid(((2, -1), (0, 0))).to_bytes())
+    # Test every direction that leads off the grid from its top left corner
+    for direction in (Direction.NORTH, Direction.WEST):
+        data[HEADER.size + 4] = list(Direction).index(direction) + 1
+        with pytest.raises(ValueError, match="off the grid"):
+            Grid.from_bytes(data)
+
+
+def test_pickle_with_observers_skips_observers():
+    """Verifies that grids are pickled by way of their compact representations."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(grid, ((0, 0), (0, 1)))
+    # Observers such as closures cannot be pickled themselves
+    grid.register(lambda: None)
+    grid.subscribe(lambda change: None)
+    other_grid = pickle.loads(pickle.dumps(grid))
+    assert str(other_grid) == str(grid)
+    assert other_grid.heads == (other_grid[0][1], other_grid[1][1])
+    # Test that the unpickled grid has neither observers nor subscribers
+    other_grid[0][1].child = other_grid[0][2]
+    assert other_grid.heads == (other_grid[0][2], other_grid[1][1])
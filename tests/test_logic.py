@@ -1,9 +1,15 @@
 """All unit tests for the gaslines logic module."""
 
+import functools
 import itertools
+import sys
 
 import pytest
 
+from gaslines.backjumping import backjumping
+from gaslines.bitboard import bitboard
+from gaslines.bounds import bounded, feasible
+from gaslines.exact_cover import exact_cover
 from gaslines.grid import Grid
 from gaslines.logic import (
     full_recursive,
@@ -11,14 +17,57 @@ from gaslines.logic import (
     get_next,
     has_head,
     is_option,
+    iterative,
     partial_recursive,
 )
-from tests.utility import draw_path
+from gaslines.ordering import ordered
+from gaslines.parallel import parallel
+from gaslines.propagation import propagating
+from gaslines.reachability import reachable
+from gaslines.sat import sat
+from gaslines.selection import most_constrained
+from gaslines.stealing import stealing
+from gaslines.transposition import transposing
+from tests.utility import draw_path, record_search
+
+
+# All strategies, each of which must solve every puzzle exactly as the others do
+STRATEGIES = (
+    full_recursive,
+    partial_recursive,
+    iterative,
+    bitboard,
+    functools.partial(bitboard, bounded=True),
+    bounded,
+    feasible,
+    reachable,
+    propagating,
+    most_constrained,
+    ordered,
+    transposing,
+    backjumping,
+    exact_cover,
+    sat,
+    functools.partial(parallel, jobs=2),
+    functools.partial(stealing, jobs=2),
+)
+# Strategies that prune the search of another, each paired with the strategy whose
+# solution it finds with no more mutations
+PRUNING_STRATEGIES = (
+    (bounded, iterative),
+    (feasible, bounded),
+    (reachable, iterative),
+    (propagating, iterative),
+    (ordered, iterative),
+)
 
 
-def small_solvable_grid():
-    """Test fixture that creates a small and simple solvable Gas Lines puzzle."""
-    return Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+def small_solvable_grid(grid_class=Grid):
+    """
+    Test fixture that creates a small and simple solvable Gas Lines puzzle, as an
+    instance of the given grid class.
+    """
+    return grid_class(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
 
 
 def small_solvable_grid_solution_child_locations():
@@ -33,10 +82,13 @@ def small_solvable_grid_solution_child_locations():
     )
 
 
-def july_12_grid():
-    """Test fixture that creates the July 12 Gas Lines puzzle."""
+def july_12_grid(grid_class=Grid):
+    """
+    Test fixture that creates the July 12 Gas Lines puzzle, as an instance of the
+    given grid class.
+    """
     # Real NYT Magazine Gas Lines puzzle from the July 12, 2020 issue
-    return Grid(
+    return grid_class(
         (
             (3, 3, -1, 6, -1, -1, 2),
             (-1, -1, -1, -1, -1, -1, -1),
@@ -65,10 +117,13 @@ def july_12_grid_solution_child_locations():
     )
 
 
-def august_9_grid():
-    """Test fixture that creates the August 9 Gas Lines puzzle."""
+def august_9_grid(grid_class=Grid):
+    """
+    Test fixture that creates the August 9 Gas Lines puzzle, as an instance of the
+    given grid class.
+    """
     # Real NYT Magazine Gas Lines puzzle from the August 9, 2020 issue
-    return Grid(
+    return grid_class(
         (
             (2, -1, 0, -1, 2, -1, -1),
             (-1, 4, -1, -1, -1, -1, 4),
@@ -296,7 +351,7 @@ def test_get_next_with_last_child_returns_none():
     assert get_next(grid[1][1]) is None
 
 
-@pytest.mark.parametrize("strategy", (full_recursive, partial_recursive))
+@pytest.mark.parametrize("strategy", STRATEGIES)
 def test_algorithm_with_trivial_example_solves_grid(strategy):
     """Verifies that each algorithm is able to solve a trivial Gas Lines puzzle."""
     grid = Grid(((1, 0),))
@@ -304,7 +359,7 @@ def test_algorithm_with_trivial_example_solves_grid(strategy):
     assert grid[0][0].child.location == (0, 1)
 
 
-@pytest.mark.parametrize("strategy", (full_recursive, partial_recursive))
+@pytest.mark.parametrize("strategy", STRATEGIES)
 def test_algorithm_with_unsolvable_example_returns_false(strategy):
     """Verifies that each algorithm returns false for an unsolvable puzzle."""
     grid = Grid(((2, -1, -1), (-1, -1, -1), (-1, -1, -1)))
@@ -353,7 +408,7 @@ def zip_points_and_children(grid, child_locations):
     return zip(points, children)
 
 
-@pytest.mark.parametrize("strategy", (full_recursive, partial_recursive))
+@pytest.mark.parametrize("strategy", STRATEGIES)
 @pytest.mark.parametrize(
     ("grid", "expected_child_locations"),
     (
@@ -380,3 +435,43 @@ def test_algorithm_with_solvable_example_solves_grid(
         expected_child_locations,
     ):
         assert point.child is expected_child
+
+
+def test_iterative_with_many_moves_does_not_exceed_recursion_limit():
+    """
+    Verifies that the iterative algorithm solves a puzzle requiring more moves than
+    the recursion limit allows the fully recursive algorithm to make.
+    """
+    length = sys.getrecursionlimit() + 100
+    grid = Grid(((1,) * length, (0,) * length))
+    with pytest.raises(RecursionError):
+        full_recursive(grid)
+    grid = Grid(((1,) * length, (0,) * length))
+    assert iterative(grid)
+    for source, sink in zip(*grid):
+        assert source.child is sink
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+def test_iterative_with_solvable_example_mirrors_full_recursive_search(grid):
+    """
+    Verifies that the iterative algorithm mutates each provided puzzle in exactly the
+    same order as the fully recursive algorithm.
+    """
+    full_search = record_search(full_recursive, grid())
+    assert record_search(iterative, grid()) == full_search
+
+
+@pytest.mark.parametrize(("strategy", "baseline"), PRUNING_STRATEGIES)
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+def test_algorithm_with_solvable_example_mutates_no_more_than_baseline(
+    strategy,
+    baseline,
+    grid,
+):
+    """
+    Verifies that each pruning algorithm, which finds the same solution to each
+    provided puzzle as its baseline algorithm, makes no more mutations to do so.
+    """
+    search = record_search(strategy, grid())
+    assert len(search) <= len(record_search(baseline, grid()))
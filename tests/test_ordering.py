@@ -0,0 +1,77 @@
+"""All unit tests for the gaslines ordering module."""
+
+
+import functools
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.bounds import get_segment_bounds
+from gaslines.grid import Grid
+from gaslines.logic import iterative
+from gaslines.ordering import order_by_slack
+from gaslines.propagation import propagating
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import draw_path, record_search
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_order_by_slack_puts_most_promising_neighbors_first(grid_class):
+    """Verifies that neighbors are ordered by slack and then by straightness."""
+    grid = grid_class(((-1, -1, -1), (-1, 3, -1), (-1, -1, 0)))
+    bounds = get_segment_bounds(grid)
+    current = grid[1][1]
+    # Test that moves towards the sink, which would leave segments to spare, come last
+    ordered_neighbors = order_by_slack(bounds, current, current.get_neighbors())
+    assert [neighbor.location for neighbor in ordered_neighbors] == [
+        (0, 1),
+        (1, 0),
+        (1, 2),
+        (2, 1),
+    ]
+    draw_path(grid, ((1, 1), (1, 2)))
+    current = grid[1][2]
+    # Test that, with equal slack, continuing straight comes before turning
+    ordered_neighbors = order_by_slack(bounds, current, current.get_neighbors())
+    assert [neighbor.location for neighbor in ordered_neighbors] == [
+        (2, 2),
+        (0, 2),
+        (1, 1),
+    ]
+
+
+def test_order_by_slack_is_stable_across_retries():
+    """Verifies that the order of neighbors does not change as they are tried."""
+    grid = Grid(((-1, -1, -1), (-1, 3, -1), (-1, -1, 0)))
+    bounds = get_segment_bounds(grid)
+    current = grid[1][1]
+    orders = set()
+    for neighbor in current.get_neighbors():
+        current.child = neighbor
+        orders.add(order_by_slack(bounds, current, current.get_neighbors()))
+    assert len(orders) == 1
+
+
+def test_iterative_with_order_tries_neighbors_in_order():
+    """Verifies that the iterative algorithm tries neighbors in the order given."""
+    grid = Grid(((2, -1), (-1, 0)))
+    search = record_search(
+        functools.partial(iterative, order=lambda current, neighbors: neighbors[::-1]),
+        grid,
+    )
+    # Test that the source first moves south, the last of its neighbors by direction
+    assert grid[0][0].child == grid[1][0]
+    assert len(search) == 2
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+def test_propagating_with_order_finds_same_solution(grid):
+    """
+    Verifies that the propagating algorithm, given the slack ordering, finds the same
+    solution to each provided puzzle as the iterative algorithm.
+    """
+    iterative_search = record_search(iterative, grid())
+    propagating_grid = grid()
+    order = functools.partial(order_by_slack, get_segment_bounds(propagating_grid))
+    assert propagating(propagating_grid, order=order)
+    assert str(propagating_grid) == iterative_search[-1]
@@ -0,0 +1,107 @@
+"""All unit tests for the gaslines parallel module."""
+
+
+import multiprocessing
+
+import pytest
+
+from gaslines import parallel as parallel_module
+from gaslines.grid import Grid
+from gaslines.logic import iterative
+from gaslines.parallel import (
+    Cancelled,
+    get_cancellation_check,
+    initialize_worker,
+    parallel,
+    solve_subproblem,
+    split,
+)
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import draw_path, record_search
+
+
+def test_split_returns_subproblems_in_search_order():
+    """Verifies that subproblems are the nodes of the search tree at a given depth."""
+    grid = Grid(((2, -1, -1), (-1, -1, -1), (-1, -1, 0)))
+    subproblems = split(grid, 2)
+    assert subproblems == [
+        (((0, 1), (1, 2)), 2),
+        (((0, 1), (1, 4)), 4),
+        (((0, 3), (3, 4)), 4),
+        (((0, 3), (3, 6)), 6),
+    ]
+    # Test that the grid is restored to its original state
+    assert not any(point.has_child() for point in grid.points)
+    assert split(grid, 0) == [((), None)]
+
+
+def test_split_with_shallow_solution_stops_at_solution():
+    """Verifies that solved nodes above the given depth are subproblems as well."""
+    grid = Grid(((1, 0), (0, -1)))
+    assert split(grid, 3) == [(((0, 1),), 1), (((0, 2),), 2)]
+    assert not split(Grid(((2, 0),)), 3)
+
+
+def test_get_cancellation_check_raises_cancelled_once_event_is_set():
+    """Verifies that cancellation is checked once every given number of calls."""
+    cancellation = multiprocessing.Event()
+    check = get_cancellation_check(cancellation, interval=2)
+    check()
+    check()
+    cancellation.set()
+    check()
+    with pytest.raises(Cancelled):
+        check()
+
+
+def test_solve_subproblem_returns_links_of_solution(monkeypatch):
+    """Verifies that subproblems are rebuilt and then searched from their moves."""
+    description = ((2, -1, -1), (-1, -1, -1), (-1, -1, 0))
+    assert solve_subproblem(description, ((0, 1), (1, 4)), 4) is None
+    assert solve_subproblem(description, ((0, 1), (1, 2)), 2) == (
+        (0, 1),
+        (1, 2),
+        (2, 5),
+        (5, 8),
+    )
+    # Test that a cancelled search returns no solution
+    monkeypatch.setattr(parallel_module, "_cancellation", None)
+    cancellation = multiprocessing.Event()
+    cancellation.set()
+    initialize_worker(cancellation)
+    monkeypatch.setattr(parallel_module, "CANCELLATION_INTERVAL", 1)
+    assert solve_subproblem(description, ((0, 1),), 1) is None
+
+
+def test_parallel_without_subproblems_returns_false():
+    """Verifies that the parallel algorithm fails if no subproblem remains to search."""
+    grid = Grid(((2, 0),))
+    assert not parallel(grid, jobs=2)
+    assert not any(point.has_child() for point in grid.points)
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+@pytest.mark.parametrize("deterministic", (True, False))
+def test_parallel_with_solvable_example_finds_solution_at_once(grid, deterministic):
+    """
+    Verifies that the parallel algorithm, whether deterministic or not, finds the same
+    solution to each provided puzzle as the iterative algorithm, notifying observers
+    of it only once.
+    """
+    parallel_search = record_search(
+        lambda grid: parallel(grid, jobs=2, depth=4, deterministic=deterministic),
+        grid(),
+    )
+    assert parallel_search == record_search(iterative, grid())[-1:]
+
+
+def test_parallel_with_partial_solution_keeps_existing_links():
+    """Verifies that the parallel algorithm extends the paths already on the grid."""
+    grid = small_solvable_grid()
+    draw_path(grid, ((0, 0), (0, 1)))
+    assert parallel(grid, jobs=2, depth=1)
+    assert str(grid) == record_search(iterative, small_solvable_grid())[-1]
+    grid = small_solvable_grid()
+    draw_path(grid, ((0, 0), (1, 0)))
+    assert not parallel(grid, jobs=2, depth=1)
+    assert grid[0][0].child == grid[1][0]
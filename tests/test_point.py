@@ -1,6 +1,8 @@
 """All unit tests for the gaslines point module."""
 
 
+import sys
+
 import pytest
 
 from gaslines.grid import Grid
@@ -169,6 +171,36 @@ def test_parent_with_sink_returns_none():
     assert sink.parent is None
 
 
+def test_parent_with_child_reset_returns_none():
+    """Verifies that a point no longer reports a parent once its parent is reset."""
+    grid = Grid(((2, -1), (-1, 0)))
+    source, east_pipe, south_pipe = grid[0][0], grid[0][1], grid[1][0]
+    source.child = east_pipe
+    # Test that changing the child of a parent updates both former and new children
+    source.child = south_pipe
+    assert east_pipe.parent is None
+    assert south_pipe.parent is source
+    # Test that resetting the child of a parent updates its former child
+    source.child = None
+    assert south_pipe.parent is None
+
+
+def test_parents_with_sink_returns_all_parents():
+    """Verifies that the parents of a sink include every point with it as a child."""
+    grid = Grid(((2, -1), (1, 0)))
+    sink = grid[1][1]
+    assert sink.parents == frozenset()
+    grid[0][0].child = grid[0][1]
+    grid[0][1].child = sink
+    grid[1][0].child = sink
+    assert sink.parents == {grid[0][1], grid[1][0]}
+    # Test that resetting the child of one parent leaves the other
+    grid[1][0].child = None
+    assert sink.parents == {grid[0][1]}
+    # Test that the parents of a pipe comprise its sole parent
+    assert grid[0][1].parents == {grid[0][0]}
+
+
 def test_is_open_with_source_returns_false():
     """Verifies that a source point never reports that it is open."""
     grid = Grid(((2, -1), (1, 0)))
@@ -281,6 +313,43 @@ def test_remaining_segments_with_new_segment_returns_change():
     assert grid[2][1].remaining_segments == 1
 
 
+def test_remaining_segments_with_path_drawn_out_of_order_returns_change():
+    """
+    Verifies that remaining segments are correct even when a path is connected to
+    its source only after the rest of the path has been drawn.
+    """
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(grid, ((0, 1), (0, 2), (1, 2), (2, 2)))
+    assert grid[2][2].remaining_segments is None
+    grid[0][0].child = grid[0][1]
+    assert grid[2][2].remaining_segments == 2
+    # Test that disconnecting the path from its source resets the rest of the path
+    grid[0][0].child = None
+    assert grid[2][2].remaining_segments is None
+
+
+def test_remaining_segments_with_long_path_does_not_recurse():
+    """Verifies that remaining segments of points on very long paths are available."""
+    length = sys.getrecursionlimit() + 100
+    grid = Grid(((1,) + (-1,) * length,))
+    draw_path(grid, ((0, j) for j in range(length + 1)))
+    assert grid[0][length].remaining_segments == 1
+
+
+def test_incoming_direction_returns_direction_from_parent():
+    """Verifies that the incoming direction of a point is from the point's parent."""
+    grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1)))
+    assert grid[0][0].incoming_direction is None
+    assert grid[0][1].incoming_direction is Direction.EAST
+    assert grid[1][2].incoming_direction is Direction.SOUTH
+    assert grid[2][1].incoming_direction is Direction.WEST
+    # Test that open points and sinks have no incoming direction
+    grid[2][1].child = grid[2][0]
+    assert grid[1][0].incoming_direction is None
+    assert grid[2][0].incoming_direction is None
+
+
 def test_has_relationship_with_no_relationship_returns_false():
     """Verifies that `has_relationship` returns false for two unrelated points."""
     grid = Grid(((3, -1, -1), (-1, 2, -1), (0, -1, -1)))
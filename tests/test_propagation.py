@@ -0,0 +1,62 @@
+"""All unit tests for the gaslines propagation module."""
+
+
+import functools
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.bounds import get_segment_bounds, is_within_bounds
+from gaslines.grid import Grid
+from gaslines.propagation import propagate, propagating, undo_moves
+from tests.test_logic import august_9_grid
+from tests.utility import draw_path
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_propagate_applies_forced_moves_until_none_remain(grid_class):
+    """Verifies that every chain of forced moves is followed to its end."""
+    grid = grid_class(((1, -1, 0),))
+    moves = propagate(grid)
+    assert [point.location for point in moves] == [(0, 0), (0, 1)]
+    assert not grid.has_head()
+    grid = grid_class(((2, -1, -1), (0, -1, -1)))
+    moves = propagate(grid)
+    # Test that propagation stops once every head has more than one option
+    assert [point.location for point in moves] == [(0, 0)]
+    assert grid.heads == (grid[0][1],)
+
+
+def test_propagate_with_head_without_options_undoes_all_moves():
+    """Verifies that propagation fails, undoing its moves, once a head is stuck."""
+    grid = Grid(((2, 0),))
+    assert propagate(grid) is None
+    # Test that the moves leading up to the stuck head are undone as well
+    grid = Grid(((1, -1, -1),))
+    assert propagate(grid) is None
+    assert not any(point.has_child() for point in grid.points)
+
+
+def test_undo_moves_resets_children_in_reverse_order():
+    """Verifies that undoing moves restores the grid to its prior state."""
+    grid = Grid(((3, -1, -1), (-1, -1, 0)))
+    draw_path(grid, ((0, 0), (0, 1), (0, 2)))
+    undo_moves([grid[0][0], grid[0][1]])
+    assert not any(point.has_child() for point in grid.points)
+    assert grid.heads == (grid[0][0],)
+
+
+def test_propagating_with_failed_initial_propagation_returns_false():
+    """Verifies that the propagating algorithm fails if a head starts stuck."""
+    grid = Grid(((2, 0),))
+    assert not propagating(grid)
+    assert not any(point.has_child() for point in grid.points)
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_propagating_with_stricter_option_solves_example(grid_class):
+    """Verifies that the propagating algorithm accepts a stricter predicate."""
+    grid = august_9_grid(grid_class)
+    option = functools.partial(is_within_bounds, get_segment_bounds(grid))
+    assert propagating(grid, option)
+    assert not grid.has_head()
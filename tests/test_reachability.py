@@ -0,0 +1,70 @@
+"""All unit tests for the gaslines reachability module."""
+
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.grid import Grid
+from gaslines.logic import iterative
+from gaslines.reachability import Reachability, find_witness
+from tests.test_logic import small_solvable_grid
+from tests.utility import draw_path
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_find_witness_returns_shortest_open_path_to_sink(grid_class):
+    """Verifies that witnesses are shortest paths of open points to a sink."""
+    grid = grid_class(((2, -1, -1), (-1, -1, -1), (-1, -1, 0)))
+    assert find_witness(grid, grid[0][0]) == (1, 2, 5, 8)
+    # Test that closed points are avoided
+    draw_path(grid, ((0, 0), (0, 1)))
+    assert find_witness(grid, grid[0][1]) == (2, 5, 8)
+    assert find_witness(grid, grid[0][0]) == (3, 4, 5, 8)
+
+
+def test_find_witness_with_walled_in_head_returns_none():
+    """Verifies that no witness exists for a head that cannot reach any sink."""
+    grid = Grid(((3, -1, -1), (-1, -1, -1), (-1, -1, 0)))
+    draw_path(grid, ((0, 0), (0, 1), (1, 1), (1, 0)))
+    # Test that the sink remains reachable around the drawn path
+    assert find_witness(grid, grid[1][0]) == (6, 7, 8)
+    grid = Grid(((3, -1, 2), (-1, -1, -1), (-1, -1, 0)))
+    draw_path(grid, ((0, 0), (1, 0), (1, 1), (0, 1)))
+    assert find_witness(grid, grid[0][1]) is None
+
+
+def test_reachability_with_walled_in_head_returns_true():
+    """Verifies that the pruning stage detects heads that can reach no sink."""
+    grid = Grid(((3, -1, 2), (-1, -1, -1), (-1, -1, 0)))
+    prune = Reachability()
+    assert not prune(grid, grid[0][0])
+    draw_path(grid, ((0, 0), (1, 0), (1, 1)))
+    assert not prune(grid, grid[1][0])
+    grid[1][1].child = grid[0][1]
+    # Test that the moved head is walled in by the other source and its own path
+    assert prune(grid, grid[1][1])
+    # Test that moving elsewhere instead makes the grid viable again
+    grid[1][1].child = grid[2][1]
+    assert not prune(grid, grid[1][1])
+
+
+def test_reachability_discards_only_witnesses_through_closed_point():
+    """Verifies that closing points on the witness of another head is detected."""
+    grid = Grid(((1, -1, -1), (-1, -1, -1), (0, -1, 2)))
+    prune = Reachability()
+    assert not prune(grid, grid[0][0])
+    draw_path(grid, ((2, 2), (1, 2), (1, 1)))
+    assert not prune(grid, grid[1][2])
+    # Test that witnesses away from the newly closed points remain valid
+    grid[1][1].child = grid[2][1]
+    assert not prune(grid, grid[1][1])
+    # Test that the "1" source is walled in once its only routes are closed
+    grid[1][1].child = grid[1][0]
+    assert prune(grid, grid[1][1])
+
+
+def test_iterative_with_prune_retracts_pruned_moves():
+    """Verifies that the iterative algorithm retracts every pruned move."""
+    grid = small_solvable_grid()
+    assert not iterative(grid, prune=lambda grid, point: True)
+    assert not any(point.has_child() for point in grid.points)
@@ -0,0 +1,195 @@
+"""All unit tests for the gaslines sat module."""
+
+
+import io
+import itertools
+import pathlib
+import stat
+import sys
+
+import pytest
+
+from gaslines import sat as sat_module
+from gaslines.array_grid import ArrayGrid
+from gaslines.grid import Grid
+from gaslines.logic import iterative
+from gaslines.sat import (
+    CDCLSolver,
+    encode,
+    get_luby,
+    read_dimacs_result,
+    sat,
+    solve_dimacs,
+    write_dimacs,
+)
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import draw_path, record_search
+
+
+# A stand-in for an installed SAT solver that uses the built-in solver instead
+FAKE_EXECUTABLE = f"""\
+#!{sys.executable}
+import sys
+sys.path.insert(0, {str(pathlib.Path(__file__).parent.parent)!r})
+from gaslines.sat import CDCLSolver
+lines = [line.split() for line in open(sys.argv[1]) if line.strip()]
+variable_count = int(lines[0][2])
+clauses = [[int(literal) for literal in line[:-1]] for line in lines[1:]]
+model = CDCLSolver(variable_count, clauses).solve()
+if model is None:
+    print("s UNSATISFIABLE")
+else:
+    print("s SATISFIABLE")
+    literals = [v if model[v] else -v for v in range(1, variable_count + 1)]
+    print("v", *literals, 0)
+"""
+
+
+def create_fake_executable(directory):
+    """
+    Test helper function that creates an executable that behaves like a SAT solver in
+    the given directory and returns its path.
+    """
+    path = directory / "fake-sat"
+    path.write_text(FAKE_EXECUTABLE)
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+def is_satisfied(model, clauses):
+    """Returns whether the given assignment satisfies every given clause."""
+    return all(
+        any(model[abs(literal)] == (literal > 0) for literal in clause)
+        for clause in clauses
+    )
+
+
+def test_get_luby_returns_luby_sequence():
+    """Verifies that the Luby sequence is generated correctly."""
+    assert [get_luby(index) for index in range(1, 16)] == [
+        1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8,
+    ]  # fmt: skip
+
+
+@pytest.mark.parametrize(
+    ("variable_count", "clauses", "is_satisfiable"),
+    (
+        (1, [[1]], True),
+        (1, [[1], [-1]], False),
+        (2, [[1, 2], [-1, 2], [1, -2]], True),
+        (2, [[1, 2], [-1, 2], [1, -2], [-1, -2]], False),
+        (3, [[1, -1], [2, 2, 3], [-2]], True),
+        (1, [[]], False),
+    ),
+)
+def test_cdcl_solver_with_small_formulas_decides_satisfiability(
+    variable_count,
+    clauses,
+    is_satisfiable,
+):
+    """Verifies that the built-in solver decides small formulas correctly."""
+    model = CDCLSolver(variable_count, clauses).solve()
+    assert (model is not None) == is_satisfiable
+    if model is not None:
+        assert is_satisfied(model, clauses)
+
+
+@pytest.mark.parametrize("pigeons", (3, 4, 5))
+def test_cdcl_solver_with_pigeonhole_formulas_returns_none(pigeons):
+    """Verifies that the built-in solver refutes formulas requiring many conflicts."""
+    holes = pigeons - 1
+
+    def variable(pigeon, hole):
+        return pigeon * holes + hole + 1
+
+    clauses = [
+        [variable(pigeon, hole) for hole in range(holes)] for pigeon in range(pigeons)
+    ]
+    for hole in range(holes):
+        for first, second in itertools.combinations(range(pigeons), 2):
+            clauses.append([-variable(first, hole), -variable(second, hole)])
+    assert CDCLSolver(pigeons * holes, clauses).solve() is None
+    # Test that removing a single pigeon makes the formula satisfiable
+    model = CDCLSolver(pigeons * holes, clauses[1:]).solve()
+    assert is_satisfied(model, clauses[1:])
+
+
+def test_encode_with_solved_grid_is_satisfied_by_its_links():
+    """Verifies that the links of a solved grid satisfy its encoding."""
+    grid = small_solvable_grid()
+    iterative(grid)
+    variable_count, clauses, links = encode(grid)
+    # Test that every link already present is required by a unit clause
+    link_variables = {link: variable for variable, link in links.items()}
+    for point in grid.points:
+        if point.has_child():
+            variable = link_variables[point.index, point.child.index]
+            assert [variable] in clauses
+    model = CDCLSolver(variable_count, clauses).solve()
+    assert {link for variable, link in links.items() if model[variable]} == {
+        (point.index, point.child.index) for point in grid.points if point.has_child()
+    }
+
+
+def test_write_dimacs_and_read_dimacs_result_use_dimacs_format():
+    """Verifies that formulas and results are written and read in DIMACS format."""
+    file = io.StringIO()
+    write_dimacs(file, 2, [[1, -2], [2]])
+    assert file.getvalue() == "p cnf 2 2\n1 -2 0\n2 0\n"
+    assert read_dimacs_result("c comment\ns SATISFIABLE\nv 1 -2\nv 0\n", 2) == [
+        False,
+        True,
+        False,
+    ]
+    assert read_dimacs_result("s UNSATISFIABLE\n", 2) is None
+    with pytest.raises(RuntimeError, match="reported no result"):
+        read_dimacs_result("s UNKNOWN\n", 2)
+
+
+def test_solve_dimacs_with_executable_returns_model(tmp_path):
+    """Verifies that installed SAT solvers are run on a DIMACS file."""
+    fake_executable = create_fake_executable(tmp_path)
+    assert solve_dimacs(fake_executable, 2, [[1, 2], [-1]]) == [False, False, True]
+    assert solve_dimacs(fake_executable, 1, [[1], [-1]]) is None
+
+
+def test_sat_with_executable_and_unsolvable_example_returns_false(
+    monkeypatch,
+    tmp_path,
+):
+    """Verifies that the sat algorithm fails as well with an installed SAT solver."""
+    fake_executable = create_fake_executable(tmp_path)
+    monkeypatch.setattr(sat_module, "find_executable", lambda: fake_executable)
+    grid = Grid(((2, -1, -1), (-1, -1, -1), (-1, -1, 0), (1, -1, -1)))
+    assert not sat(grid)
+    assert not any(point.has_child() for point in grid.points)
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_sat_with_solvable_example_finds_solution_at_once(
+    monkeypatch,
+    grid,
+    grid_class,
+):
+    """
+    Verifies that the sat algorithm finds the same solution to each provided puzzle
+    as the iterative algorithm, notifying observers of it only once.
+    """
+    monkeypatch.setattr(sat_module, "find_executable", lambda: None)
+    sat_search = record_search(sat, grid(grid_class))
+    assert sat_search == record_search(iterative, grid())[-1:]
+
+
+def test_sat_with_partial_solution_keeps_existing_links(tmp_path):
+    """Verifies that the sat algorithm extends the paths already on the grid."""
+    fake_executable = create_fake_executable(tmp_path)
+    grid = small_solvable_grid()
+    draw_path(grid, ((0, 0), (0, 1)))
+    assert sat(grid, fake_executable)
+    assert grid[0][0].child == grid[0][1]
+    assert str(grid) == record_search(iterative, small_solvable_grid())[-1]
+    # Test that a partial solution that cannot be completed is unsolvable
+    grid = small_solvable_grid()
+    draw_path(grid, ((0, 0), (1, 0)))
+    assert not sat(grid, fake_executable)
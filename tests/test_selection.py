@@ -0,0 +1,65 @@
+"""All unit tests for the gaslines selection module."""
+
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.grid import Grid
+from gaslines.propagation import propagating
+from gaslines.selection import (
+    count_options,
+    get_most_constrained_head,
+    most_constrained,
+)
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import record_search
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_count_options_counts_valid_neighbors(grid_class):
+    """Verifies that only neighbors worth considering as a child are counted."""
+    grid = grid_class(((2, -1, -1), (0, -1, -1)))
+    # Test that the sink, which would be reached with two segments, is not counted
+    assert count_options(grid[0][0]) == 1
+    assert count_options(grid[0][0], lambda current, neighbor: True) == 2
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_get_most_constrained_head_returns_head_with_fewest_options(grid_class):
+    """Verifies that the head with the fewest options is selected."""
+    grid = grid_class(((2, -1, -1), (-1, -1, 3), (-1, 0, 1)))
+    assert get_most_constrained_head(grid) == grid[2][2]
+    # Test that ties are broken in row-major order
+    assert get_most_constrained_head(grid, lambda current, neighbor: True) == (
+        grid[0][0]
+    )
+
+
+def test_get_most_constrained_head_without_head_returns_none():
+    """Verifies that no head is selected from a grid without heads."""
+    assert get_most_constrained_head(Grid(((-1, 0),))) is None
+
+
+def test_propagating_with_select_branches_on_selected_head():
+    """Verifies that the propagating algorithm branches on the heads selected."""
+    grid = august_9_grid()
+    selected_heads = []
+
+    def select(grid):
+        selected_heads.append(get_most_constrained_head(grid))
+        return selected_heads[-1]
+
+    assert propagating(grid, select=select)
+    assert selected_heads
+    assert all(head is not None for head in selected_heads)
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+def test_most_constrained_with_solvable_example_is_deterministic(grid):
+    """
+    Verifies that the most_constrained algorithm searches each provided puzzle in
+    the same way every time.
+    """
+    first_search = record_search(most_constrained, grid())
+    second_search = record_search(most_constrained, grid())
+    assert first_search == second_search
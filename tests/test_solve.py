@@ -1,11 +1,28 @@
 """All unit tests for the gaslines solve module."""
 
 
+import contextlib
+import pathlib
+import subprocess
+import sys
+import time
+
 import pytest
 
+from gaslines import solve as solve_module
+from gaslines.corpus import SharedCorpus
 from gaslines.grid import Grid
-from gaslines.logic import full_recursive, partial_recursive
-from gaslines.solve import solve
+from gaslines.logic import full_recursive, iterative, partial_recursive
+from gaslines.solve import (
+    Result,
+    attach_corpus,
+    get_deadline_check,
+    solve,
+    solve_before_deadline,
+    solve_corpus_puzzle,
+    solve_many,
+)
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
 from tests.utility import draw_path
 
 
@@ -39,6 +56,12 @@ def mock_strategy(grid):
     return True
 
 
+def sleeping_strategy(grid):
+    """Mock algorithm that searches for a long time without mutating the grid."""
+    time.sleep(60)
+    return grid.has_head()
+
+
 def test_solve_with_reveal_delay_deactivated_is_silent(capsys):
     """Verifies that `solve` prints nothing when reveal_delay is set to None."""
     grid = Grid(((2, -1), (0, 0)))
@@ -66,7 +89,10 @@ def test_solve_with_default_arguments_solves_grid_silently(capsys):
     assert capsys.readouterr().out == ""
 
 
-@pytest.mark.parametrize("strategy", (full_recursive, partial_recursive))
+@pytest.mark.parametrize(
+    "strategy",
+    (full_recursive, partial_recursive, iterative),
+)
 def test_solve_with_real_strategies_solves_grid(strategy):
     """Verifies that `solve` using real strategies solves a real grid."""
     grid = Grid(((2, -1), (0, 0)))
@@ -76,3 +102,155 @@ def test_solve_with_real_strategies_solves_grid(strategy):
     assert grid[0][1].child.location == (1, 1)
     assert grid[1][0].is_open()
     assert grid[1][1].is_open()
+
+
+def get_puzzles():
+    """Returns the descriptions of several puzzles, one of which is unsolvable."""
+    return [
+        grid().describe() for grid in (small_solvable_grid, july_12_grid, august_9_grid)
+    ] + [((2, -1, -1), (-1, -1, -1), (-1, -1, 0), (1, -1, -1))]
+
+
+def get_expected_results():
+    """Returns the results of solving the puzzles of `get_puzzles` one at a time."""
+    results = []
+    for index, description in enumerate(get_puzzles()):
+        grid = Grid(description)
+        solved = iterative(grid)
+        results.append(Result(index, solved, grid.get_links()))
+    return results
+
+
+@pytest.mark.parametrize("chunksize", (1, 3))
+@pytest.mark.parametrize("max_tasks_per_child", (1, None))
+@pytest.mark.parametrize("shared", (False, True))
+def test_solve_many_with_ordered_results_yields_in_order(
+    chunksize,
+    max_tasks_per_child,
+    shared,
+):
+    """Verifies that `solve_many` yields the results in the order of the puzzles."""
+    results = solve_many(
+        iter(get_puzzles()),
+        jobs=2,
+        chunksize=chunksize,
+        strategy=iterative,
+        max_tasks_per_child=max_tasks_per_child,
+        shared=shared,
+    )
+    assert list(results) == get_expected_results()
+
+
+@pytest.mark.parametrize("shared", (False, True))
+def test_solve_many_with_unordered_results_yields_every_result(shared):
+    """Verifies that `solve_many` yields every result when order does not matter."""
+    results = solve_many(
+        get_puzzles(),
+        jobs=2,
+        ordered=False,
+        strategy=iterative,
+        shared=shared,
+    )
+    assert sorted(results) == get_expected_results()
+
+
+@pytest.mark.parametrize("shared", (False, True))
+def test_solve_many_with_timeout_abandons_slow_searches(shared):
+    """Verifies that `solve_many` gives up on puzzles once their deadline passes."""
+    results = list(solve_many(get_puzzles(), jobs=2, timeout=0, shared=shared))
+    # Test that only the searches with too many mutations were abandoned
+    assert results[0] == get_expected_results()[0]
+    assert results[2] == Result(2, None, ())
+    assert results[3] == Result(3, False, ())
+
+
+@pytest.mark.parametrize("shared", (False, True))
+def test_solve_many_with_timeout_interrupts_silent_searches(shared):
+    """Verifies that searches that never mutate their grid are abandoned as well."""
+    start = time.monotonic()
+    results = list(
+        solve_many(
+            [((2, -1), (-1, 0))],
+            jobs=1,
+            strategy=sleeping_strategy,
+            timeout=0.1,
+            shared=shared,
+        ),
+    )
+    assert results == [Result(0, None, ())]
+    assert time.monotonic() - start < 30
+
+
+def test_solve_many_with_shared_corpus_leaks_no_memory():
+    """Verifies that every worker closes the shared corpus before it exits."""
+    code = (
+        "from gaslines.solve import solve_many; "
+        "puzzles = [((2, -1), (-1, 0))] * 4; "
+        "print(len(list(solve_many(puzzles, jobs=2, max_tasks_per_child=1, "
+        "shared=True))))"
+    )
+    process = subprocess.run(
+        (sys.executable, "-X", "dev", "-W", "always", "-c", code),
+        capture_output=True,
+        check=True,
+        cwd=pathlib.Path(__file__).parent.parent,
+        text=True,
+    )
+    assert process.stdout == "4\n"
+    assert "ResourceWarning" not in process.stderr
+    assert "resource_tracker" not in process.stderr
+
+
+def test_solve_before_deadline_with_late_alarm_keeps_result(monkeypatch):
+    """Verifies that an alarm going off once the search is done discards nothing."""
+
+    @contextlib.contextmanager
+    def late_alarm(_timeout):
+        yield
+        raise TimeoutError("The alarm went off late")
+
+    monkeypatch.setattr(solve_module, "set_alarm", late_alarm)
+    grid = small_solvable_grid()
+    assert solve_before_deadline(grid, iterative, 60)
+    assert not grid.has_head()
+
+    def interrupted_strategy(_grid):
+        raise TimeoutError("The search was interrupted")
+
+    # Test that a search that is interrupted is still abandoned
+    grid = small_solvable_grid()
+    assert solve_before_deadline(grid, interrupted_strategy, 60) is None
+
+
+def test_solve_corpus_puzzle_records_result_in_corpus(monkeypatch):
+    """Verifies that workers read puzzles from, and write results to, the corpus."""
+    corpus = SharedCorpus.create(get_puzzles())
+    monkeypatch.setattr(solve_module, "_corpus", None)
+    try:
+        attach_corpus(corpus.name)
+        assert solve_corpus_puzzle(iterative, None, 3) == 3
+        assert solve_corpus_puzzle(iterative, None, 0) == 0
+        assert corpus.get_result(3) == (False, None)
+        assert corpus.get_result(0)[0]
+        assert corpus.get_result(0)[1].get_links() == get_expected_results()[0].links
+        assert corpus.get_result(1) is None
+        solve_module._corpus.close()  # pylint: disable=W0212
+    finally:
+        corpus.close()
+        corpus.unlink()
+
+
+def test_get_deadline_check_raises_timeout_error_once_deadline_passes():
+    """Verifies that the deadline is checked once every given number of calls."""
+    check = get_deadline_check(time.monotonic() + 60, interval=2)
+    check()
+    check()
+    check = get_deadline_check(time.monotonic() - 1, interval=2)
+    check()
+    with pytest.raises(TimeoutError, match="deadline") as first_error:
+        check()
+    # Test that every check raises a new error, whose traceback does not accumulate
+    check()
+    with pytest.raises(TimeoutError, match="deadline") as second_error:
+        check()
+    assert second_error.value is not first_error.value
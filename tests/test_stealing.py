@@ -0,0 +1,99 @@
+"""All unit tests for the gaslines stealing module."""
+
+
+import multiprocessing
+import threading
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.grid import Grid
+from gaslines.logic import iterative
+from gaslines.stealing import Search, run_worker, stealing
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import draw_path, record_search
+
+
+DESCRIPTION = ((2, -1, -1), (-1, -1, -1), (-1, -1, 0))
+
+
+def test_search_donate_gives_away_oldest_untried_neighbors():
+    """Verifies that branches are given away from the bottom of the stack upwards."""
+    search = Search(DESCRIPTION, ((), None, 0))
+    assert search.run(3) is None
+    assert search.donate() == ((), 0, 1)
+    assert search.donate() == (((0, 1),), 1, 1)
+    assert search.donate() == (((0, 1), (1, 2)), 2, 1)
+    assert search.run(100)
+    assert search.grid.get_links() == ((0, 1), (1, 2), (2, 5), (5, 8))
+    # Test that each donated branch is searched from its own root only
+    assert Search(DESCRIPTION, ((), 0, 1)).run(100)
+    assert Search(DESCRIPTION, (((0, 1),), 1, 1)).run(100) is False
+
+
+def test_search_donate_with_exhausted_stack_returns_none():
+    """Verifies that nothing is given away once no untried neighbors remain."""
+    search = Search(DESCRIPTION, ((), None, 0))
+    assert search.donate() is None
+    search.run(3)
+    while search.donate() is not None:
+        pass
+    assert search.donate() is None
+
+
+def test_search_with_unsolvable_branch_restores_root():
+    """Verifies that an exhausted branch leaves its root as it was rebuilt."""
+    search = Search(((2, -1, -1), (-1, -1, -1), (-1, -1, 0), (1, -1, -1)), ((), 0, 0))
+    assert search.run(10000) is False
+    assert not any(point.has_child() for point in search.grid.points)
+
+
+def test_run_worker_answers_messages():
+    """Verifies that workers follow the protocol of the stealing algorithm."""
+    connection, worker_connection = multiprocessing.Pipe()
+    worker = threading.Thread(target=run_worker, args=(worker_connection,))
+    worker.start()
+    connection.send(("grid", DESCRIPTION))
+    connection.send(("steal",))
+    assert connection.recv() == ("branch", None)
+    connection.send(("work", (((0, 1),), 1, 1)))
+    assert connection.recv() == ("idle",)
+    connection.send(("work", ((), None, 0)))
+    assert connection.recv() == ("solution", ((0, 1), (1, 2), (2, 5), (5, 8)))
+    connection.send(("stop",))
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_stealing_with_dead_end_at_root_returns_false(grid_class):
+    """Verifies that the stealing algorithm fails if its first worker cannot move."""
+    grid = grid_class(((2, 0),))
+    assert not stealing(grid, jobs=2)
+    assert not any(point.has_child() for point in grid.points)
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+@pytest.mark.parametrize("address", (None, ("localhost", 0)))
+def test_stealing_with_solvable_example_finds_solution_at_once(grid, address):
+    """
+    Verifies that the stealing algorithm finds the (unique) solution to each provided
+    puzzle, over either transport, notifying observers of it only once.
+    """
+    stealing_search = record_search(
+        lambda grid: stealing(grid, jobs=3, address=address),
+        grid(),
+    )
+    assert stealing_search == record_search(iterative, grid())[-1:]
+
+
+def test_stealing_with_partial_solution_keeps_existing_links():
+    """Verifies that the stealing algorithm extends the paths already on the grid."""
+    grid = small_solvable_grid()
+    draw_path(grid, ((0, 0), (0, 1)))
+    assert stealing(grid, jobs=2)
+    assert str(grid) == record_search(iterative, small_solvable_grid())[-1]
+    grid = small_solvable_grid()
+    draw_path(grid, ((0, 0), (1, 0)))
+    assert not stealing(grid, jobs=2)
+    assert grid[0][0].child == grid[1][0]
@@ -0,0 +1,87 @@
+"""All unit tests for the gaslines transposition module."""
+
+
+import pytest
+
+from gaslines.array_grid import ArrayGrid
+from gaslines.grid import Grid
+from gaslines.logic import iterative
+from gaslines.transposition import TranspositionTable, transposing
+from tests.test_logic import august_9_grid, july_12_grid, small_solvable_grid
+from tests.utility import record_search
+
+
+@pytest.mark.parametrize(
+    ("capacity", "policy", "message"),
+    (
+        (0, "lru", "Capacity must be positive"),
+        (-1, "depth", "Capacity must be positive"),
+        (1, "fifo", "Unknown replacement policy"),
+    ),
+)
+def test_transposition_table_with_invalid_arguments_raises_value_error(
+    capacity,
+    policy,
+    message,
+):
+    """Verifies that tables cannot be created with invalid capacities or policies."""
+    with pytest.raises(ValueError, match=message):
+        TranspositionTable(capacity, policy)
+
+
+def test_transposition_table_with_lru_policy_evicts_least_recently_used():
+    """Verifies that the LRU policy evicts the least recently used entry."""
+    table = TranspositionTable(2, "lru")
+    table.add(1)
+    table.add(2)
+    # Test that finding an entry counts as using it
+    assert 1 in table
+    table.add(3)
+    assert 1 in table
+    assert 3 in table
+    assert 2 not in table
+    assert len(table) == table.capacity == 2
+
+
+def test_transposition_table_with_depth_policy_keeps_costliest_refutations():
+    """Verifies that the depth-preferred policy only replaces cheaper entries."""
+    table = TranspositionTable(4, "depth")
+    table.add(1, work=5)
+    # Test that hashes assigned the same slot replace only cheaper entries
+    table.add(5, work=3)
+    assert 1 in table
+    assert 5 not in table
+    table.add(5, work=5)
+    assert 5 in table
+    assert 1 not in table
+    table.add(2)
+    assert len(table) == 2
+    assert table.policy == "depth"
+
+
+@pytest.mark.parametrize("grid_class", (Grid, ArrayGrid))
+def test_transposing_with_unsolvable_example_records_refutation(grid_class):
+    """
+    Verifies that the transposing algorithm returns false for an unsolvable puzzle
+    and that a shared table then refutes the same puzzle without any search.
+    """
+    table = TranspositionTable()
+    grid = grid_class(((2, -1, -1), (-1, -1, -1), (-1, -1, 0), (1, -1, -1)))
+    assert not transposing(grid, table)
+    assert not any(point.has_child() for point in grid.points)
+    assert grid.zobrist_hash in table
+    other_grid = grid_class(((2, -1, -1), (-1, -1, -1), (-1, -1, 0), (1, -1, -1)))
+    assert not record_search(lambda grid: transposing(grid, table), other_grid)
+
+
+@pytest.mark.parametrize("grid", (small_solvable_grid, july_12_grid, august_9_grid))
+@pytest.mark.parametrize("policy", TranspositionTable.POLICIES)
+def test_transposing_with_solvable_example_finds_same_solution(grid, policy):
+    """
+    Verifies that the transposing algorithm finds the same solution to each provided
+    puzzle as the iterative algorithm, even with a tiny table.
+    """
+    solution = record_search(iterative, grid())[-1]
+    transposing_grid = grid()
+    assert transposing(transposing_grid, TranspositionTable(2, policy))
+    assert str(transposing_grid) == solution
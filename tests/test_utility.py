@@ -1,9 +1,16 @@
 """All unit tests for the gaslines utility module."""
 
 
+import functools
+
 import pytest
 
-from gaslines.utility import Direction, Observable, get_number_of_rows
+from gaslines.utility import (
+    Direction,
+    Observable,
+    get_number_of_rows,
+    get_periodic_check,
+)
 
 
 GRID_STRING = """\
@@ -95,6 +102,28 @@ def test_get_number_of_rows_with_input_string_returns_expected_number(
     assert get_number_of_rows(input_string) == expected_number
 
 
+def test_get_periodic_check_evaluates_predicate_once_every_interval():
+    """Verifies that the predicate is evaluated once every given number of calls."""
+    incrementor = Incrementor()
+
+    def predicate():
+        incrementor.increment()
+        return incrementor.count >= 2
+
+    check = get_periodic_check(predicate, functools.partial(ValueError, "Stopped"), 3)
+    for _ in range(5):
+        check()
+    assert incrementor.count == 1
+    with pytest.raises(ValueError, match="Stopped") as first_error:
+        check()
+    # Test that every raise creates a new exception
+    for _ in range(2):
+        check()
+    with pytest.raises(ValueError, match="Stopped") as second_error:
+        check()
+    assert second_error.value is not first_error.value
+
+
 @pytest.mark.parametrize(
     ("observable", "method"),
     (
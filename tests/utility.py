@@ -36,3 +36,21 @@ def draw_path(grid, path):
     points = (grid[i][j] for i, j in path)
     for current_point, next_point in pairwise(points):
         current_point.child = next_point
+
+
+def record_search(strategy, grid):
+    """
+    Test helper function that solves the provided grid with the provided strategy,
+    recording the state of the grid after every mutation along the way.
+
+    Args:
+        strategy (function): The algorithm with which to solve the grid.
+        grid (Grid): A Gas Lines grid.
+
+    Returns:
+        list: The string representation of each intermediate state of the grid.
+    """
+    states = []
+    grid.register(lambda: states.append(str(grid)))
+    strategy(grid)
+    return states